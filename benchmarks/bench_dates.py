@@ -0,0 +1,73 @@
+"""발행일 판별 마이크로벤치마크
+
+기존 is_today_article (항목마다 dateutil 파싱 + naive date.today() 비교)과
+core.dates 기반 새 경로(published_parsed → RFC 822 → dateutil, 문자열 메모이제이션)를 비교한다.
+
+실행: python -m benchmarks.bench_dates
+"""
+import time
+from datetime import date, datetime, timedelta, timezone
+from dateutil import parser
+
+from core import dates
+from core.collector import parse_pub_date
+
+
+def legacy_is_today_article(pub_date_str):
+    """변경 전 collector.is_today_article 구현"""
+    if not pub_date_str:
+        return True
+    try:
+        pub_date = parser.parse(pub_date_str).date()
+        return pub_date == date.today()
+    except (ValueError, TypeError):
+        return True
+
+
+def make_entries(feed_size=50, keywords=14):
+    """키워드 수만큼 같은 피드를 반복해서 읽는 상황을 흉내 낸 (문자열, parsed) 목록"""
+    now = datetime.now(timezone.utc)
+    entries = []
+    for index in range(feed_size):
+        published = now - timedelta(minutes=37 * index)
+        entries.append((
+            published.strftime("%a, %d %b %Y %H:%M:%S GMT"),
+            list(published.timetuple()[:6])
+        ))
+    return entries * keywords
+
+
+def bench(label, func, entries, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for value, parsed in entries:
+            func(value, parsed)
+        best = min(best, time.perf_counter() - start)
+    print(f"{label:<40} {best * 1000:9.2f} ms  ({best / len(entries) * 1e6:6.2f} us/entry)")
+    return best
+
+
+def main():
+    entries = make_entries()
+    print(f"항목 수: {len(entries)} (피드 50개 항목 x 키워드 14개)")
+
+    legacy = bench("legacy dateutil + date.today()", lambda value, parsed: legacy_is_today_article(value), entries)
+
+    def new_string_path(value, parsed):
+        published = parse_pub_date(value)
+        return published is None or dates.is_today(published)
+
+    def new_parsed_path(value, parsed):
+        published = parse_pub_date(value, parsed)
+        return published is None or dates.is_today(published)
+
+    dates.parse_date_string.cache_clear()
+    string_path = bench("new: 문자열 (RFC 822 + 캐시)", new_string_path, entries)
+    parsed_path = bench("new: published_parsed", new_parsed_path, entries)
+
+    print(f"속도 향상: 문자열 경로 x{legacy / string_path:.1f}, published_parsed 경로 x{legacy / parsed_path:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""피드 파싱 벤치마크
+
+스텁 서버(benchmarks/stubs.py)와 같은 방식으로 만든 RSS 피드 여러 개를 수집 스레드처럼
+여러 스레드에서 동시에 parse_feed()로 파싱하며, 작업 프로세스 수(0이면 현재 프로세스)별 시간을 비교한다.
+작업 프로세스를 띄우는 시간은 빼고 잰다 (작업당 한 번만 듦).
+
+실행: python -m benchmarks.bench_feed_parsing [--feeds 48] [--feed-size 100] [--workers 0,1,2,4]
+"""
+import os
+import time
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.stubs import NewsStubServer
+from core.http_cache import configure_feed_parsing, shutdown_feed_parsing, parse_feed
+
+
+def make_feeds(count, feed_size):
+    stub = NewsStubServer(feed_size=feed_size, keywords=[f"topic{n:04d}" for n in range(200)])
+    try:
+        return [stub.bbc_rss(number).encode() for number in range(count)]
+    finally:
+        stub.server_close()
+
+
+def bench(workers, feeds, threads, repeat=3):
+    configure_feed_parsing(workers)
+    try:
+        parse_feed(feeds[0])  # 작업 프로세스와 feedparser import를 미리 준비
+        best = float("inf")
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            for _ in range(repeat):
+                start = time.perf_counter()
+                entries = sum(len(result) for result in executor.map(parse_feed, feeds))
+                best = min(best, time.perf_counter() - start)
+        return best, entries
+    finally:
+        shutdown_feed_parsing()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="피드 파싱 벤치마크")
+    parser.add_argument("--feeds", type=int, default=48, help="피드 수")
+    parser.add_argument("--feed-size", type=int, default=100, help="피드당 기사 수")
+    parser.add_argument("--threads", type=int, default=12, help="파싱을 요청하는 수집 스레드 수")
+    parser.add_argument("--workers", default="0,1,2,4", help="비교할 작업 프로세스 수 목록")
+    args = parser.parse_args()
+
+    feeds = make_feeds(args.feeds, args.feed_size)
+    size_kb = sum(map(len, feeds)) / 1024
+    print(f"피드 {len(feeds)}개, 기사 {args.feeds * args.feed_size}건, {size_kb:.0f} KB, CPU {os.cpu_count()}개")
+    baseline = None
+    for workers in (int(value) for value in args.workers.split(",") if value):
+        seconds, entries = bench(workers, feeds, args.threads)
+        baseline = baseline or seconds
+        label = "현재 프로세스" if workers == 0 else f"작업 프로세스 {workers}개"
+        print(f"{label:<20} {seconds * 1000:9.1f} ms  ({entries}건, x{baseline / seconds:.2f})")
+
+
+if __name__ == "__main__":
+    main()
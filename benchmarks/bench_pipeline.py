@@ -0,0 +1,160 @@
+"""오프라인 전체 작업 벤치마크
+
+네이버/구글/BBC/OpenAI를 흉내 내는 로컬 스텁 서버와 SMTP 싱크(benchmarks/stubs.py)를 띄우고,
+키워드 수를 바꿔 가며 scripts/run_agent.py의 job()을 처음부터 끝까지 실행한다.
+각 실행은 새 하위 프로세스에서 빈 캐시/발송 기록으로 시작하며, 벽시계 시간, 최대 RSS,
+실행 보고서(core.metrics)의 구간별 소요 시간과 주요 카운터를 출력한다.
+구간 시간은 스레드별 시간을 더한 값이라 벽시계 시간보다 클 수 있다.
+
+실행: python -m benchmarks.bench_pipeline [--scales 14,100,1000] [--latency 0.05] [--error-rate 0.01]
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import resource
+import tempfile
+import subprocess
+
+from benchmarks.stubs import NewsStubServer, SmtpSink
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+RESULT_PREFIX = "BENCH_RESULT "
+
+# 기본 키워드 (settings.KEYWORDS 기본값), 더 많은 키워드가 필요하면 topicNNNN을 덧붙임
+BASE_KEYWORDS = ["AI", "Trump", "Elon Musk", "IT", "OpenAI", "Sam Altman", "Google", "US",
+                 "삼성", "Samsung", "정치", "박물관", "전시회", "그림"]
+
+# 표에 보여 줄 구간과 카운터
+STAGE_SPANS = ["collect.rate_limit_wait", "collect.naver", "collect.google", "collect.bbc", "fetch.bbc_feed", "feed.parse_pool",
+               "openai.rate_limit_wait", "openai.request", "render.email", "smtp.connect", "smtp.send"]
+COUNTERS = ["articles.fetched", "articles.url_duplicates", "articles.near_duplicates", "articles.late_duplicates", "articles.new",
+            "articles.summarized", "collect.errors", "collect.timed_out", "collect.skipped", "openai.errors", "smtp.sent"]
+
+
+def make_keywords(count):
+    keywords = BASE_KEYWORDS[:count]
+    keywords += [f"topic{n:04d}" for n in range(count - len(keywords))]
+    return keywords
+
+
+def make_subscribers(path, keywords, count):
+    """키워드를 나눠 구독하는 구독자 목록 파일을 만듦 (첫 구독자는 모든 키워드)"""
+    subscribers = [{"email": "all@example.com"}]
+    for n in range(1, count):
+        subscribers.append({"email": f"user{n}@example.com",
+                            "keywords": keywords[n % len(keywords)::max(1, count - 1)][:20]})
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(subscribers, f)
+
+
+def run_child():
+    """하위 프로세스: 환경변수로 설정된 job()을 한 번 실행하고 결과를 한 줄 JSON으로 출력"""
+    sys.path.insert(0, os.path.join(ROOT, "scripts"))
+    start = time.perf_counter()
+    import run_agent
+    run_agent.job()
+    wall = time.perf_counter() - start
+    # 리눅스는 KB, macOS는 바이트 단위
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    peak_mb = peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+    print(RESULT_PREFIX + json.dumps({"wall_seconds": wall, "peak_rss_mb": peak_mb}))
+
+
+def run_scale(keyword_count, stub, sink, args):
+    """키워드 keyword_count개로 job()을 한 번 실행하고 결과 dict를 반환"""
+    keywords = make_keywords(keyword_count)
+    stub.keywords = keywords
+    with tempfile.TemporaryDirectory(prefix="newsagent-bench-") as workdir:
+        env = dict(os.environ)
+        env.update(stub.source_settings(args.bbc_feeds))
+        env.update({
+            "PYTHONPATH": ROOT + os.pathsep + env.get("PYTHONPATH", ""),
+            "NAVER_CLIENT_ID": "bench", "NAVER_CLIENT_SECRET": "bench", "OPENAI_API_KEY": "bench",
+            "GMAIL_ADDRESS": "bench@example.com", "GMAIL_APP_PASSWORD": "bench",
+            "RECIPIENT_EMAIL": "all@example.com", "SUBSCRIBERS_FILE": "",
+            "SMTP_HOST": "127.0.0.1", "SMTP_PORT": str(sink.port), "SMTP_SECURITY": "none",
+            "KEYWORDS": ",".join(keywords),
+            "SENT_DB_FILE": os.path.join(workdir, "sent.sqlite3"),
+            "FEED_CACHE_FILE": os.path.join(workdir, "feed_cache.sqlite3"),
+            "WATERMARK_FILE": os.path.join(workdir, "watermarks.sqlite3"),
+            "SUMMARY_CACHE_FILE": os.path.join(workdir, "summary_cache.sqlite3"),
+            "QUOTA_FILE": os.path.join(workdir, "quota.sqlite3"),
+            "METRICS_REPORT_DIR": os.path.join(workdir, "reports"),
+            # 스텁 서버는 요청 한도가 없으므로 클라이언트 쪽 한도도 끔
+            "OPENAI_REQUESTS_PER_MINUTE": "0", "OPENAI_TOKENS_PER_MINUTE": "0",
+            "NAVER_REQUESTS_PER_SECOND": "0", "GOOGLE_REQUESTS_PER_SECOND": "0",
+        })
+        if args.subscribers > 1:
+            env["SUBSCRIBERS_FILE"] = os.path.join(workdir, "subscribers.json")
+            make_subscribers(env["SUBSCRIBERS_FILE"], keywords, args.subscribers)
+
+        before = sink.stats()
+        result = subprocess.run([sys.executable, "-m", "benchmarks.bench_pipeline", "--child"],
+                                cwd=workdir, env=env, capture_output=True, text=True)
+        lines = [line for line in result.stdout.splitlines() if line.startswith(RESULT_PREFIX)]
+        if result.returncode != 0 or not lines:
+            raise RuntimeError(f"키워드 {keyword_count}개 실행 실패:\n{result.stdout[-2000:]}\n{result.stderr[-2000:]}")
+        summary = json.loads(lines[-1][len(RESULT_PREFIX):])
+        with open(os.path.join(env["METRICS_REPORT_DIR"], "latest.json"), encoding="utf-8") as f:
+            summary["report"] = json.load(f)
+        after = sink.stats()
+        summary["emails"] = after["messages"] - before["messages"]
+        summary["keywords"] = keyword_count
+        return summary
+
+
+def print_result(result):
+    report = result["report"]
+    print(f"\n키워드 {result['keywords']}개: 벽시계 {result['wall_seconds']:.2f}s "
+          f"(job {report['duration_seconds']:.2f}s), 최대 RSS {result['peak_rss_mb']:.1f} MB, "
+          f"발송 메일 {result['emails']}통")
+    print(f"  {'구간':<24} {'횟수':>7} {'합계(s)':>10} {'최대(s)':>9}")
+    for name in STAGE_SPANS:
+        stats = report["spans"].get(name)
+        if stats:
+            print(f"  {name:<24} {stats['count']:>7} {stats['total_seconds']:>10.3f} {stats['max_seconds']:>9.3f}")
+    counters = report["counters"]
+    print("  " + ", ".join(f"{name}={counters[name]['total']}" for name in COUNTERS if name in counters))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="오프라인 전체 작업 벤치마크")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--scales", default="14,100,1000", help="쉼표로 구분한 키워드 수 목록")
+    parser.add_argument("--latency", type=float, default=0.05, help="뉴스 소스 응답 지연(초)")
+    parser.add_argument("--openai-latency", type=float, default=0.3, help="OpenAI 응답 지연(초)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="503으로 실패시킬 요청 비율")
+    parser.add_argument("--feed-size", type=int, default=30, help="검색/피드당 기사 수")
+    parser.add_argument("--bbc-feeds", type=int, default=4, help="BBC 피드 수")
+    parser.add_argument("--subscribers", type=int, default=1, help="구독자 수 (2 이상이면 구독자 파일 생성)")
+    parser.add_argument("--seed", type=int, default=0, help="오류 발생용 난수 시드")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    args = parser.parse_args()
+
+    if args.child:
+        run_child()
+        return
+
+    stub = NewsStubServer(latency=args.latency, openai_latency=args.openai_latency, error_rate=args.error_rate,
+                          feed_size=args.feed_size, seed=args.seed).start()
+    sink = SmtpSink().start()
+    try:
+        results = []
+        for scale in (int(value) for value in args.scales.split(",") if value):
+            result = run_scale(scale, stub, sink, args)
+            results.append(result)
+            if not args.json:
+                print_result(result)
+        if args.json:
+            print(json.dumps(results, ensure_ascii=False, indent=2))
+        else:
+            print(f"\n스텁 요청 수: {stub.requests}")
+    finally:
+        stub.stop()
+        sink.stop()
+
+
+if __name__ == "__main__":
+    main()
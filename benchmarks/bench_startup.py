@@ -0,0 +1,55 @@
+"""시작 시간 벤치마크 (python -X importtime)
+
+scripts/run_agent.py를 import할 때 걸리는 시간을 잰다.
+openai/yagmail/feedparser/dateutil/tiktoken을 시작할 때 함께 import하던 변경 전 상태는
+같은 모듈들을 먼저 import하는 것으로 흉내 낸다 (변경 전에는 여기에 Gmail SMTP 로그인까지 더해졌다).
+
+실행: python -m benchmarks.bench_startup
+"""
+import os
+import re
+import subprocess
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+EAGER_MODULES = ["openai", "yagmail", "feedparser", "dateutil.parser", "tiktoken"]
+_IMPORTTIME_LINE = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)')
+
+
+def measure(preload, repeat=5):
+    """scripts/run_agent.py import 시간(가장 빠른 회차)과 그때 누적 시간이 큰 최상위 모듈들을 반환"""
+    code = "".join(f"import {module}; " for module in preload)
+    code += "import sys; sys.path.insert(0, 'scripts'); import run_agent"
+    best = None
+    for _ in range(repeat):
+        result = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                                cwd=ROOT, capture_output=True, text=True, check=True)
+        top_level = []
+        for line in result.stderr.splitlines():
+            match = _IMPORTTIME_LINE.match(line)
+            # 들여쓰기가 없는 줄이 최상위 import (누적 시간 포함)
+            if match and len(match.group(3)) == 1:
+                top_level.append((int(match.group(2)), match.group(4)))
+        total = sum(cumulative for cumulative, _ in top_level)
+        if best is None or total < best[0]:
+            best = (total, sorted(top_level, reverse=True)[:5])
+    return best
+
+
+def report(label, result):
+    total, heaviest = result
+    print(f"{label:<28} {total / 1000:8.1f} ms")
+    for cumulative, module in heaviest:
+        print(f"    {module:<24} {cumulative / 1000:8.1f} ms")
+
+
+def main():
+    eager = measure(EAGER_MODULES)
+    lazy = measure([])
+    report("eager (변경 전 import)", eager)
+    report("lazy (현재)", lazy)
+    print(f"시작 시간 단축: x{eager[0] / lazy[0]:.1f}")
+
+
+if __name__ == "__main__":
+    main()
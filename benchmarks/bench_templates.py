@@ -0,0 +1,111 @@
+"""이메일 템플릿 렌더링 벤치마크 (기사 200건)
+
+변경 전 방식(키워드 인자마다 템플릿 전체에 str.replace, 섹션 문자열을 여러 번 복사)과
+컴파일된 템플릿을 하나의 출력 버퍼로 렌더링하는 현재 EmailTemplateRenderer를 비교한다.
+
+실행: python -m benchmarks.bench_templates
+"""
+import time
+from datetime import datetime
+
+from core.email_template_renderer import EmailTemplateRenderer
+from core.mailer import classify_news_by_source
+
+
+class LegacyEmailTemplateRenderer(EmailTemplateRenderer):
+    """변경 전 str.replace 기반 렌더링 경로"""
+
+    def render_template(self, template_content, **kwargs):
+        for key, value in kwargs.items():
+            placeholder = f"{{{{{key}}}}}"
+            template_content = template_content.replace(placeholder, str(value))
+        return template_content
+
+    def generate_content_section(self, news):
+        if news["language"] == "en":
+            return self.render_template(
+                self.load_template('content_english.html'),
+                summary=news.get("summary", ""),
+                original_content=self._clean_html_entities(self._truncate_content(news['content']))
+            )
+        return self.render_template(
+            self.load_template('content_korean.html'),
+            content=self._clean_html_entities(self._truncate_content(news['content']))
+        )
+
+    def generate_news_item(self, news):
+        return self.render_template(
+            self.load_template('news_item.html'),
+            title=self._clean_html_entities(news['title']),
+            url=news['url'],
+            alternate_sources="",
+            content_section=self.generate_content_section(news)
+        )
+
+    def generate_news_section(self, source_name, source_news):
+        news_items = [self.generate_news_item(news) for news in source_news]
+        source_info = self._get_source_info(source_name)
+        return self.render_template(
+            self.load_template('news_section.html'),
+            source_name=source_name,
+            source_icon=source_info['icon'],
+            source_display_name=source_info['display_name'],
+            news_count=len(source_news),
+            news_items=''.join(news_items)
+        )
+
+    def generate_email_html(self, news_list, news_by_source):
+        news_sections = self.generate_news_sections(news_by_source)
+        current_datetime = datetime.now()
+        return self.render_template(
+            self.load_template('news_email.html'),
+            current_date=current_datetime.strftime('%Y년 %m월 %d일 %H:%M'),
+            current_time=current_datetime.strftime('%Y-%m-%d %H:%M:%S'),
+            total_count=len(news_list),
+            source_count=len(news_by_source),
+            news_sections=''.join(news_sections)
+        )
+
+
+def make_articles(count=200):
+    """소스/언어가 섞인 기사 목록 생성"""
+    sources = [("Naver News", "ko"), ("Google News", "ko"), ("BBC", "en")]
+    articles = []
+    for index in range(count):
+        source, language = sources[index % len(sources)]
+        article = {
+            "title": f"기사 제목 {index} - Samsung AI 관련 소식",
+            "url": f"https://example.com/news/{index}",
+            "content": "본문 내용입니다. " * 40 if language == "ko" else "Article body text. " * 40,
+            "source": source,
+            "language": language
+        }
+        if language == "en":
+            article["summary"] = "한국어 요약 문장입니다. " * 4
+        articles.append(article)
+    return articles
+
+
+def bench(label, renderer, articles, news_by_source, repeat=20):
+    # 템플릿 파일 로드/컴파일은 한 번만 일어나므로 미리 한 번 렌더링
+    renderer.generate_email_html(articles, news_by_source)
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        html = renderer.generate_email_html(articles, news_by_source)
+        best = min(best, time.perf_counter() - start)
+    print(f"{label:<32} {best * 1000:8.2f} ms  ({len(html) / 1024:.0f} KB)")
+    return best
+
+
+def main():
+    articles = make_articles()
+    news_by_source = classify_news_by_source(articles)
+    print(f"기사 수: {len(articles)}")
+    legacy = bench("legacy str.replace", LegacyEmailTemplateRenderer(), articles, news_by_source)
+    compiled = bench("compiled + single buffer", EmailTemplateRenderer(), articles, news_by_source)
+    print(f"속도 향상: x{legacy / compiled:.1f}")
+
+
+if __name__ == "__main__":
+    main()
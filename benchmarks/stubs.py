@@ -0,0 +1,394 @@
+"""오프라인 벤치마크용 스텁 서버
+
+네이버 뉴스 검색 API, 구글 뉴스 RSS, BBC RSS, OpenAI 호환 채팅 완성 API를 흉내 내는 HTTP 서버와
+받은 메일을 세기만 하는 SMTP 싱크를 제공한다. 응답 본문은 fixtures/articles.json의 기사 템플릿을
+키워드와 순번으로 채워 만들며, 발행일은 항상 오늘(요청 시각 기준 최근)로 맞춘다.
+응답 지연, 오류 비율, 피드 크기는 서버를 만들 때 정한다.
+"""
+import os
+import re
+import json
+import time
+import random
+import socket
+import hashlib
+import threading
+import socketserver
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+from xml.sax.saxutils import escape
+
+FIXTURE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "articles.json")
+KST = timezone(timedelta(hours=9))
+
+# 기사 사이 발행 시각 간격(초), 최신 기사가 먼저 오도록 순번마다 이만큼 이전 시각을 씀
+_ITEM_INTERVAL_SECONDS = 20
+
+
+def load_fixtures(path=FIXTURE_FILE):
+    """언어별 기사 템플릿과 세부 문장/기관/지명 목록을 읽는 함수"""
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _slug(keyword):
+    return hashlib.blake2b(keyword.encode(), digest_size=4).hexdigest()
+
+
+class NewsStubServer(ThreadingHTTPServer):
+    """뉴스 소스와 OpenAI API를 흉내 내는 HTTP 서버
+
+    경로:
+      GET  /naver/v1/search/news.json?query=&display=&start=  네이버 뉴스 검색 API (JSON)
+      GET  /google/rss/search?q=                               구글 뉴스 RSS
+      GET  /bbc/<번호>.xml                                      BBC RSS (keywords 중 일부를 언급)
+      POST /openai/v1/chat/completions                         OpenAI 채팅 완성 API
+
+    RSS 응답에는 ETag를 붙이고 If-None-Match가 같으면 304를 돌려준다.
+    latency(초)만큼 기다린 뒤 응답하며, error_rate 비율의 요청은 503으로 실패한다.
+    """
+
+    daemon_threads = True
+    request_queue_size = 128
+
+    def __init__(self, address=("127.0.0.1", 0), latency=0.05, openai_latency=0.3, error_rate=0.0,
+                 feed_size=30, keywords=(), duplicate_rate=0.3, seed=0):
+        super().__init__(address, _StubHandler)
+        self.latency = latency
+        self.openai_latency = openai_latency
+        self.error_rate = error_rate
+        self.feed_size = feed_size
+        self.keywords = list(keywords)
+        self.duplicate_rate = duplicate_rate
+        self.fixtures = load_fixtures()
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.requests = {}
+        # 배치 요약 응답 본문을 바꾸는 함수 ({id: 요약} → 응답 문자열, 테스트에서 누락/깨진 응답 재현용)
+        self.batch_response = None
+
+    @property
+    def base_url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def source_settings(self, bbc_feeds=4):
+        """run_agent가 스텁 서버를 쓰도록 하는 환경변수 dict"""
+        return {
+            "NAVER_API_URL": f"{self.base_url}/naver/v1/search/news.json",
+            "GOOGLE_NEWS_RSS_URL": f"{self.base_url}/google/rss/search?q={{query}}",
+            "BBC_RSS_URLS": ",".join(f"{self.base_url}/bbc/{n}.xml" for n in range(bbc_feeds)),
+            "OPENAI_BASE_URL": f"{self.base_url}/openai/v1",
+        }
+
+    def count(self, route):
+        with self._lock:
+            self.requests[route] = self.requests.get(route, 0) + 1
+
+    def should_fail(self):
+        if not self.error_rate:
+            return False
+        with self._lock:
+            return self._random.random() < self.error_rate
+
+    def start(self):
+        threading.Thread(target=self.serve_forever, name="news-stub", daemon=True).start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+    # 응답 본문 생성
+
+    def _article(self, language, keyword, index):
+        """(키워드, 순번)마다 같은 (제목, 내용)을 만듦 (내용 뒤에 고른 세부 문장 세 개를 붙여 기사마다 다르게 함)"""
+        fixtures = self.fixtures
+        templates = fixtures[language]
+        template = templates[index % len(templates)]
+        seed = hashlib.blake2b(f"{language}:{keyword}:{index}".encode(), digest_size=16).digest()
+        details = fixtures["details"][language]
+        sentences = []
+        for position in range(3):
+            sentence = details[seed[position] % len(details)]
+            sentences.append(sentence
+                             .replace("{org}", fixtures["orgs"][seed[3 + position] % len(fixtures["orgs"])])
+                             .replace("{place}", fixtures["places"][seed[6 + position] % len(fixtures["places"])])
+                             .replace("{number}", str(10 + seed[9 + position])))
+        return (template["title"].replace("{keyword}", keyword),
+                " ".join([template["description"].replace("{keyword}", keyword)] + sentences))
+
+    def _published(self, index):
+        now = datetime.now(KST)
+        # 자정 직후에도 오늘 기사로 남도록 자정 이전으로는 넘어가지 않음
+        midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        return max(now - timedelta(seconds=_ITEM_INTERVAL_SECONDS * (index + 1)), midnight)
+
+    def naver_items(self, keyword, start, display):
+        items = []
+        for index in range(start - 1, min(start - 1 + display, self.feed_size)):
+            title, description = self._article("ko", keyword, index)
+            slug = _slug(keyword)
+            items.append({
+                "title": title.replace(keyword, f"<b>{keyword}</b>"),
+                "originallink": f"https://news.example.co.kr/{slug}/{index}?utm_source=naver",
+                "link": f"https://n.news.naver.com/mnews/article/001/{int(slug, 16) % 10**6:06d}{index:04d}",
+                "description": description.replace(keyword, f"<b>{keyword}</b>"),
+                "pubDate": format_datetime(self._published(index)),
+            })
+        return {"lastBuildDate": format_datetime(datetime.now(KST)), "total": self.feed_size,
+                "start": start, "display": len(items), "items": items}
+
+    def google_rss(self, keyword):
+        items = []
+        slug = _slug(keyword)
+        for index in range(self.feed_size):
+            # 일부는 네이버와 같은 기사를 다른 언론사 URL로 실어 클러스터링 대상이 되도록 함
+            if (index * 7919 + len(keyword)) % 100 < self.duplicate_rate * 100:
+                title, description = self._article("ko", keyword, index)
+            else:
+                title, description = self._article("ko", keyword, self.feed_size + index)
+                title = f"[종합] {title}"
+            items.append((title, f"https://press.example.com/{slug}/g{index}", description, self._published(index)))
+        return _rss(f"Google News - {keyword}", items)
+
+    def bbc_rss(self, feed_number):
+        items = []
+        pool = self.keywords or ["news"]
+        for index in range(self.feed_size):
+            keyword = pool[(feed_number * self.feed_size + index) % len(pool)]
+            title, description = self._article("en", keyword, index + feed_number)
+            items.append((title, f"https://www.bbc.example.com/news/{feed_number}-{_slug(keyword)}-{index}",
+                          description, self._published(index)))
+        return _rss(f"BBC News {feed_number}", items)
+
+    def chat_completion(self, request):
+        prompt = request["messages"][-1]["content"]
+        if (request.get("response_format") or {}).get("type") == "json_object":
+            # 배치 프롬프트의 마지막 줄은 [{"id": ..., "text": ...}] 형식의 기사 목록
+            articles = json.loads(prompt.rstrip().rsplit("\n", 1)[-1])
+            summaries = {item["id"]: _fake_summary(item["text"]) for item in articles}
+            if self.batch_response is not None:
+                content = self.batch_response(summaries)
+            else:
+                content = json.dumps(summaries, ensure_ascii=False)
+        else:
+            content = _fake_summary(prompt)
+        prompt_tokens = len(prompt) // 4
+        completion_tokens = len(content) // 2
+        return {
+            "id": "chatcmpl-stub",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": request.get("model", "stub"),
+            "choices": [{"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}],
+            "usage": {"prompt_tokens": prompt_tokens, "completion_tokens": completion_tokens,
+                      "total_tokens": prompt_tokens + completion_tokens},
+        }
+
+
+def _fake_summary(text):
+    words = re.findall(r"[A-Za-z0-9가-힣]+", text)
+    return f"요약: {' '.join(words[:12])} 관련 소식입니다."
+
+
+def _rss(title, items):
+    entries = "".join(
+        f"<item><title>{escape(item_title)}</title><link>{escape(link)}</link>"
+        f"<guid isPermaLink=\"false\">{escape(link)}</guid>"
+        f"<description>{escape(description)}</description>"
+        f"<pubDate>{format_datetime(published)}</pubDate></item>"
+        for item_title, link, description, published in items)
+    return (f"<?xml version=\"1.0\" encoding=\"UTF-8\"?><rss version=\"2.0\"><channel>"
+            f"<title>{escape(title)}</title>{entries}</channel></rss>")
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        parts = urlsplit(self.path)
+        query = parse_qs(parts.query)
+        if parts.path == "/naver/v1/search/news.json":
+            route = "naver"
+        elif parts.path == "/google/rss/search":
+            route = "google"
+        elif re.fullmatch(r"/bbc/\d+\.xml", parts.path):
+            route = "bbc"
+        else:
+            self._send(404, b"", "text/plain")
+            return
+        if not self._delay_or_fail(route, self.server.latency):
+            return
+
+        if route == "naver":
+            body = json.dumps(self.server.naver_items(
+                query.get("query", [""])[0],
+                int(query.get("start", ["1"])[0]),
+                int(query.get("display", ["10"])[0])), ensure_ascii=False).encode()
+            self._send(200, body, "application/json; charset=utf-8")
+            return
+
+        if route == "google":
+            text = self.server.google_rss(query.get("q", [""])[0])
+        else:
+            text = self.server.bbc_rss(int(parts.path[len("/bbc/"):-len(".xml")]))
+        body = text.encode()
+        # 발행 시각이 요청마다 바뀌므로 ETag는 분 단위로만 바뀌게 만듦
+        etag = '"' + hashlib.blake2b((self.path + datetime.now().strftime("%H%M")).encode(),
+                                     digest_size=8).hexdigest() + '"'
+        if self.headers.get("If-None-Match") == etag:
+            self._send(304, b"", None, {"ETag": etag})
+            return
+        self._send(200, body, "application/rss+xml; charset=utf-8", {"ETag": etag})
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if urlsplit(self.path).path != "/openai/v1/chat/completions":
+            self._send(404, b"", "text/plain")
+            return
+        if not self._delay_or_fail("openai", self.server.openai_latency):
+            return
+        response = self.server.chat_completion(json.loads(body))
+        self._send(200, json.dumps(response, ensure_ascii=False).encode(), "application/json")
+
+    def _delay_or_fail(self, route, latency):
+        self.server.count(route)
+        if latency:
+            time.sleep(latency)
+        if self.server.should_fail():
+            self.server.count(route + ".error")
+            self._send(503, b'{"error": {"message": "stub failure"}}', "application/json")
+            return False
+        return True
+
+    def _send(self, status, body, content_type, headers=None):
+        self.send_response(status)
+        if content_type:
+            self.send_header("Content-Type", content_type)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # 요청마다 로그를 남기지 않음
+
+
+class SmtpSink(socketserver.ThreadingTCPServer):
+    """받은 메일을 저장하지 않고 개수와 크기만 세는 SMTP 서버 (AUTH PLAIN은 항상 통과)
+
+    refused에 넣은 주소는 RCPT에 550으로 거부하고, drop_connections()는 열린 연결을 모두 끊는다.
+    """
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, address=("127.0.0.1", 0), refused=()):
+        super().__init__(address, _SmtpHandler)
+        self._lock = threading.Lock()
+        self.refused = {address.lower() for address in refused}
+        self.messages = 0
+        self.recipients = 0
+        self.rcpt_commands = 0
+        self.bytes = 0
+        self.connections = 0
+        self._open = set()
+
+    @property
+    def port(self):
+        return self.server_address[1]
+
+    def record(self, recipients, size):
+        with self._lock:
+            self.messages += 1
+            self.recipients += recipients
+            self.bytes += size
+
+    def stats(self):
+        with self._lock:
+            return {"connections": self.connections, "messages": self.messages,
+                    "recipients": self.recipients, "rcpt_commands": self.rcpt_commands, "bytes": self.bytes}
+
+    def drop_connections(self):
+        """열린 연결을 모두 서버 쪽에서 끊음 (유휴 연결이 끊긴 상황 재현용)"""
+        with self._lock:
+            sockets = list(self._open)
+        for sock in sockets:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+    def start(self):
+        threading.Thread(target=self.serve_forever, name="smtp-sink", daemon=True).start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+
+class _SmtpHandler(socketserver.StreamRequestHandler):
+
+    def reply(self, line):
+        self.wfile.write(line.encode() + b"\r\n")
+
+    def handle(self):
+        with self.server._lock:
+            self.server.connections += 1
+            self.server._open.add(self.request)
+        try:
+            self.reply("220 localhost stub SMTP sink")
+            self.serve_commands()
+        except OSError:
+            pass
+        finally:
+            with self.server._lock:
+                self.server._open.discard(self.request)
+
+    def serve_commands(self):
+        recipients = 0
+        for raw in self.rfile:
+            command = raw.decode("utf-8", "replace").strip()
+            verb = command.split(" ", 1)[0].upper()
+            if verb == "EHLO":
+                self.reply("250-localhost")
+                self.reply("250-AUTH PLAIN")
+                self.reply("250 8BITMIME")
+            elif verb == "HELO":
+                self.reply("250 localhost")
+            elif verb == "AUTH":
+                self.reply("235 2.7.0 Authentication successful")
+            elif verb == "MAIL":
+                recipients = 0
+                self.reply("250 OK")
+            elif verb == "RCPT":
+                with self.server._lock:
+                    self.server.rcpt_commands += 1
+                address = command.split(":", 1)[-1].strip().strip("<>").lower()
+                if address in self.server.refused:
+                    self.reply("550 5.1.1 No such user")
+                else:
+                    recipients += 1
+                    self.reply("250 OK")
+            elif verb == "DATA":
+                self.reply("354 End data with <CR><LF>.<CR><LF>")
+                size = 0
+                for line in self.rfile:
+                    if line in (b".\r\n", b".\n"):
+                        break
+                    size += len(line)
+                self.server.record(recipients, size)
+                self.reply("250 OK queued")
+            elif verb in ("RSET", "NOOP"):
+                recipients = 0 if verb == "RSET" else recipients
+                self.reply("250 OK")
+            elif verb == "QUIT":
+                self.reply("221 Bye")
+                return
+            else:
+                self.reply("502 Command not implemented")
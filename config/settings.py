@@ -1,7 +1,7 @@
 import os
+import re
+from functools import lru_cache
 from dotenv import load_dotenv
-from openai import OpenAI
-import yagmail
 
 load_dotenv()
 
@@ -23,8 +23,135 @@ BATCH_TIMES = os.getenv("BATCH_TIMES", "09:00,15:00,21:00").split(",")
 
 DB_FILE = os.getenv("DB_FILE", "sent_articles.json")
 
-# OpenAI 클라이언트
-client = OpenAI(api_key=OPENAI_API_KEY)
+# '오늘' 기사 판단 기준 시간대
+REPORT_TIMEZONE = os.getenv("REPORT_TIMEZONE", "Asia/Seoul")
 
-# Gmail 세팅
-yag = yagmail.SMTP(GMAIL_ADDRESS, GMAIL_APP_PASSWORD)
\ No newline at end of file
+# 발송 기록 저장소 (SQLite, 새로 발송한 기사만 추가 기록)
+SENT_DB_FILE = os.getenv("SENT_DB_FILE", "sent_articles.sqlite3")
+
+# 중복 발송 확인 기간 (최근 DEDUP_EXACT_DAYS일은 정확한 ID, DEDUP_WINDOW_DAYS일까지는 블룸 필터)
+DEDUP_WINDOW_DAYS = int(os.getenv("DEDUP_WINDOW_DAYS", "7"))
+DEDUP_EXACT_DAYS = int(os.getenv("DEDUP_EXACT_DAYS", "2"))
+DEDUP_BLOOM_ERROR_RATE = float(os.getenv("DEDUP_BLOOM_ERROR_RATE", "0.001"))
+
+# 여러 출처의 같은 기사를 하나로 묶는 유사도 기준 (MinHash 추정 자카드 유사도)
+CLUSTER_SIMILARITY_THRESHOLD = float(os.getenv("CLUSTER_SIMILARITY_THRESHOLD", "0.5"))
+
+# 뉴스 수집 설정 (요청 타임아웃, 전체 마감 시간, 소스별 동시 요청 수)
+COLLECT_TIMEOUT = float(os.getenv("COLLECT_TIMEOUT", "10"))
+COLLECT_DEADLINE = float(os.getenv("COLLECT_DEADLINE", "120"))
+COLLECT_CONCURRENCY = int(os.getenv("COLLECT_CONCURRENCY", "4"))
+
+# 소스별 요청 한도 (초당 요청 수, 네이버 하루 요청 수; 0이면 제한 없음)와 하루 사용량 저장 파일
+NAVER_REQUESTS_PER_SECOND = float(os.getenv("NAVER_REQUESTS_PER_SECOND", "10"))
+NAVER_DAILY_QUOTA = int(os.getenv("NAVER_DAILY_QUOTA", "25000"))
+GOOGLE_REQUESTS_PER_SECOND = float(os.getenv("GOOGLE_REQUESTS_PER_SECOND", "5"))
+QUOTA_FILE = os.getenv("QUOTA_FILE", "source_quota.sqlite3")
+
+# 네이버 페이지 요청 설정 (한 번에 받는 기사 수(최대 100), 키워드당 최대 페이지 수,
+# 동시에 요청하는 페이지 수, 키워드당 최대 기사 수(0이면 제한 없음))
+NAVER_PAGE_SIZE = int(os.getenv("NAVER_PAGE_SIZE", "100"))
+NAVER_MAX_PAGES = int(os.getenv("NAVER_MAX_PAGES", "10"))
+NAVER_PAGE_CONCURRENCY = int(os.getenv("NAVER_PAGE_CONCURRENCY", "3"))
+NAVER_MAX_ARTICLES = int(os.getenv("NAVER_MAX_ARTICLES", "0"))
+
+# 소스 회로 차단기 (연속 실패 횟수, 그 소스를 건너뛰는 시간(초))
+SOURCE_FAILURE_THRESHOLD = int(os.getenv("SOURCE_FAILURE_THRESHOLD", "3"))
+SOURCE_COOL_DOWN = float(os.getenv("SOURCE_COOL_DOWN", "300"))
+
+# 피드 파싱 작업 프로세스 수 (0이면 수집 스레드에서 바로 파싱, 기본값은 코어 수 - 1, 최대 4)
+FEED_PARSE_WORKERS = int(os.getenv("FEED_PARSE_WORKERS", str(min(4, (os.cpu_count() or 1) - 1))))
+
+# RSS 피드 조건부 요청 캐시 (ETag/Last-Modified와 파싱된 엔트리 보관)
+FEED_CACHE_FILE = os.getenv("FEED_CACHE_FILE", "feed_cache.sqlite3")
+
+# (소스, 검색어)별 마지막 처리 기사 워터마크 저장 파일
+WATERMARK_FILE = os.getenv("WATERMARK_FILE", "feed_watermarks.sqlite3")
+
+# 요약 캐시 설정 (파일 경로, 최대 항목 수, 보관 기간)
+SUMMARY_CACHE_FILE = os.getenv("SUMMARY_CACHE_FILE", "summary_cache.sqlite3")
+SUMMARY_CACHE_MAX_ENTRIES = int(os.getenv("SUMMARY_CACHE_MAX_ENTRIES", "5000"))
+SUMMARY_CACHE_MAX_AGE_DAYS = float(os.getenv("SUMMARY_CACHE_MAX_AGE_DAYS", "7"))
+
+# 요약 병렬 처리 및 OpenAI 요청 한도 (분당 요청 수/토큰 수, 0이면 제한 없음)
+SUMMARY_CONCURRENCY = int(os.getenv("SUMMARY_CONCURRENCY", "4"))
+OPENAI_REQUESTS_PER_MINUTE = float(os.getenv("OPENAI_REQUESTS_PER_MINUTE", "60"))
+OPENAI_TOKENS_PER_MINUTE = float(os.getenv("OPENAI_TOKENS_PER_MINUTE", "60000"))
+
+# 배치 요약 설정 (한 요청에 묶을 최대 기사 수, 배치 대상 최대 글자 수, 배치당 입력 토큰 예산)
+SUMMARY_BATCH_SIZE = int(os.getenv("SUMMARY_BATCH_SIZE", "8"))
+SUMMARY_BATCH_MAX_CHARS = int(os.getenv("SUMMARY_BATCH_MAX_CHARS", "500"))
+SUMMARY_BATCH_TOKEN_BUDGET = int(os.getenv("SUMMARY_BATCH_TOKEN_BUDGET", "3000"))
+
+# 수집/요약 엔드포인트 (비어 있으면 기본값, 오프라인 벤치마크에서 로컬 스텁 서버로 바꿈)
+NAVER_API_URL = os.getenv("NAVER_API_URL", "")
+GOOGLE_NEWS_RSS_URL = os.getenv("GOOGLE_NEWS_RSS_URL", "")
+BBC_RSS_URLS = [url for url in os.getenv("BBC_RSS_URLS", "").split(",") if url]
+OPENAI_BASE_URL = os.getenv("OPENAI_BASE_URL", "")
+
+# 메일 서버 설정 (security: ssl/starttls/none, 동시에 유지할 SMTP 연결 수)
+SMTP_HOST = os.getenv("SMTP_HOST", "smtp.gmail.com")
+SMTP_PORT = int(os.getenv("SMTP_PORT", "465"))
+SMTP_SECURITY = os.getenv("SMTP_SECURITY", "ssl")
+SMTP_POOL_SIZE = int(os.getenv("SMTP_POOL_SIZE", "2"))
+
+# 구독자 목록 JSON 파일 ([{"email": ..., "keywords": [...]}], 비어 있으면 RECIPIENT_EMAIL 한 명에게 발송)
+SUBSCRIBERS_FILE = os.getenv("SUBSCRIBERS_FILE", "")
+
+# 스케줄러 설정 (작업 제한 시간(초, 0이면 제한 없음), 놓친 배치를 따라잡는 기간(분), 중복 실행 방지 잠금 파일)
+JOB_TIMEOUT = float(os.getenv("JOB_TIMEOUT", "1800"))
+SCHEDULE_CATCH_UP_MINUTES = float(os.getenv("SCHEDULE_CATCH_UP_MINUTES", "180"))
+SCHEDULER_LOCK_FILE = os.getenv("SCHEDULER_LOCK_FILE", "news_agent.lock")
+
+# 작업별 JSON 실행 보고서 저장 디렉터리와 스케줄러의 Prometheus 지표 포트 (0이면 사용 안 함)
+METRICS_REPORT_DIR = os.getenv("METRICS_REPORT_DIR", "reports")
+METRICS_PORT = int(os.getenv("METRICS_PORT", "0"))
+
+# 스트리밍 파이프라인 창 크기 (순위 단계에서 붙잡아 두는 기사 수, 동시에 요약 중인 기사 수)
+PIPELINE_RANK_WINDOW = int(os.getenv("PIPELINE_RANK_WINDOW", "50"))
+PIPELINE_SUMMARY_WINDOW = int(os.getenv("PIPELINE_SUMMARY_WINDOW", "32"))
+
+# 작업을 시작하기 전에 반드시 있어야 하는 설정
+REQUIRED_SETTINGS = ("NAVER_CLIENT_ID", "NAVER_CLIENT_SECRET", "OPENAI_API_KEY",
+                     "GMAIL_ADDRESS", "GMAIL_APP_PASSWORD")
+
+
+def validate_settings():
+    """필수 설정 누락과 잘못된 값을 확인해 문제가 있으면 ValueError를 발생시키는 함수"""
+    errors = [f"{name} 환경변수가 설정되지 않음" for name in REQUIRED_SETTINGS if not globals()[name]]
+    if not RECIPIENT_EMAIL and not SUBSCRIBERS_FILE:
+        errors.append("RECIPIENT_EMAIL 또는 SUBSCRIBERS_FILE이 설정되지 않음")
+    if SMTP_SECURITY not in ("ssl", "starttls", "none"):
+        errors.append(f"SMTP_SECURITY 값 오류: {SMTP_SECURITY!r} (ssl/starttls/none)")
+    if not any(keyword.strip() for keyword in KEYWORDS):
+        errors.append("KEYWORDS가 비어 있음")
+    errors += [f"BATCH_TIMES 형식 오류: {t!r} (HH:MM)" for t in BATCH_TIMES
+               if not re.fullmatch(r'([01]\d|2[0-3]):[0-5]\d', t.strip())]
+    if DEDUP_EXACT_DAYS > DEDUP_WINDOW_DAYS:
+        errors.append("DEDUP_EXACT_DAYS는 DEDUP_WINDOW_DAYS보다 클 수 없음")
+    if errors:
+        raise ValueError("설정 오류: " + "; ".join(errors))
+
+
+@lru_cache(maxsize=None)
+def get_openai_client():
+    """OpenAI 클라이언트를 처음 필요할 때 만들어 재사용하는 함수 (openai 모듈도 이때 import)"""
+    from openai import OpenAI
+    return OpenAI(api_key=OPENAI_API_KEY, base_url=OPENAI_BASE_URL or None)
+
+
+@lru_cache(maxsize=None)
+def get_yagmail_smtp():
+    """Gmail SMTP 연결을 처음 필요할 때 만들어 재사용하는 함수 (yagmail 모듈도 이때 import)"""
+    import yagmail
+    return yagmail.SMTP(GMAIL_ADDRESS, GMAIL_APP_PASSWORD)
+
+
+def __getattr__(name):
+    # 예전에 import 시점에 만들던 client/yag는 처음 접근할 때 생성
+    # (from config.settings import *로는 가져오지 않으므로 Gmail 로그인이 일어나지 않음)
+    if name == "client":
+        return get_openai_client()
+    if name == "yag":
+        return get_yagmail_smtp()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
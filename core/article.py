@@ -0,0 +1,89 @@
+import sys
+from core.urls import canonicalize_url, article_id_for_url
+
+# dict 방식으로 읽을 수 있는 필드와, 수집 이후 파이프라인에서 채우거나 고치는 필드
+_FIELDS = ('title', 'url', 'content', 'source', 'language', 'matched_keywords', 'alternate_sources', 'summary')
+_MUTABLE_FIELDS = frozenset(('matched_keywords', 'alternate_sources', 'summary'))
+
+
+class Article:
+    """수집된 기사 한 건을 담는 슬롯 기반 레코드
+
+    source/language는 intern된 문자열 하나를 모든 기사가 공유하고, id와 정규화된 URL은
+    처음 필요할 때 한 번만 계산해 둔다. 템플릿과 기존 코드가 그대로 쓸 수 있도록
+    article["title"], get(), in, setdefault() 같은 dict 방식 접근을 지원하며,
+    수집 후에는 summary/matched_keywords/alternate_sources만 바꿀 수 있다
+    (속성 대입도 마찬가지이며, 나머지 필드와 ID/URL 캐시는 __init__에서만 설정).
+    """
+
+    __slots__ = _FIELDS + ('_id', '_normalized_url')
+
+    def __init__(self, title, url, content, source, language, matched_keywords=None):
+        # 변경할 수 없는 필드는 __setattr__를 거치지 않고 설정
+        init = object.__setattr__
+        init(self, 'title', title)
+        init(self, 'url', url)
+        init(self, 'content', content)
+        init(self, 'source', sys.intern(source))
+        init(self, 'language', sys.intern(language))
+        init(self, '_id', None)
+        init(self, '_normalized_url', None)
+        self.matched_keywords = matched_keywords if matched_keywords is not None else []
+
+    def __setattr__(self, name, value):
+        if name not in _MUTABLE_FIELDS:
+            raise AttributeError(f"변경할 수 없는 기사 필드: {name}")
+        object.__setattr__(self, name, value)
+
+    @property
+    def id(self):
+        """발송 기록에 쓰는 기사 ID (처음 접근할 때 계산)"""
+        if self._id is None:
+            object.__setattr__(self, '_id', article_id_for_url(self.url))
+        return self._id
+
+    @property
+    def normalized_url(self):
+        """추적 파라미터/리다이렉트 래퍼를 걷어 낸 정규화 URL (처음 접근할 때 계산)"""
+        if self._normalized_url is None:
+            object.__setattr__(self, '_normalized_url', canonicalize_url(self.url))
+        return self._normalized_url
+
+    def __getitem__(self, key):
+        if key not in _FIELDS:
+            raise KeyError(key)
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __setitem__(self, key, value):
+        if key not in _MUTABLE_FIELDS:
+            raise KeyError(f"변경할 수 없는 기사 필드: {key}")
+        setattr(self, key, value)
+
+    def __contains__(self, key):
+        return key in _FIELDS and hasattr(self, key)
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def setdefault(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            self[key] = default
+            return default
+
+    def keys(self):
+        return [key for key in _FIELDS if hasattr(self, key)]
+
+    def to_dict(self):
+        """일반 dict로 변환 (JSON 저장 등에 사용)"""
+        return {key: getattr(self, key) for key in self.keys()}
+
+    def __repr__(self):
+        return f"Article(source={self.source!r}, title={self.title!r}, url={self.url!r})"
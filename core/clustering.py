@@ -0,0 +1,91 @@
+import re
+import html
+import hashlib
+
+# MinHash 순열 개수와 LSH 밴드 구성 (2행씩 16개 밴드 → 자카드 유사도 약 0.25 이상이면 후보)
+NUM_PERMUTATIONS = 32
+LSH_ROWS = 2
+LSH_BANDS = NUM_PERMUTATIONS // LSH_ROWS
+
+# 64비트 해시를 섞는 데 쓰는 (a * h + b) mod p 형태의 해시 함수 계수 (고정 시드로 실행마다 동일)
+_MERSENNE_PRIME = (1 << 61) - 1
+_PERMUTATIONS = [
+    (int.from_bytes(hashlib.blake2b(f"a{i}".encode(), digest_size=8).digest(), 'little') | 1,
+     int.from_bytes(hashlib.blake2b(f"b{i}".encode(), digest_size=8).digest(), 'little'))
+    for i in range(NUM_PERMUTATIONS)
+]
+
+_TAG_PATTERN = re.compile(r'<[^>]+>')
+_NON_WORD_PATTERN = re.compile(r'[^\w]+')
+
+
+def normalize_text(text):
+    """HTML 태그/엔티티와 문장부호를 제거하고 소문자로 정규화하는 함수"""
+    if not text:
+        return ""
+    text = html.unescape(_TAG_PATTERN.sub(' ', text))
+    return _NON_WORD_PATTERN.sub(' ', text.lower()).strip()
+
+
+def extract_features(article):
+    """기사의 제목과 내용에서 단어 및 단어 2-gram 특징을 추출하는 함수"""
+    title_words = normalize_text(article.get("title", "")).split()
+    content_words = normalize_text(article.get("content", "")).split()
+    features = set(title_words)
+    for words in (title_words, content_words):
+        features.update(f"{a} {b}" for a, b in zip(words, words[1:]))
+    return features
+
+
+def minhash(features):
+    """특징 집합으로 MinHash 서명(순열별 최솟값 목록)을 계산하는 함수"""
+    hashes = [int.from_bytes(hashlib.blake2b(feature.encode(), digest_size=8).digest(), 'little')
+              for feature in features]
+    return tuple(
+        min((a * h + b) % _MERSENNE_PRIME for h in hashes)
+        for a, b in _PERMUTATIONS
+    )
+
+
+def _similarity(signature_a, signature_b):
+    """두 MinHash 서명이 일치하는 비율 (자카드 유사도 추정치)"""
+    return sum(1 for a, b in zip(signature_a, signature_b) if a == b) / NUM_PERMUTATIONS
+
+
+class StoryIndex:
+    """기사를 하나씩 넣으면서 이미 본 스토리와 거의 같은지 판단하는 증분 MinHash LSH 인덱스
+
+    스트리밍 파이프라인에서 쓰며, 기사 자체 대신 서명과 호출자가 넘긴 스토리 값만 보관한다.
+    """
+
+    def __init__(self, threshold=0.5, min_features=4):
+        self.threshold = threshold
+        self.min_features = min_features
+        self._signatures = []
+        self._stories = []
+        self._buckets = {}
+
+    def add(self, article, story):
+        """거의 같은 스토리가 있으면 그 스토리 값을 반환하고, 없으면 story로 새로 등록한 뒤 None을 반환"""
+        features = extract_features(article)
+        # 특징이 너무 적은 기사는 서명을 신뢰할 수 없으므로 묶지 않음
+        if len(features) < self.min_features:
+            return None
+        signature = minhash(features)
+        keys = [(band,) + signature[band * LSH_ROWS:(band + 1) * LSH_ROWS] for band in range(LSH_BANDS)]
+
+        compared = set()
+        for key in keys:
+            for other in self._buckets.get(key, ()):
+                if other in compared:
+                    continue
+                compared.add(other)
+                if _similarity(signature, self._signatures[other]) >= self.threshold:
+                    return self._stories[other]
+
+        index = len(self._signatures)
+        self._signatures.append(signature)
+        self._stories.append(story)
+        for key in keys:
+            self._buckets.setdefault(key, []).append(index)
+        return None
@@ -1,96 +1,365 @@
+import math
 import requests
-import feedparser
-from datetime import datetime, date, timedelta
-from dateutil import parser
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from urllib.parse import quote
+from core import dates, metrics
+from core.article import Article
+from core.matcher import compile_keywords
+from core.http_cache import get_session, parse_feed
+from core.rate_limiter import RateLimiter, CircuitBreaker
 
-def is_today_article(pub_date_str):
-    """발행일이 오늘인지 확인하는 함수"""
-    if not pub_date_str:
-        return True  # 날짜 정보가 없으면 포함
-    
+# 요청 하나당 타임아웃(초)과 전체 수집 마감 시간(초)
+DEFAULT_REQUEST_TIMEOUT = 10
+DEFAULT_COLLECT_DEADLINE = 120
+
+# 수집 엔드포인트 (configure_sources()로 변경, 벤치마크에서는 로컬 스텁 서버를 가리킴)
+NAVER_NEWS_API_URL = "https://openapi.naver.com/v1/search/news.json"
+GOOGLE_NEWS_RSS_URL = "https://news.google.com/rss/search?q={query}&hl=ko&gl=KR&ceid=KR:ko"
+
+# 네이버 뉴스 검색 API의 display 최댓값과 start 최댓값
+NAVER_MAX_DISPLAY = 100
+NAVER_MAX_START = 1000
+
+# 네이버 페이지 요청 설정 (configure_naver_paging()으로 변경)
+# page_size: 한 번에 받는 기사 수, max_pages: 키워드당 최대 페이지 수,
+# page_concurrency: 동시에 요청하는 페이지 수, max_articles: 키워드당 최대 기사 수 (0이면 제한 없음)
+NAVER_PAGING = {
+    "page_size": NAVER_MAX_DISPLAY,
+    "max_pages": 10,
+    "page_concurrency": 3,
+    "max_articles": 0
+}
+
+# 소스별 동시 요청 상한
+DEFAULT_SOURCE_CONCURRENCY = {
+    "naver": 4,
+    "google": 4,
+    "bbc": 4
+}
+
+# 소스별 요청 한도 (초당 요청 수, 한 번에 몰아 보낼 수 있는 요청 수, 하루 요청 수; 0이면 제한 없음)
+DEFAULT_SOURCE_LIMITS = {
+    "naver": {"requests_per_second": 10, "burst": 10, "daily_quota": 25000},
+    "google": {"requests_per_second": 5, "burst": 5, "daily_quota": 0},
+    "bbc": {"requests_per_second": 0, "burst": 0, "daily_quota": 0}
+}
+
+# 소스가 연속으로 이만큼 실패하면 COOL_DOWN초 동안 그 소스 요청을 보내지 않음
+DEFAULT_FAILURE_THRESHOLD = 3
+DEFAULT_COOL_DOWN = 300
+
+
+class SourceUnavailable(requests.exceptions.RequestException):
+    """회로 차단기가 열렸거나 하루 요청 한도를 다 써서 요청을 보내지 않았을 때 발생하는 예외"""
+
+
+class SourceGuard:
+    """소스 하나로 가는 모든 요청이 거치는 요청 속도 제한, 하루 한도, 회로 차단기
+
+    요청은 토큰 버킷 속도에 맞춰 보내고, 429 응답의 Retry-After만큼은 그 소스 요청을 모두 멈춘다.
+    연속 실패로 회로가 열리면 키워드마다 타임아웃을 기다리지 않고 바로 SourceUnavailable을 발생시킨다.
+    """
+
+    def __init__(self, name, requests_per_second=0, burst=0, daily_quota=0,
+                 failure_threshold=DEFAULT_FAILURE_THRESHOLD, cool_down=DEFAULT_COOL_DOWN):
+        self.name = name
+        self.daily_quota = daily_quota
+        self.limiter = None
+        if requests_per_second:
+            self.limiter = RateLimiter(requests_per_second * 60, request_burst=burst or requests_per_second)
+        self.breaker = CircuitBreaker(failure_threshold, cool_down)
+        self.quota_store = None
+        self._quota_reported = False
+
+    def reset(self, quota_store=None):
+        """새 수집 작업을 위해 회로 차단기를 닫고 하루 사용량을 기록할 저장소를 바꿈"""
+        self.breaker.reset()
+        self.quota_store = quota_store
+        self._quota_reported = False
+
+    def call(self, func, *args, **kwargs):
+        """한도 안에서 func를 호출하고 결과를 반환 (네트워크 오류는 실패로 기록한 뒤 다시 발생시킴)"""
+        if not self.breaker.allow():
+            metrics.incr("collect.skipped", label=self.name)
+            raise SourceUnavailable(f"{self.name} 소스 일시 중단 (연속 실패)")
+        if self.quota_store is not None and not self.quota_store.consume(self.name, self.daily_quota):
+            self.breaker.release()
+            if not self._quota_reported:
+                self._quota_reported = True
+                print(f"{self.name} 하루 요청 한도({self.daily_quota}회) 소진, 오늘은 더 요청하지 않음")
+            metrics.incr("collect.quota_exhausted", label=self.name)
+            raise SourceUnavailable(f"{self.name} 하루 요청 한도 소진")
+        try:
+            if self.limiter is not None:
+                with metrics.span("collect.rate_limit_wait", self.name):
+                    self.limiter.acquire()
+            result = func(*args, **kwargs)
+        except requests.exceptions.RequestException as e:
+            response = getattr(e, "response", None)
+            if response is not None and response.status_code == 429 and self.limiter is not None:
+                metrics.incr("collect.rate_limited", label=self.name)
+                self.limiter.defer(_retry_after(response))
+            if self.breaker.record_failure():
+                print(f"{self.name} 소스 연속 실패, {self.breaker.cool_down:.0f}초 동안 건너뜀: {e}")
+                metrics.incr("collect.circuit_opened", label=self.name)
+            raise
+        except BaseException:
+            # 네트워크 외 오류는 소스 상태와 무관하므로 기록하지 않고 시험 요청 자리만 돌려줌
+            self.breaker.release()
+            raise
+        self.breaker.record_success()
+        return result
+
+
+def _retry_after(response, default=1.0):
+    """429 응답의 Retry-After(초)를 읽음 (없거나 날짜 형식이면 default)"""
     try:
-        # 다양한 날짜 형식 파싱
-        pub_date = parser.parse(pub_date_str).date()
-        today = date.today()
-        return pub_date == today
-    except (ValueError, TypeError):
-        return True  # 파싱 실패 시 포함
+        return max(0.0, float(response.headers.get("Retry-After", default)))
+    except (TypeError, ValueError):
+        return default
+
+
+_source_guards = {}
+
+
+def configure_source_limits(limits=None, failure_threshold=DEFAULT_FAILURE_THRESHOLD, cool_down=DEFAULT_COOL_DOWN):
+    """소스별 요청 한도와 회로 차단기 설정을 바꾸는 함수 (limits는 DEFAULT_SOURCE_LIMITS와 같은 형식, 일부만 지정 가능)"""
+    global _source_guards
+    merged = {name: dict(values) for name, values in DEFAULT_SOURCE_LIMITS.items()}
+    for name, values in (limits or {}).items():
+        merged.setdefault(name, {}).update(values)
+    _source_guards = {name: SourceGuard(name, failure_threshold=failure_threshold, cool_down=cool_down, **values)
+                      for name, values in merged.items()}
+
+
+def get_source_guard(name):
+    """소스의 SourceGuard를 반환 (configure_source_limits()를 부르지 않았으면 기본 한도로 생성)"""
+    if name not in _source_guards:
+        configure_source_limits()
+    return _source_guards[name]
+
+
+def _checked_get(url, **kwargs):
+    resp = get_session().get(url, **kwargs)
+    resp.raise_for_status()
+    return resp
+
+def parse_pub_date(pub_date_str, parsed=None):
+    """발행일을 시간대 정보가 있는 datetime으로 변환하는 함수 (없거나 파싱 실패 시 None)"""
+    return dates.normalize_pub_date(pub_date_str, parsed)
+
+def is_today_article(pub_date_str):
+    """발행일이 기준 시간대(기본 KST)의 오늘인지 확인하는 함수"""
+    published = parse_pub_date(pub_date_str)
+    if published is None:
+        return True  # 날짜 정보가 없거나 파싱 실패 시 포함
+    return dates.is_today(published)
+
+def _get_timestamp(published):
+    """워터마크 비교용 타임스탬프 (날짜 정보가 없으면 None)"""
+    return published.timestamp() if published is not None else None
 
 def get_date_range_for_naver():
     """네이버 API용 날짜 범위 반환 (오늘)"""
-    today = date.today()
+    today = dates.today()
     return today.strftime('%Y%m%d')
 
-def fetch_naver_news(keyword, client_id, client_secret):
-    # todo 하드코딩 문자열 클래스? 파일? 변수로 변경
-    url = "https://openapi.naver.com/v1/search/news.json"
-    headers = {
-        "X-Naver-Client-Id": client_id,
-        "X-Naver-Client-Secret": client_secret
-    }
+def _fetch_naver_page(url, headers, keyword, start, page_size, timeout):
+    """네이버 뉴스 검색 API 한 페이지(start번째 기사부터 page_size개)를 요청해 응답 JSON을 반환"""
     params = {
         "query": keyword,
-        "display": 20,  # 필터링을 위해 더 많이 가져옴
-        "start": 1,
+        "display": page_size,
+        "start": start,
         "sort": "date"
     }
-    try:
-        resp = requests.get(url, headers=headers, params=params)
-        resp.raise_for_status()
-        data = resp.json()
-        articles = []
-        for item in data.get("items", []):
+    resp = get_source_guard("naver").call(_checked_get, url, headers=headers, params=params, timeout=timeout)
+    return resp.json()
+
+def _estimate_naver_pages(newest_ts, oldest_ts, count, boundary_ts, page_size):
+    """지금까지 받은 기사의 발행 간격으로 boundary_ts까지 덮는 데 필요한 페이지 수를 추정"""
+    if count < 2 or newest_ts is None or oldest_ts is None or newest_ts <= oldest_ts:
+        return 1
+    per_second = (count - 1) / (newest_ts - oldest_ts)
+    return max(1, math.ceil((oldest_ts - boundary_ts) * per_second / page_size))
+
+def fetch_naver_news(keyword, client_id, client_secret, timeout=DEFAULT_REQUEST_TIMEOUT, matcher=None,
+                     watermarks=None, max_pages=None, page_size=None, page_concurrency=None, max_articles=None):
+    """네이버 뉴스 검색 API에서 오늘 기사를 최신순으로 가져오는 함수
+
+    첫 페이지는 최대 크기(100개)로 받아 조용한 키워드는 요청 한 번으로 끝내고,
+    바쁜 키워드는 지금까지 받은 기사의 발행 간격으로 오늘 0시(또는 이전 작업의 워터마크)까지
+    필요한 페이지 수를 추정해 다음 페이지들을 page_concurrency개까지 동시에 요청한다.
+    최신순 정렬이므로 워터마크나 오늘이 아닌 기사에 닿으면 더 이상 페이지를 넘기지 않는다.
+    max_articles(0이면 제한 없음)를 넘으면 그 이후 기사는 가져오지 않는다.
+
+    워터마크는 경계까지 모두 읽었을 때만 올린다. max_articles에 걸리거나 중간 페이지 요청이 실패하면
+    이미 받은 기사만 반환하고 워터마크 대신 내보낸 기사 ID를 기록해, 다음 작업이 그 기사는 건너뛰고
+    읽지 못한 더 오래된 기사까지 이어서 가져온다.
+    """
+    url = NAVER_NEWS_API_URL
+    headers = {
+        "X-Naver-Client-Id": client_id,
+        "X-Naver-Client-Secret": client_secret
+    }
+    max_pages = max_pages or NAVER_PAGING["max_pages"]
+    page_size = min(page_size or NAVER_PAGING["page_size"], NAVER_MAX_DISPLAY)
+    page_concurrency = max(1, page_concurrency or NAVER_PAGING["page_concurrency"])
+    if max_articles is None:
+        max_articles = NAVER_PAGING["max_articles"]
+    if matcher is None:
+        matcher = compile_keywords((keyword,))
+
+    # 이 시각보다 오래된 기사는 오늘 기사가 아니거나 이전 작업에서 처리한 기사
+    boundary_ts = dates.start_of_today().timestamp()
+    mark = watermarks.get("naver", keyword) if watermarks is not None else None
+    if mark is not None:
+        boundary_ts = max(boundary_ts, mark[0])
+
+    articles = []
+    newest = None
+    oldest_ts = None
+    seen = 0
+    partial = False
+
+    def read_page(items):
+        """한 페이지의 기사를 처리하고, 더 오래된 페이지를 볼 필요가 없으면 True를 반환"""
+        nonlocal newest, oldest_ts, seen, partial
+        for item in items:
+            # 발행일 확인 (네이버는 pubDate 필드)
+            published = parse_pub_date(item.get("pubDate", ""))
+            timestamp = _get_timestamp(published)
+            entry_id = item["originallink"] or item["link"]
+            if watermarks is not None and watermarks.is_seen("naver", keyword, timestamp, entry_id):
+                return True  # 이후 기사는 모두 이전 작업에서 처리됨
+            if newest is None and timestamp is not None:
+                newest = (timestamp, entry_id)
+            if published is not None and not dates.is_today(published):
+                return True  # 오늘이 아닌 기사부터는 모두 더 오래된 기사
+            seen += 1
+            if timestamp is not None:
+                oldest_ts = timestamp
+            if watermarks is not None and watermarks.has_seen("naver", keyword, entry_id):
+                continue  # 이전 작업이 도중에 멈추기 전에 내보낸 기사
+
             # HTML 태그 제거
             title = item["title"].replace("<b>", "").replace("</b>", "")
             content = item["description"].replace("<b>", "").replace("</b>", "")
-            
-            # 발행일 확인 (네이버는 pubDate 필드)
-            pub_date = item.get("pubDate", "")
-            if not is_today_article(pub_date):
-                continue  # 오늘이 아닌 기사는 건너뛰기
-            
-            # 키워드가 제목 또는 내용에 포함되어 있는지 확인 (대소문자 무시)
-            if (keyword.lower() in title.lower() or 
-                keyword.lower() in content.lower()):
-                articles.append({
-                    "title": title,
-                    "url": item["originallink"] or item["link"],
-                    "content": content,
-                    "source": "Naver News",
-                    "language": "ko"
-                })
-        return articles[:10]  # 최대 10개로 제한
+
+            # 검색 키워드가 제목 또는 내용에 포함되어 있는지 확인 (대소문자 무시)
+            matched_keywords = matcher.match(title, content)
+            if keyword in matched_keywords:
+                articles.append(Article(
+                    title=title,
+                    url=entry_id,
+                    content=content,
+                    source="Naver News",
+                    language="ko",
+                    matched_keywords=matched_keywords
+                ))
+                if max_articles and len(articles) >= max_articles:
+                    partial = True
+                    return True
+        return len(items) < page_size
+
+    def fetch_page(start):
+        return _fetch_naver_page(url, headers, keyword, start, page_size, timeout)
+
+    try:
+        data = fetch_page(1)
+        metrics.incr("collect.naver_pages")
+        # API가 넘겨주는 검색 결과 수와 start 상한(1000)을 넘는 페이지는 요청하지 않음
+        last_start = min(int(data.get("total", NAVER_MAX_START)), NAVER_MAX_START, max_pages * page_size)
+        next_start = 1 + page_size
+        reached_end = read_page(data.get("items", []))
+        while not reached_end and next_start <= last_start:
+            wanted = _estimate_naver_pages(newest[0] if newest else None, oldest_ts, seen, boundary_ts, page_size)
+            starts = list(range(next_start, last_start + 1, page_size))[:min(wanted, page_concurrency)]
+            if len(starts) == 1:
+                pages = [fetch_page(starts[0])]
+            else:
+                # 남은 페이지들은 동시에 요청 (요청 속도는 네이버 SourceGuard가 맞춤)
+                with ThreadPoolExecutor(max_workers=len(starts)) as executor:
+                    pages = list(executor.map(fetch_page, starts))
+            metrics.incr("collect.naver_pages", len(pages))
+            for data in pages:
+                reached_end = read_page(data.get("items", []))
+                if reached_end:
+                    break
+            next_start = starts[-1] + page_size
     except requests.exceptions.RequestException as e:
-        print(f"네이버 뉴스 API 요청 오류: {e}")
-        return []
+        # SourceUnavailable(소스 일시 중단/한도 소진)도 여기서 처리하며, 앞 페이지에서 받은 기사는 그대로 반환
+        if not isinstance(e, SourceUnavailable):
+            print(f"네이버 뉴스 API 요청 오류: {e}")
+        partial = True
 
-def fetch_google_rss(keyword):
+    if watermarks is not None:
+        if partial:
+            # 경계까지 읽지 못했으므로 워터마크를 올리면 읽지 않은 기사를 건너뛰게 됨
+            watermarks.mark_seen("naver", keyword, [article["url"] for article in articles])
+        elif newest is not None:
+            watermarks.advance("naver", keyword, *newest)
+    return articles
+
+def fetch_feed_entries(rss_url, timeout=DEFAULT_REQUEST_TIMEOUT, feed_cache=None):
+    """RSS 피드를 내려받아 압축된 엔트리 목록으로 반환하는 함수
+
+    feed_cache가 있으면 조건부 GET을 보내고, 변경이 없으면(304) 파싱 없이 저장된 엔트리를 사용한다.
+    """
+    if feed_cache is not None:
+        return feed_cache.fetch_entries(rss_url, timeout)
+    resp = get_session().get(rss_url, timeout=timeout)
+    resp.raise_for_status()
+    return parse_feed(resp.content)
+
+def fetch_google_rss(keyword, timeout=DEFAULT_REQUEST_TIMEOUT, matcher=None, feed_cache=None, watermarks=None):
+    if matcher is None:
+        matcher = compile_keywords((keyword,))
     encoded_keyword = quote(keyword)
-    rss_url = f"https://news.google.com/rss/search?q={encoded_keyword}&hl=ko&gl=KR&ceid=KR:ko"
-    feed = feedparser.parse(rss_url)
+    rss_url = GOOGLE_NEWS_RSS_URL.format(query=encoded_keyword)
+    try:
+        entries = get_source_guard("google").call(fetch_feed_entries, rss_url, timeout, feed_cache)
+    except SourceUnavailable:
+        return []
+    except requests.exceptions.RequestException as e:
+        print(f"Google News RSS 요청 오류 ({keyword}): {e}")
+        return []
     articles = []
-    for entry in feed.entries:
+    entry_ids = []
+    for entry in entries:
+        # 구글 뉴스는 관련도순이라 발행 시각으로 멈출 수 없으므로 이전 작업이 내보낸 엔트리만 건너뜀
+        if watermarks is not None and watermarks.has_seen("google", keyword, entry["id"]):
+            continue
+
         # 발행일 확인 (RSS는 published 또는 pubDate 필드)
-        pub_date = getattr(entry, 'published', '') or getattr(entry, 'pubDate', '')
-        if not is_today_article(pub_date):
+        published = parse_pub_date(entry["published"], entry.get("published_parsed"))
+        if published is not None and not dates.is_today(published):
             continue  # 오늘이 아닌 기사는 건너뛰기
         
         # 제목과 내용에서 키워드 검색 (대소문자 무시)
-        title = entry.title
-        content = getattr(entry, "summary", "")
+        title = entry["title"]
+        content = entry["summary"]
         
-        # 키워드가 제목 또는 내용에 포함되어 있는지 확인
-        if (keyword.lower() in title.lower() or 
-            keyword.lower() in content.lower()):
-            articles.append({
-                "title": title,
-                "url": entry.link,
-                "content": content,
-                "source": "Google News",
-                "language": "ko"
-            })
-    return articles[:10]  # 최대 10개로 제한
+        # 검색 키워드가 제목 또는 내용에 포함되어 있는지 확인
+        matched_keywords = matcher.match(title, content)
+        if keyword in matched_keywords:
+            articles.append(Article(
+                title=title,
+                url=entry["link"],
+                content=content,
+                source="Google News",
+                language="ko",
+                matched_keywords=matched_keywords
+            ))
+            entry_ids.append(entry["id"])
+            if len(articles) >= 10:  # 최대 10개로 제한 (나머지는 다음 작업에서 가져옴)
+                break
+
+    # 실제로 내보낸 엔트리만 기록
+    if watermarks is not None:
+        watermarks.mark_seen("google", keyword, entry_ids)
+    return articles
 
 def translate_keyword_to_english(keyword):
     """한글 키워드를 영어로 번역하는 딕셔너리 (.env 키워드 기준)"""
@@ -119,54 +388,183 @@ def translate_keyword_to_english(keyword):
         return translation_dict.get(keyword, keyword)
     return keyword
 
-def fetch_bbc_rss(keyword):
-    # 한글 키워드를 영어로 번역
-    english_keyword = translate_keyword_to_english(keyword)
-    
-    # 여러 BBC RSS 피드 사용
-    rss_urls = [
-        "http://feeds.bbci.co.uk/news/rss.xml",  # 전체 뉴스
-        "http://feeds.bbci.co.uk/news/technology/rss.xml",  # 기술
-        "http://feeds.bbci.co.uk/news/business/rss.xml",  # 비즈니스
-        "http://feeds.bbci.co.uk/news/world/rss.xml"  # 세계 뉴스
-    ]
-    
+# 여러 BBC RSS 피드 사용
+BBC_RSS_URLS = [
+    "http://feeds.bbci.co.uk/news/rss.xml",  # 전체 뉴스
+    "http://feeds.bbci.co.uk/news/technology/rss.xml",  # 기술
+    "http://feeds.bbci.co.uk/news/business/rss.xml",  # 비즈니스
+    "http://feeds.bbci.co.uk/news/world/rss.xml"  # 세계 뉴스
+]
+
+def configure_sources(naver_api_url=None, google_rss_url=None, bbc_rss_urls=None):
+    """수집 엔드포인트를 바꾸는 함수 (None이면 기존 값 유지, google_rss_url에는 {query} 자리표시자 필요)"""
+    global NAVER_NEWS_API_URL, GOOGLE_NEWS_RSS_URL, BBC_RSS_URLS
+    if naver_api_url:
+        NAVER_NEWS_API_URL = naver_api_url
+    if google_rss_url:
+        GOOGLE_NEWS_RSS_URL = google_rss_url
+    if bbc_rss_urls:
+        BBC_RSS_URLS = list(bbc_rss_urls)
+
+def configure_naver_paging(page_size=None, max_pages=None, page_concurrency=None, max_articles=None):
+    """네이버 페이지 요청 설정을 바꾸는 함수 (None이면 기존 값 유지)"""
+    for name, value in (("page_size", page_size), ("max_pages", max_pages),
+                        ("page_concurrency", page_concurrency), ("max_articles", max_articles)):
+        if value is not None:
+            NAVER_PAGING[name] = value
+
+class FeedSnapshot:
+    """작업(job) 한 번 동안 RSS 피드를 URL당 한 번만 받아 파싱해 두는 스냅샷 클래스
+
+    source를 지정하면 그 소스의 SourceGuard를 거쳐 다운로드한다.
+    """
+
+    def __init__(self, timeout=DEFAULT_REQUEST_TIMEOUT, feed_cache=None, source=None):
+        self.timeout = timeout
+        self.feed_cache = feed_cache
+        self.source = source
+        self._entries = {}
+        self._locks = {}
+        self._guard = threading.Lock()
+
+    def get_entries(self, rss_url):
+        """피드 엔트리 목록을 반환 (처음 요청될 때만 다운로드/파싱)"""
+        # 여러 스레드가 같은 피드를 동시에 요청해도 다운로드는 한 번만 수행
+        with self._guard:
+            lock = self._locks.setdefault(rss_url, threading.Lock())
+        with lock:
+            if rss_url not in self._entries:
+                try:
+                    if self.source is None:
+                        self._entries[rss_url] = fetch_feed_entries(rss_url, self.timeout, self.feed_cache)
+                    else:
+                        self._entries[rss_url] = get_source_guard(self.source).call(
+                            fetch_feed_entries, rss_url, self.timeout, self.feed_cache)
+                except SourceUnavailable:
+                    self._entries[rss_url] = []
+                except Exception as e:
+                    print(f"RSS 피드 오류 ({rss_url}): {e}")
+                    self._entries[rss_url] = []
+            return self._entries[rss_url]
+
+def fetch_bbc_rss(keywords, snapshot=None, watermarks=None):
+    """BBC 피드의 각 엔트리를 한 번만 스캔해 모든 키워드와 매칭하는 함수"""
+    if isinstance(keywords, str):
+        keywords = [keywords]
+
+    # 한글 키워드는 영어 번역어로 검색
+    matcher = compile_keywords(tuple(keywords), translate_keyword_to_english)
+
+    # 스냅샷이 없으면 이번 호출 전용으로 생성
+    if snapshot is None:
+        snapshot = FeedSnapshot()
+
     articles = []
-    for rss_url in rss_urls:
-        try:
-            feed = feedparser.parse(rss_url)
-            for entry in feed.entries:
-                # 발행일 확인 (RSS는 published 또는 pubDate 필드)
-                pub_date = getattr(entry, 'published', '') or getattr(entry, 'pubDate', '')
-                if not is_today_article(pub_date):
-                    continue  # 오늘이 아닌 기사는 건너뛰기
-                
-                # 제목과 내용에서 키워드 검색
-                title = entry.title.lower()
-                content = getattr(entry, "summary", "").lower()
-                description = getattr(entry, "description", "").lower()
-                
-                # 영어 키워드로 검색
-                if (english_keyword.lower() in title or 
-                    english_keyword.lower() in content or 
-                    english_keyword.lower() in description):
-                    articles.append({
-                        "title": entry.title,
-                        "url": entry.link,
-                        "content": getattr(entry, "summary", ""),
-                        "source": "BBC",
-                        "language": "en"
-                    })
-        except Exception as e:
-            print(f"BBC RSS 피드 오류 ({rss_url}): {e}")
-            continue
-    
+    for rss_url in BBC_RSS_URLS:
+        entry_ids = []
+        for entry in snapshot.get_entries(rss_url):
+            # BBC 피드는 날짜순이 보장되지 않으므로 이전 작업이 내보낸 엔트리만 건너뜀
+            if watermarks is not None and watermarks.has_seen("bbc", rss_url, entry["id"]):
+                continue
+
+            # 발행일 확인 (RSS는 published 또는 pubDate 필드)
+            published = parse_pub_date(entry["published"], entry.get("published_parsed"))
+            if published is not None and not dates.is_today(published):
+                continue  # 오늘이 아닌 기사는 건너뛰기
+
+            # 제목과 내용에서 키워드 검색
+            matched_keywords = matcher.match(entry["title"], entry["summary"], entry["description"])
+            if matched_keywords:
+                articles.append(Article(
+                    title=entry["title"],
+                    url=entry["link"],
+                    content=entry["summary"],
+                    source="BBC",
+                    language="en",
+                    matched_keywords=matched_keywords
+                ))
+                entry_ids.append(entry["id"])
+
+        if watermarks is not None:
+            watermarks.mark_seen("bbc", rss_url, entry_ids)
+
     return articles
 
-def fetch_all_news(keywords, client_id, client_secret):
-    all_articles = []
+def _limited(semaphore, span_name, label, func, *args):
+    """소스별 세마포어로 동시 실행 수를 제한해 함수를 호출하고 소요 시간을 기록"""
+    with semaphore, metrics.span(span_name, label):
+        return func(*args)
+
+def _start_fetches(keywords, client_id, client_secret, timeout, source_concurrency, feed_cache, watermarks,
+                   quota_store=None):
+    """모든 (소스, 키워드) 수집 작업을 스레드 풀에 제출하고 (executor, futures)를 반환"""
+    # 이전 작업의 차단 상태는 가져오지 않고, 하루 사용량은 quota_store에 이어서 기록
+    for name in DEFAULT_SOURCE_CONCURRENCY:
+        get_source_guard(name).reset(quota_store)
+
+    limits = dict(DEFAULT_SOURCE_CONCURRENCY)
+    limits.update(source_concurrency or {})
+    semaphores = {name: threading.Semaphore(limit) for name, limit in limits.items()}
+
+    # 키워드 매처는 한 번만 컴파일해 모든 소스에서 공유
+    matcher = compile_keywords(tuple(keywords))
+
+    # BBC 피드는 키워드와 무관하므로 작업당 한 번만 받아 모든 키워드에 재사용
+    bbc_snapshot = FeedSnapshot(timeout, feed_cache, source="bbc")
+
+    executor = ThreadPoolExecutor(max_workers=sum(limits.values()))
+    futures = []
+
+    # BBC 피드들은 미리 병렬로 받아 두고, 매칭 작업은 스냅샷에서 결과를 기다림
+    for rss_url in BBC_RSS_URLS:
+        executor.submit(_limited, semaphores["bbc"], "fetch.bbc_feed", rss_url, bbc_snapshot.get_entries, rss_url)
+
     for kw in keywords:
-        all_articles += fetch_naver_news(kw, client_id, client_secret)
-        all_articles += fetch_google_rss(kw)
-        all_articles += fetch_bbc_rss(kw)
-    return all_articles
\ No newline at end of file
+        futures.append(executor.submit(_limited, semaphores["naver"], "collect.naver", kw, fetch_naver_news,
+                                       kw, client_id, client_secret, timeout, matcher, watermarks))
+        futures.append(executor.submit(_limited, semaphores["google"], "collect.google", kw, fetch_google_rss,
+                                       kw, timeout, matcher, feed_cache, watermarks))
+    # BBC는 피드 엔트리를 한 번만 스캔해 모든 키워드를 동시에 매칭
+    futures.append(executor.submit(_limited, semaphores["bbc"], "collect.bbc", None, fetch_bbc_rss,
+                                   keywords, bbc_snapshot, watermarks))
+    return executor, futures
+
+def iter_all_news(keywords, client_id, client_secret,
+                  timeout=DEFAULT_REQUEST_TIMEOUT,
+                  deadline=DEFAULT_COLLECT_DEADLINE,
+                  source_concurrency=None,
+                  feed_cache=None,
+                  watermarks=None,
+                  quota_store=None):
+    """모든 (소스, 키워드) 조합을 병렬로 수집하고, 요청이 끝나는 대로 기사를 하나씩 내보내는 제너레이터
+
+    URL이 같은 기사의 병합은 하지 않으므로 소비하는 쪽에서 처리해야 한다 (pipeline.normalize_articles).
+    마감 시각까지 끝나지 않은 요청만 버리며, 소비하는 쪽이 느려서 늦게 꺼내는 결과는 유지한다.
+    feed_cache(FeedHttpCache)를 넘기면 RSS 피드를 조건부 GET으로 가져오고,
+    watermarks(WatermarkStore)를 넘기면 이전 작업에서 처리한 기사는 건너뛰고,
+    quota_store(QuotaStore)를 넘기면 소스별 하루 요청 수를 작업 사이에도 이어서 센다.
+    """
+    executor, futures = _start_fetches(keywords, client_id, client_secret, timeout,
+                                       source_concurrency, feed_cache, watermarks, quota_store)
+    end_time = time.monotonic() + deadline
+    pending = set(futures)
+    try:
+        while pending:
+            done, pending = wait(pending, timeout=max(0, end_time - time.monotonic()),
+                                 return_when=FIRST_COMPLETED)
+            if not done:
+                print(f"수집 마감 시간({deadline}초) 초과: {len(pending)}개 요청 결과 제외")
+                metrics.incr("collect.timed_out", len(pending))
+                break
+            for future in done:
+                try:
+                    articles = future.result()
+                except Exception as e:
+                    print(f"뉴스 수집 오류: {e}")
+                    metrics.incr("collect.errors")
+                    continue
+                yield from articles
+    finally:
+        if watermarks is not None:
+            watermarks.freeze()
+        executor.shutdown(wait=False, cancel_futures=True)
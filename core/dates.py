@@ -0,0 +1,109 @@
+import re
+import calendar
+from datetime import datetime, timezone, timedelta
+from functools import lru_cache
+from zoneinfo import ZoneInfo
+
+# 기사가 '오늘' 기사인지 판단하는 기준 시간대 (set_report_timezone()으로 변경)
+_report_tz = ZoneInfo("Asia/Seoul")
+
+# RFC 822/1123 형식 (예: "Sun, 24 Aug 2025 09:30:00 +0900", "24 Aug 2025 00:30 GMT")
+_RFC822_PATTERN = re.compile(
+    r'^\s*(?:[A-Za-z]{3},\s*)?(\d{1,2})\s+([A-Za-z]{3})\s+(\d{2,4})\s+'
+    r'(\d{1,2}):(\d{2})(?::(\d{2}))?\s*([+-]\d{4}|[A-Za-z]{1,3})?\s*$'
+)
+_MONTHS = {name.lower(): index for index, name in enumerate(calendar.month_abbr) if name}
+_ZONE_OFFSETS = {
+    "GMT": 0, "UT": 0, "UTC": 0, "Z": 0,
+    "EST": -5, "EDT": -4, "CST": -6, "CDT": -5, "MST": -7, "MDT": -6, "PST": -8, "PDT": -7,
+    "KST": 9
+}
+
+
+def set_report_timezone(name):
+    """'오늘' 판단 기준 시간대를 설정하는 함수 (예: "Asia/Seoul")"""
+    global _report_tz
+    _report_tz = ZoneInfo(name)
+    parse_date_string.cache_clear()
+
+
+def get_report_timezone():
+    """현재 기준 시간대를 반환"""
+    return _report_tz
+
+
+def today():
+    """기준 시간대의 오늘 날짜를 반환"""
+    return datetime.now(_report_tz).date()
+
+
+def start_of_today():
+    """기준 시간대의 오늘 0시를 시간대 정보가 있는 datetime으로 반환"""
+    return datetime.combine(today(), datetime.min.time(), tzinfo=_report_tz)
+
+
+def _parse_rfc822(value):
+    match = _RFC822_PATTERN.match(value)
+    if match is None:
+        return None
+    day, month_name, year, hour, minute, second, zone = match.groups()
+    month = _MONTHS.get(month_name.lower())
+    if month is None:
+        return None
+    year = int(year)
+    if year < 100:
+        year += 2000 if year < 70 else 1900
+
+    if zone is None:
+        tzinfo = _report_tz
+    elif zone[0] in "+-":
+        offset = int(zone[1:3]) * 60 + int(zone[3:5])
+        tzinfo = timezone(timedelta(minutes=offset if zone[0] == "+" else -offset))
+    elif zone.upper() in _ZONE_OFFSETS:
+        tzinfo = timezone(timedelta(hours=_ZONE_OFFSETS[zone.upper()]))
+    else:
+        return None
+    return datetime(year, month, int(day), int(hour), int(minute), int(second or 0), tzinfo=tzinfo)
+
+
+@lru_cache(maxsize=4096)
+def parse_date_string(value):
+    """날짜 문자열을 시간대 정보가 있는 datetime으로 변환 (같은 문자열은 캐시된 결과 사용)
+
+    RFC 822 → ISO 8601 → dateutil 순서로 시도하며, 시간대 정보가 없으면 기준 시간대로 간주한다.
+    """
+    try:
+        published = _parse_rfc822(value)
+        if published is None:
+            try:
+                published = datetime.fromisoformat(value.strip())
+            except ValueError:
+                # 마지막 수단으로 느리지만 유연한 dateutil 사용 (필요할 때만 import)
+                from dateutil import parser
+                published = parser.parse(value)
+    except (ValueError, TypeError, OverflowError):
+        return None
+
+    if published.tzinfo is None:
+        published = published.replace(tzinfo=_report_tz)
+    return published
+
+
+def normalize_pub_date(value, parsed=None):
+    """피드 발행일을 시간대 정보가 있는 datetime으로 정규화하는 함수 (없거나 실패 시 None)
+
+    feedparser가 이미 파싱해 둔 UTC 기준 published_parsed가 있으면 문자열 파싱 없이 사용한다.
+    """
+    if parsed:
+        try:
+            return datetime(*tuple(parsed)[:6], tzinfo=timezone.utc)
+        except (TypeError, ValueError):
+            pass
+    if not value:
+        return None
+    return parse_date_string(value)
+
+
+def is_today(published):
+    """정규화된 발행일이 기준 시간대의 오늘인지 확인하는 함수"""
+    return published.astimezone(_report_tz).date() == today()
@@ -0,0 +1,69 @@
+import math
+import hashlib
+
+_MASK64 = (1 << 64) - 1
+
+
+def _mix64(value):
+    """splitmix64 마무리 단계로 64비트 정수의 비트를 골고루 섞는 함수"""
+    value = (value ^ (value >> 30)) * 0xBF58476D1CE4E5B9 & _MASK64
+    value = (value ^ (value >> 27)) * 0x94D049BB133111EB & _MASK64
+    return value ^ (value >> 31)
+
+
+class BloomFilter:
+    """고정 크기 비트 배열 기반의 블룸 필터 클래스 (거짓 양성만 있고 거짓 음성은 없음)"""
+
+    def __init__(self, capacity, error_rate=0.001, num_bits=None, num_hashes=None, bits=None):
+        capacity = max(1, capacity)
+        if num_bits is None:
+            num_bits = max(8, int(math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))))
+        if num_hashes is None:
+            num_hashes = max(1, int(round(num_bits / capacity * math.log(2))))
+        self.num_bits = num_bits
+        self.num_hashes = num_hashes
+        self.bits = bytearray(bits) if bits is not None else bytearray((num_bits + 7) // 8)
+
+    def _positions(self, item):
+        if isinstance(item, int):
+            # 정수 ID는 이미 64비트 해시이므로 그대로 쓰고, 두 번째 해시는 splitmix64로 섞어서 만듦
+            h1 = item & _MASK64
+            h2 = _mix64(h1) | 1
+        else:
+            # 128비트 해시 하나를 둘로 나눠 이중 해싱(double hashing)으로 k개의 위치를 만듦
+            digest = hashlib.blake2b(str(item).encode(), digest_size=16).digest()
+            h1 = int.from_bytes(digest[:8], 'little')
+            h2 = int.from_bytes(digest[8:], 'little') | 1
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+
+    def add(self, item):
+        """항목을 필터에 추가"""
+        for position in self._positions(item):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, item):
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+
+class DedupIndex:
+    """여러 날의 발송 기록으로 중복 여부를 확인하는 인덱스 클래스
+
+    최근 며칠은 정확한 ID 집합으로, 그보다 오래된 날은 날짜별 블룸 필터로 확인한다.
+    filter_new_articles()의 sent_set 자리에 그대로 넣어 쓸 수 있도록 `in`과 add()를 지원한다.
+    """
+
+    def __init__(self, exact_ids=None, blooms=None):
+        self.exact_ids = set(exact_ids or ())
+        self.blooms = list(blooms or ())
+
+    def add(self, article_id):
+        """새로 발송할 기사 ID를 추가"""
+        self.exact_ids.add(article_id)
+
+    def __contains__(self, article_id):
+        if article_id in self.exact_ids:
+            return True
+        return any(article_id in bloom for bloom in self.blooms)
+
+    def __len__(self):
+        return len(self.exact_ids)
@@ -1,7 +1,47 @@
 import os
+import re
 import html
 from datetime import datetime
-from core.summarizer import summarize_to_korean
+from core import metrics
+
+# {{name}} 형태의 자리표시자
+_PLACEHOLDER_PATTERN = re.compile(r'\{\{(\w+)\}\}')
+
+
+class CompiledTemplate:
+    """템플릿을 리터럴 조각과 자리표시자 이름으로 한 번만 나눠 둔 클래스
+
+    렌더링은 조각과 값을 출력 버퍼에 차례로 넣기만 하므로 템플릿을 다시 훑지 않고,
+    넣은 값 안에 자리표시자처럼 보이는 문자열이 있어도 치환되지 않는다.
+    """
+
+    __slots__ = ('literals', 'names')
+
+    def __init__(self, source):
+        parts = _PLACEHOLDER_PATTERN.split(source)
+        self.literals = parts[0::2]
+        self.names = parts[1::2]
+
+    def render_into(self, out, values):
+        """출력 버퍼(list)에 렌더링 결과를 이어 붙임 (값이 callable이면 버퍼를 넘겨 직접 쓰게 함)"""
+        literals = self.literals
+        for index, name in enumerate(self.names):
+            out.append(literals[index])
+            if name not in values:
+                out.append('{{' + name + '}}')  # 값이 없는 자리표시자는 그대로 둠
+                continue
+            value = values[name]
+            if callable(value):
+                value(out)
+            else:
+                out.append(str(value))
+        out.append(literals[-1])
+
+    def render(self, values):
+        """렌더링 결과를 문자열로 반환"""
+        out = []
+        self.render_into(out, values)
+        return ''.join(out)
 
 
 class EmailTemplateRenderer:
@@ -10,6 +50,7 @@ class EmailTemplateRenderer:
     def __init__(self):
         self.templates_dir = os.path.join(os.path.dirname(__file__), '..', 'templates')
         self._template_cache = {}
+        self._compiled_cache = {}
     
     def load_template(self, template_name):
         """HTML 템플릿 파일을 로드하는 메서드 (캐싱 포함)"""
@@ -21,91 +62,130 @@ class EmailTemplateRenderer:
             content = file.read()
             self._template_cache[template_name] = content
             return content
+
+    def compile_template(self, template_content):
+        """템플릿 문자열을 컴파일하는 메서드 (같은 내용은 한 번만 컴파일)"""
+        compiled = self._compiled_cache.get(template_content)
+        if compiled is None:
+            compiled = CompiledTemplate(template_content)
+            self._compiled_cache[template_content] = compiled
+        return compiled
+
+    def get_template(self, template_name):
+        """이름으로 컴파일된 템플릿을 가져오는 메서드"""
+        return self.compile_template(self.load_template(template_name))
     
     def render_template(self, template_content, **kwargs):
-        """템플릿에 데이터를 주입하는 렌더링 메서드"""
-        for key, value in kwargs.items():
-            placeholder = f"{{{{{key}}}}}"
-            template_content = template_content.replace(placeholder, str(value))
-        return template_content
+        """템플릿에 데이터를 주입하는 렌더링 메서드 (한 번의 결합으로 렌더링)"""
+        return self.compile_template(template_content).render(kwargs)
     
-    def generate_content_section(self, news, client):
-        """뉴스 언어에 따라 적절한 컨텐츠 섹션을 생성하는 메서드"""
+    def generate_content_section(self, news):
+        """뉴스 언어에 따라 적절한 컨텐츠 섹션을 생성하는 메서드 (요약은 미리 생성된 값을 사용)"""
+        out = []
+        self._write_content_section(out, news)
+        return ''.join(out)
+
+    def _write_content_section(self, out, news):
         if news["language"] == "en":
-            template = self.load_template('content_english.html')
-            summary = summarize_to_korean(client, news["content"])
-            return self.render_template(
-                template,
-                summary=summary,
-                original_content=self._clean_html_entities(self._truncate_content(news['content']))
-            )
+            self.get_template('content_english.html').render_into(out, {
+                'summary': news.get("summary", ""),
+                'original_content': self._clean_html_entities(self._truncate_content(news['content']))
+            })
         else:
-            template = self.load_template('content_korean.html')
-            return self.render_template(
-                template,
-                content=self._clean_html_entities(self._truncate_content(news['content']))
-            )
+            self.get_template('content_korean.html').render_into(out, {
+                'content': self._clean_html_entities(self._truncate_content(news['content']))
+            })
     
-    def generate_news_item(self, news, client):
+    def generate_news_item(self, news):
         """개별 뉴스 아이템을 생성하는 메서드"""
-        template = self.load_template('news_item.html')
-        content_section = self.generate_content_section(news, client)
-        
-        return self.render_template(
-            template,
-            title=self._clean_html_entities(news['title']),
-            url=news['url'],
-            content_section=content_section
+        out = []
+        self._write_news_item(out, news)
+        return ''.join(out)
+
+    def _write_news_item(self, out, news):
+        self.get_template('news_item.html').render_into(out, {
+            'title': self._clean_html_entities(news['title']),
+            'url': news['url'],
+            'alternate_sources': self.generate_alternate_sources(news),
+            'content_section': lambda buffer: self._write_content_section(buffer, news)
+        })
+
+    def generate_alternate_sources(self, news):
+        """같은 스토리로 묶인 다른 출처 링크 목록을 생성하는 메서드"""
+        alternates = news.get('alternate_sources')
+        if not alternates:
+            return ""
+        links = ', '.join(
+            f'<a href="{alternate["url"]}" style="color: #888;">'
+            f'{self._get_source_info(alternate["source"])["display_name"]}</a>'
+            for alternate in alternates
         )
+        return self.get_template('alternate_sources.html').render({'links': links})
     
-    def generate_news_section(self, source_name, source_news, client):
+    def generate_news_section(self, source_name, source_news):
         """특정 소스의 뉴스 섹션을 생성하는 메서드"""
-        template = self.load_template('news_section.html')
-        
-        # 각 뉴스 아이템 생성
-        news_items = []
-        for news in source_news:
-            news_item = self.generate_news_item(news, client)
-            news_items.append(news_item)
-        
+        out = []
+        self._write_news_section(out, source_name, source_news)
+        return ''.join(out)
+
+    def _write_news_section(self, out, source_name, source_news):
+        def write_news_items(buffer):
+            # 각 뉴스 아이템을 같은 출력 버퍼에 바로 렌더링
+            for news in source_news:
+                self._write_news_item(buffer, news)
+
+        self._write_section_frame(out, source_name, len(source_news), write_news_items)
+
+    def _write_section_frame(self, out, source_name, news_count, write_news_items):
         # 소스별 아이콘과 표시명 매핑
         source_info = self._get_source_info(source_name)
-        
-        return self.render_template(
-            template,
-            source_name=source_name,
-            source_icon=source_info['icon'],
-            source_display_name=source_info['display_name'],
-            news_count=len(source_news),
-            news_items=''.join(news_items)
-        )
+        self.get_template('news_section.html').render_into(out, {
+            'source_name': source_name,
+            'source_icon': source_info['icon'],
+            'source_display_name': source_info['display_name'],
+            'news_count': news_count,
+            'news_items': write_news_items
+        })
     
-    def generate_news_sections(self, news_by_source, client):
+    def generate_news_sections(self, news_by_source):
         """모든 뉴스 섹션들을 생성하는 메서드"""
-        news_sections = []
-        for source, source_news in news_by_source.items():
-            section = self.generate_news_section(source, source_news, client)
-            news_sections.append(section)
-        return news_sections
+        return [self.generate_news_section(source, source_news)
+                for source, source_news in news_by_source.items()]
     
-    def generate_email_html(self, news_list, news_by_source, client):
-        """완전한 이메일 HTML을 생성하는 메서드"""
-        template = self.load_template('news_email.html')
-        news_sections = self.generate_news_sections(news_by_source, client)
+    def generate_email_html(self, news_list, news_by_source):
+        """완전한 이메일 HTML을 생성하는 메서드 (모든 섹션을 하나의 출력 버퍼로 렌더링)"""
+        def write_news_sections(buffer):
+            for source, source_news in news_by_source.items():
+                self._write_news_section(buffer, source, source_news)
+
+        return self._render_email(len(news_list), len(news_by_source), write_news_sections)
+
+    def generate_email_html_from_items(self, items_by_source):
+        """소스별로 미리 렌더링해 둔 뉴스 아이템 HTML 조각들로 이메일 HTML을 생성하는 메서드"""
+        def write_news_sections(buffer):
+            for source, items in items_by_source.items():
+                self._write_section_frame(buffer, source, len(items), lambda out, items=items: out.extend(items))
+
+        total_count = sum(len(items) for items in items_by_source.values())
+        return self._render_email(total_count, len(items_by_source), write_news_sections)
+
+    def _render_email(self, total_count, source_count, write_news_sections):
         current_datetime = datetime.now()
-        
-        return self.render_template(
-            template,
-            current_date=current_datetime.strftime('%Y년 %m월 %d일 %H:%M'),
-            current_time=current_datetime.strftime('%Y-%m-%d %H:%M:%S'),
-            total_count=len(news_list),
-            source_count=len(news_by_source),
-            news_sections=''.join(news_sections)
-        )
+        out = []
+        with metrics.span("render.email"):
+            self.get_template('news_email.html').render_into(out, {
+                'current_date': current_datetime.strftime('%Y년 %m월 %d일 %H:%M'),
+                'current_time': current_datetime.strftime('%Y-%m-%d %H:%M:%S'),
+                'total_count': total_count,
+                'source_count': source_count,
+                'news_sections': write_news_sections
+            })
+            return ''.join(out)
     
     def clear_cache(self):
         """템플릿 캐시를 지우는 메서드"""
         self._template_cache.clear()
+        self._compiled_cache.clear()
     
     def _truncate_content(self, content, max_length=500):
         """컨텐츠를 지정된 길이로 자르는 유틸리티 메서드"""
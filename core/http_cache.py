@@ -0,0 +1,191 @@
+import json
+import sqlite3
+import threading
+import time
+import multiprocessing
+import requests
+from requests.adapters import HTTPAdapter
+from core import metrics
+
+# 모든 수집기가 공유하는 keep-alive 세션 (호스트별 연결 풀 재사용)
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session(pool_size=32):
+    """수집기 전체에서 공유하는 requests.Session을 반환하는 함수 (처음 호출 시 생성)"""
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=16, pool_maxsize=pool_size)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _session = session
+        return _session
+
+
+# 압축된 엔트리의 필드 순서 (프로세스 풀에서는 이 순서의 튜플로 주고받음)
+ENTRY_FIELDS = ("id", "title", "link", "summary", "description", "published", "published_parsed")
+
+# 이보다 작은 피드는 프로세스 간 전송 비용이 파싱보다 커서 현재 프로세스에서 파싱
+MIN_POOL_PARSE_BYTES = 16 * 1024
+
+# 피드 파싱 프로세스 풀 (configure_feed_parsing()으로 작업 프로세스 수 설정, 0이면 현재 프로세스에서 파싱)
+# shutdown_feed_parsing() 뒤에는 다시 설정할 때까지 풀을 만들지 않음
+_parse_workers = 0
+_parse_pool = None
+_parse_pool_closed = False
+_parse_pool_lock = threading.Lock()
+
+
+def entry_tuple(entry):
+    """feedparser 엔트리에서 수집에 필요한 필드만 ENTRY_FIELDS 순서의 튜플로 뽑는 함수"""
+    published_parsed = entry.get("published_parsed")
+    return (
+        entry.get("id", "") or entry.get("link", ""),
+        entry.get("title", ""),
+        entry.get("link", ""),
+        entry.get("summary", ""),
+        entry.get("description", ""),
+        entry.get("published", "") or entry.get("pubDate", ""),
+        # feedparser가 UTC로 파싱해 둔 발행일 (날짜 문자열을 다시 파싱하지 않도록 보관)
+        list(published_parsed[:6]) if published_parsed else None
+    )
+
+
+def parse_feed_tuples(content):
+    """피드 본문을 파싱해 엔트리 튜플 목록으로 반환하는 함수 (프로세스 풀 작업 함수)"""
+    import feedparser  # 첫 파싱 때 import (시작 시간 단축)
+    return [entry_tuple(entry) for entry in feedparser.parse(content).entries]
+
+
+def configure_feed_parsing(workers):
+    """피드 파싱에 쓸 작업 프로세스 수를 설정하는 함수 (0이면 현재 프로세스에서 파싱, 풀은 처음 쓸 때 생성)
+
+    shutdown_feed_parsing()으로 닫은 풀도 이 함수를 다시 불러야 새로 만든다 (작업마다 시작할 때 호출).
+    """
+    global _parse_workers, _parse_pool_closed
+    shutdown_feed_parsing()
+    with _parse_pool_lock:
+        _parse_workers = max(0, int(workers))
+        _parse_pool_closed = False
+
+
+def _get_parse_pool():
+    global _parse_pool
+    with _parse_pool_lock:
+        if _parse_pool is None and _parse_workers and not _parse_pool_closed:
+            from concurrent.futures import ProcessPoolExecutor
+            # 수집 스레드가 도는 중에 만들어지므로 fork 대신 spawn으로 작업 프로세스를 띄움
+            _parse_pool = ProcessPoolExecutor(max_workers=_parse_workers,
+                                              mp_context=multiprocessing.get_context("spawn"))
+        return _parse_pool
+
+
+def shutdown_feed_parsing():
+    """피드 파싱 프로세스 풀을 종료하는 함수
+
+    마감 뒤 늦게 끝난 수집 스레드가 풀을 다시 띄우지 않도록, configure_feed_parsing()을
+    다시 부를 때까지는 풀 없이 현재 프로세스에서 파싱한다.
+    """
+    global _parse_pool, _parse_pool_closed
+    with _parse_pool_lock:
+        pool, _parse_pool = _parse_pool, None
+        _parse_pool_closed = True
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def parse_feed(content):
+    """피드 본문을 파싱해 압축된 엔트리 목록으로 반환하는 함수
+
+    프로세스 풀이 설정되어 있으면 큰 피드는 작업 프로세스에서 파싱하고 엔트리 튜플만 돌려받으므로,
+    여러 스레드가 받은 피드를 여러 코어에서 동시에 파싱한다.
+    """
+    pool = _get_parse_pool() if len(content) >= MIN_POOL_PARSE_BYTES else None
+    future = None
+    if pool is not None:
+        try:
+            future = pool.submit(parse_feed_tuples, content)
+        except RuntimeError:
+            # 풀을 받은 뒤 작업이 끝나 풀이 닫혔으면 현재 프로세스에서 파싱
+            future = None
+    if future is None:
+        entries = parse_feed_tuples(content)
+    else:
+        from concurrent.futures.process import BrokenProcessPool
+        try:
+            with metrics.span("feed.parse_pool"):
+                entries = future.result()
+        except BrokenProcessPool:
+            # 작업 프로세스가 죽었으면 이번 작업에서는 풀을 닫고 현재 프로세스에서 파싱
+            print("피드 파싱 프로세스 풀 오류, 현재 프로세스에서 파싱")
+            shutdown_feed_parsing()
+            entries = parse_feed_tuples(content)
+    return [dict(zip(ENTRY_FIELDS, entry)) for entry in entries]
+
+
+class FeedHttpCache:
+    """피드 URL별 ETag/Last-Modified와 파싱된 엔트리를 보관해 조건부 요청을 보내는 캐시 클래스
+
+    서버가 304 Not Modified로 응답하면 본문을 받지도 파싱하지도 않고 저장해 둔 엔트리를 반환한다.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.not_modified = 0
+        self.downloaded = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS feed_cache (
+                url TEXT PRIMARY KEY,
+                etag TEXT,
+                last_modified TEXT,
+                entries TEXT NOT NULL,
+                fetched_at REAL NOT NULL
+            )"""
+        )
+        self._conn.commit()
+
+    def fetch_entries(self, url, timeout):
+        """조건부 GET으로 피드를 가져와 압축된 엔트리 목록을 반환"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT etag, last_modified, entries FROM feed_cache WHERE url = ?", (url,)
+            ).fetchone()
+
+        headers = {}
+        if row is not None:
+            if row[0]:
+                headers["If-None-Match"] = row[0]
+            if row[1]:
+                headers["If-Modified-Since"] = row[1]
+
+        resp = get_session().get(url, headers=headers, timeout=timeout)
+        if resp.status_code == 304 and row is not None:
+            self.not_modified += 1
+            return json.loads(row[2])
+
+        resp.raise_for_status()
+        entries = parse_feed(resp.content)
+        self.downloaded += 1
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO feed_cache (url, etag, last_modified, entries, fetched_at) VALUES (?, ?, ?, ?, ?)",
+                (url, resp.headers.get("ETag"), resp.headers.get("Last-Modified"),
+                 json.dumps(entries, ensure_ascii=False), time.time())
+            )
+            self._conn.commit()
+        return entries
+
+    def stats(self):
+        """304 응답 수와 실제 다운로드 수를 반환"""
+        return {"not_modified": self.not_modified, "downloaded": self.downloaded}
+
+    def close(self):
+        """데이터베이스 연결을 닫음"""
+        with self._lock:
+            self._conn.close()
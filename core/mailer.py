@@ -1,6 +1,14 @@
-import yagmail
-from datetime import datetime
+import json
+import queue
+import random
+import smtplib
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from email.message import EmailMessage
+from email.utils import formatdate
+from core import metrics
 from core.email_template_renderer import EmailTemplateRenderer
 
 def classify_news_by_source(news_list):
@@ -13,47 +21,183 @@ def classify_news_by_source(news_list):
         news_by_source[source].append(news)
     return news_by_source
 
-def send_email_with_retry(html_content, gmail_address, app_password, recipient, news_count):
-    """재시도 로직을 포함한 이메일 발송 함수"""
-    max_retries = 3
-    retry_count = 0
-    current_datetime = datetime.now()
-    
-    while retry_count < max_retries:
-        try:
-            yag = yagmail.SMTP(gmail_address, app_password)
-            yag.send(
-                to=recipient,
-                subject=f"📰 [뉴스 요약] {current_datetime.strftime('%Y-%m-%d %H:%M')} - {news_count}건",
-                contents=html_content,
-                prettify_html=False  # CSS 오류 방지
-            )
-            yag.close()
-            print(f"{datetime.now()} - 뉴스 발송 완료: {news_count}건")
-            return True
-            
-        except Exception as e:
-            retry_count += 1
-            print(f"{datetime.now()} - 이메일 발송 실패 (시도 {retry_count}/{max_retries}): {e}")
-            if retry_count < max_retries:
-                print(f"{datetime.now()} - 5초 후 재시도...")
-                time.sleep(5)
+def backoff_delay(attempt, base_delay=1.0, max_delay=30.0):
+    """attempt번째 재시도 전에 기다릴 시간(초): 지수적으로 늘리되 절반은 무작위(지터)로 흩뜨림"""
+    delay = min(max_delay, base_delay * 2 ** (attempt - 1))
+    return delay / 2 + random.uniform(0, delay / 2)
+
+def digest_subject(news_count):
+    """뉴스 이메일 제목을 만드는 함수"""
+    return f"📰 [뉴스 요약] {datetime.now().strftime('%Y-%m-%d %H:%M')} - {news_count}건"
+
+class SmtpMailer:
+    """인증된 SMTP 연결을 작은 풀로 유지하며 여러 메시지를 보내는 클래스
+
+    연결은 처음 필요할 때 만들어 다음 메시지에 재사용하고 실패했을 때만 다시 연결하며,
+    재시도 사이에는 지터를 섞은 지수 백오프로 기다린다.
+    security는 "ssl"(SMTP over TLS), "starttls", "none" 중 하나이다.
+    """
+
+    def __init__(self, host, port, username=None, password=None, sender=None, security="ssl",
+                 pool_size=1, max_retries=3, base_delay=1.0, max_delay=30.0, timeout=30):
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.sender = sender or username
+        self.security = security
+        self.pool_size = max(1, pool_size)
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.timeout = timeout
+        self.connects = 0
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(self.pool_size)
+
+    def _connect(self):
+        with metrics.span("smtp.connect"):
+            if self.security == "ssl":
+                connection = smtplib.SMTP_SSL(self.host, self.port, timeout=self.timeout)
             else:
-                print(f"{datetime.now()} - 이메일 발송 최종 실패")
-                return False
-
-def send_news_email(news_list, client, gmail_address, app_password, recipient):
-    """뉴스 이메일 발송 메인 함수"""
-    if not news_list:
-        print(f"{datetime.now()} - 발송할 새 뉴스 없음")
-        return
-
-    # 1. 뉴스를 소스별로 분류
-    news_by_source = classify_news_by_source(news_list)
-    
-    # 2. 템플릿 렌더러 생성 및 HTML 컨텐츠 생성
-    template_renderer = EmailTemplateRenderer()
-    html_content = template_renderer.generate_email_html(news_list, news_by_source, client)
-    
-    # 3. 이메일 발송
-    send_email_with_retry(html_content, gmail_address, app_password, recipient, len(news_list))
\ No newline at end of file
+                connection = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+                if self.security == "starttls":
+                    connection.starttls()
+            if self.username:
+                connection.login(self.username, self.password)
+        self.connects += 1
+        metrics.incr("smtp.connections")
+        return connection
+
+    def _discard(self, connection):
+        try:
+            connection.quit()
+        except (smtplib.SMTPException, OSError):
+            connection.close()
+
+    def send(self, recipient, subject, html_content):
+        """HTML 메시지 하나를 보내고 성공 여부를 반환 (풀의 연결을 재사용)"""
+        message = EmailMessage()
+        message["From"] = self.sender
+        message["To"] = recipient
+        message["Subject"] = subject
+        message["Date"] = formatdate(localtime=True)
+        message.set_content(html_content, subtype="html")
+
+        self._slots.acquire()
+        try:
+            connection = self._idle.get_nowait()
+        except queue.Empty:
+            connection = None
+        try:
+            for attempt in range(1, self.max_retries + 1):
+                try:
+                    if connection is None:
+                        connection = self._connect()
+                    with metrics.span("smtp.send", recipient):
+                        connection.send_message(message)
+                    metrics.incr("smtp.sent")
+                    return True
+                except smtplib.SMTPRecipientsRefused as e:
+                    # 다시 보내도 같은 결과이므로 재시도하지 않음 (연결은 정상)
+                    print(f"{datetime.now()} - 수신자 거부 ({recipient}): {e}")
+                    return False
+                except (smtplib.SMTPException, OSError) as e:
+                    metrics.incr("smtp.failures")
+                    if connection is not None:
+                        self._discard(connection)
+                        connection = None
+                    print(f"{datetime.now()} - 이메일 발송 실패 ({recipient}, 시도 {attempt}/{self.max_retries}): {e}")
+                    if attempt < self.max_retries:
+                        delay = backoff_delay(attempt, self.base_delay, self.max_delay)
+                        print(f"{datetime.now()} - {delay:.1f}초 후 재연결해 재시도...")
+                        time.sleep(delay)
+            print(f"{datetime.now()} - 이메일 발송 최종 실패 ({recipient})")
+            return False
+        finally:
+            if connection is not None:
+                self._idle.put(connection)
+            self._slots.release()
+
+    def close(self):
+        """풀에 남은 연결을 모두 닫음"""
+        while True:
+            try:
+                connection = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(connection)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+def load_subscribers(path, default_recipient=None, default_keywords=None):
+    """구독자 목록을 읽는 함수
+
+    path는 [{"email": "...", "keywords": ["AI", ...]}, ...] 형식의 JSON 파일이며,
+    keywords가 없는 구독자는 모든 키워드의 기사를 받는다.
+    path가 비어 있으면 default_recipient 한 명을 default_keywords 구독자로 반환한다.
+    """
+    if not path:
+        if not default_recipient:
+            return []
+        return [{"email": default_recipient, "keywords": list(default_keywords) if default_keywords else None}]
+    with open(path, 'r', encoding='utf-8') as f:
+        entries = json.load(f)
+    return [{"email": entry["email"], "keywords": entry.get("keywords") or None} for entry in entries]
+
+def subscriber_items(subscriber, items):
+    """구독자의 구독 키워드에 맞는 렌더링된 아이템 목록 (keywords가 None이면 모든 아이템)"""
+    keywords = subscriber["keywords"]
+    if keywords is None:
+        return list(items)
+    keywords = set(keywords)
+    return [item for item in items if not keywords.isdisjoint(item.keywords)]
+
+def delivered_article_ids(subscribers, items, results):
+    """발송 기록에 남길 기사 ID 목록을 반환하는 함수
+
+    받을 구독자 중 한 명에게라도 보낸 아이템과 받을 구독자가 없던 아이템의 ID만 포함하고,
+    받을 구독자 모두에게 발송이 실패한 아이템은 빼서 다음 배치에서 다시 보내도록 한다.
+    """
+    targeted = set()
+    delivered = set()
+    for subscriber in subscribers:
+        for item in subscriber_items(subscriber, items):
+            targeted.add(id(item))
+            if results.get(subscriber["email"]):
+                delivered.add(id(item))
+    return [article_id for item in items if id(item) in delivered or id(item) not in targeted
+            for article_id in item.ids]
+
+def send_digests(mailer, subscribers, items, renderer=None, max_workers=None):
+    """구독자마다 구독 키워드에 맞는 기사만 모아 개인화된 뉴스 이메일을 보내는 함수
+
+    items는 pipeline.render_items()로 한 번만 렌더링해 둔 기사 HTML 조각 목록이며,
+    구독자별로는 조각을 다시 묶기만 한다. 연결 풀 크기만큼 동시에 보낸다.
+    반환값은 {이메일: 발송 성공 여부}이며, 받을 기사가 없는 구독자는 포함하지 않는다.
+    """
+    if renderer is None:
+        renderer = EmailTemplateRenderer()
+
+    messages = []
+    for subscriber in subscribers:
+        items_by_source = {}
+        for item in subscriber_items(subscriber, items):
+            items_by_source.setdefault(item.source, []).append(item.html)
+        if items_by_source:
+            news_count = sum(len(fragments) for fragments in items_by_source.values())
+            messages.append((subscriber["email"], news_count, renderer.generate_email_html_from_items(items_by_source)))
+
+    def send(message):
+        email, news_count, html_content = message
+        sent = mailer.send(email, digest_subject(news_count), html_content)
+        if sent:
+            print(f"{datetime.now()} - 뉴스 발송 완료 ({email}): {news_count}건")
+        return sent
+
+    with ThreadPoolExecutor(max_workers=max_workers or mailer.pool_size) as executor:
+        return {message[0]: sent for message, sent in zip(messages, executor.map(send, messages))}
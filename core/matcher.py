@@ -0,0 +1,51 @@
+import re
+from functools import lru_cache
+
+
+class KeywordMatcher:
+    """여러 키워드를 한 번의 스캔으로 찾아내는 매처 클래스"""
+
+    def __init__(self, keywords, aliases=None):
+        self.keywords = list(dict.fromkeys(keywords))
+
+        # 검색어(소문자) → 해당 검색어를 가진 원래 키워드 목록
+        self._owners = {}
+        for keyword in self.keywords:
+            terms = [keyword]
+            if aliases is not None:
+                terms.append(aliases(keyword))
+            for term in terms:
+                term = term.strip().lower()
+                if not term:
+                    continue
+                owners = self._owners.setdefault(term, [])
+                if keyword not in owners:
+                    owners.append(keyword)
+
+        # 긴 검색어를 먼저 시도하고, 같은 위치에서 시작하는 접두사 검색어도 함께 매칭된 것으로 본다
+        terms = sorted(self._owners, key=len, reverse=True)
+        self._implied = {term: [other for other in terms if term.startswith(other)] for term in terms}
+
+        # 전방탐색(lookahead)으로 겹치는 매칭까지 모두 찾는 단일 정규식
+        self._pattern = None
+        if terms:
+            self._pattern = re.compile("(?=(" + "|".join(map(re.escape, terms)) + "))")
+
+    def match(self, *texts):
+        """주어진 텍스트들에서 매칭되는 키워드 목록을 키워드 순서대로 반환"""
+        if self._pattern is None:
+            return []
+
+        # 필드 사이에 줄바꿈을 넣어 필드 경계를 넘는 매칭을 막고, 소문자 변환은 한 번만 수행
+        text = "\n".join(t for t in texts if t).lower()
+        found = set()
+        for m in self._pattern.finditer(text):
+            for term in self._implied[m.group(1)]:
+                found.update(self._owners[term])
+        return [keyword for keyword in self.keywords if keyword in found]
+
+
+@lru_cache(maxsize=32)
+def compile_keywords(keywords, aliases=None):
+    """키워드 튜플로부터 매처를 한 번만 생성해 재사용하는 함수"""
+    return KeywordMatcher(keywords, aliases)
@@ -0,0 +1,217 @@
+import os
+import json
+import time
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class Metrics:
+    """작업 한 번 동안 구간별 소요 시간, 카운터, 통계 값을 모으는 클래스 (여러 스레드에서 기록 가능)
+
+    구간과 카운터는 이름별 합계와 함께 레이블(소스별 키워드, 수신자 등)별 값도 따로 모은다.
+    """
+
+    def __init__(self, name="job"):
+        self.name = name
+        self.started_at = time.time()
+        self._lock = threading.Lock()
+        self._spans = {}
+        self._counters = {}
+        self._values = {}
+
+    def record_span(self, name, seconds, label=None):
+        """구간 소요 시간을 기록"""
+        keys = [(name, None)] if label is None else [(name, None), (name, str(label))]
+        with self._lock:
+            for key in keys:
+                stats = self._spans.get(key)
+                if stats is None:
+                    stats = self._spans[key] = [0, 0.0, 0.0]
+                stats[0] += 1
+                stats[1] += seconds
+                stats[2] = max(stats[2], seconds)
+
+    def incr(self, name, amount=1, label=None):
+        """카운터를 amount만큼 올림"""
+        keys = [(name, None)] if label is None else [(name, None), (name, str(label))]
+        with self._lock:
+            for key in keys:
+                self._counters[key] = self._counters.get(key, 0) + amount
+
+    def set_value(self, name, value):
+        """캐시 통계처럼 작업 끝에 한 번 정해지는 값을 기록"""
+        with self._lock:
+            self._values[name] = value
+
+    def snapshot(self):
+        """지금까지 모은 값을 JSON으로 바꿀 수 있는 dict로 반환"""
+        with self._lock:
+            spans = {}
+            for (name, label), (count, total, longest) in sorted(self._spans.items(), key=_sort_key):
+                stats = {"count": count, "total_seconds": round(total, 6), "max_seconds": round(longest, 6)}
+                if label is None:
+                    spans.setdefault(name, {}).update(stats)
+                else:
+                    spans.setdefault(name, {}).setdefault("by_label", {})[label] = stats
+            counters = {}
+            for (name, label), value in sorted(self._counters.items(), key=_sort_key):
+                if label is None:
+                    counters.setdefault(name, {})["total"] = value
+                else:
+                    counters.setdefault(name, {}).setdefault("by_label", {})[label] = value
+            return {
+                "job": self.name,
+                "started_at": datetime.fromtimestamp(self.started_at).isoformat(timespec="seconds"),
+                "duration_seconds": round(time.time() - self.started_at, 3),
+                "spans": spans,
+                "counters": counters,
+                "values": dict(self._values)
+            }
+
+
+def _sort_key(item):
+    (name, label), _ = item
+    return name, label or ""
+
+
+# 현재 작업의 지표 (start_run()으로 새로 시작)
+_current = Metrics()
+
+
+def start_run(name="job"):
+    """새 작업의 지표 수집을 시작하고 Metrics 객체를 반환"""
+    global _current
+    _current = Metrics(name)
+    return _current
+
+
+def current():
+    """현재 작업의 Metrics 객체를 반환"""
+    return _current
+
+
+@contextmanager
+def span(name, label=None):
+    """with 블록의 소요 시간을 현재 작업의 구간 지표로 기록"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _current.record_span(name, time.perf_counter() - start, label)
+
+
+def incr(name, amount=1, label=None):
+    """현재 작업의 카운터를 올림"""
+    _current.incr(name, amount, label)
+
+
+def set_value(name, value):
+    """현재 작업의 통계 값을 기록"""
+    _current.set_value(name, value)
+
+
+def write_report(report_dir, metrics=None):
+    """작업 지표를 JSON 실행 보고서로 저장하고 경로를 반환 (latest.json에도 같은 내용을 씀)"""
+    report = (metrics or _current).snapshot()
+    os.makedirs(report_dir, exist_ok=True)
+    stamp = datetime.fromtimestamp((metrics or _current).started_at).strftime('%Y%m%d-%H%M%S')
+    path = os.path.join(report_dir, f"run-{stamp}.json")
+    for target in (path, os.path.join(report_dir, "latest.json")):
+        with open(target, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+    return path
+
+
+def load_report(path):
+    """저장된 실행 보고서를 읽음 (없거나 깨졌으면 None)"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+def _escape_label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _metric_name(name):
+    return "newsagent_" + "".join(char if char.isalnum() else "_" for char in name)
+
+
+def _add_family(lines, name, kind, help_text, samples):
+    """이름 하나의 시계열들을 # HELP/# TYPE 줄과 함께 추가 (samples는 (레이블 문자열, 값) 목록)"""
+    if samples:
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+        lines.extend(f"{name}{labels} {value}" for labels, value in samples)
+
+
+def _label(value):
+    return f'{{label="{_escape_label(value)}"}}'
+
+
+def render_prometheus(report, scheduler_stats=None):
+    """실행 보고서와 스케줄러 통계를 Prometheus 텍스트 형식으로 변환하는 함수
+
+    구간/카운터의 전체 합계와 레이블별 값은 서로 다른 이름(레이블별 값은 _by_label)으로 내보내,
+    한 이름의 시계열을 sum()해도 두 번 더해지지 않는다. 보고서 값은 실행마다 새로 시작하는
+    마지막 실행 기준이므로 counter가 아닌 gauge로 내보낸다.
+    """
+    lines = []
+    for name, value in sorted((scheduler_stats or {}).items()):
+        _add_family(lines, _metric_name('scheduler_' + name), "counter",
+                    f"스케줄러 {name} (스케줄러 시작 이후)", [("", value)])
+    if report:
+        _add_family(lines, "newsagent_last_run_duration_seconds", "gauge",
+                    "마지막 실행 소요 시간(초)", [("", report['duration_seconds'])])
+        for name, stats in report["spans"].items():
+            metric = _metric_name(name)
+            by_label = stats.get("by_label", {})
+            _add_family(lines, f"{metric}_seconds", "gauge", f"마지막 실행의 {name} 구간 소요 시간 합계(초)",
+                        [("", stats.get('total_seconds', 0))])
+            _add_family(lines, f"{metric}_calls", "gauge", f"마지막 실행의 {name} 구간 실행 횟수",
+                        [("", stats.get('count', 0))])
+            _add_family(lines, f"{metric}_by_label_seconds", "gauge",
+                        f"마지막 실행의 {name} 구간 레이블별 소요 시간 합계(초)",
+                        [(_label(label), label_stats["total_seconds"]) for label, label_stats in by_label.items()])
+            _add_family(lines, f"{metric}_by_label_calls", "gauge", f"마지막 실행의 {name} 구간 레이블별 실행 횟수",
+                        [(_label(label), label_stats["count"]) for label, label_stats in by_label.items()])
+        for name, counter in report["counters"].items():
+            metric = _metric_name(name)
+            _add_family(lines, metric, "gauge", f"마지막 실행의 {name} 합계", [("", counter.get('total', 0))])
+            _add_family(lines, f"{metric}_by_label", "gauge", f"마지막 실행의 {name} 레이블별 값",
+                        [(_label(label), value) for label, value in counter.get("by_label", {}).items()])
+        # 캐시 적중률, 토큰 사용량처럼 dict로 기록한 값은 숫자 항목만 내보냄
+        for name, values in report["values"].items():
+            if not isinstance(values, dict):
+                values = {"value": values}
+            for key, value in values.items():
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    _add_family(lines, _metric_name(name + '_' + key), "gauge", f"{name} {key}", [("", value)])
+    return "\n".join(lines) + "\n"
+
+
+def serve_prometheus(port, provider, host="0.0.0.0"):
+    """provider()가 돌려주는 Prometheus 텍스트를 /metrics로 제공하는 HTTP 서버를 백그라운드에서 시작"""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path != "/metrics":
+                self.send_error(404)
+                return
+            body = provider().encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass  # 요청마다 로그를 남기지 않음
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    threading.Thread(target=server.serve_forever, name="metrics-server", daemon=True).start()
+    return server
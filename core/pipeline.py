@@ -0,0 +1,202 @@
+import heapq
+import itertools
+from collections import deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from core import metrics
+from core.clustering import StoryIndex
+from core.email_template_renderer import EmailTemplateRenderer
+from core.storage import get_article_id
+from core.summarizer import summarize_group, batch_tokens, batch_has_room
+from core.urls import article_id_for_url
+
+# 파이프라인 단계: 수집(collector.iter_all_news) → 정규화 → 중복 제거 → 순위 → 요약 → 렌더링
+# 각 단계는 기사를 하나씩 받아 하나씩 내보내는 제너레이터이므로,
+# 앞쪽 기사의 요약이 뒤쪽 기사의 수집과 겹쳐서 진행되고 메모리에는 단계별 창 크기만큼만 머무른다.
+
+
+class StoryAlternates(list):
+    """대표 기사에 합쳐진 같은 스토리 기사 목록
+
+    대표 기사가 렌더링되면 item_ids가 그 아이템의 기사 ID 목록(RenderedItem.ids와 같은 객체)이 되어,
+    이후에 도착한 같은 스토리 기사는 ID만 이 목록에 더한다.
+    """
+
+    __slots__ = ('item_ids',)
+
+    def __init__(self, items=()):
+        super().__init__(items)
+        self.item_ids = None
+
+
+def normalize_articles(articles):
+    """정규화된 URL이 같은 기사는 처음 도착한 것만 내보내고, 나중에 온 기사의 matched_keywords를 합치는 단계"""
+    keywords_by_url = {}
+    for article in articles:
+        metrics.incr("articles.fetched", label=article["source"])
+        keywords = keywords_by_url.get(article.normalized_url)
+        if keywords is not None:
+            metrics.incr("articles.url_duplicates")
+            for keyword in article.get("matched_keywords", []):
+                if keyword not in keywords:
+                    keywords.append(keyword)
+            continue
+        keywords_by_url[article.normalized_url] = article.matched_keywords
+        yield article
+
+
+def dedup_articles(articles, sent_set, threshold=0.5):
+    """이미 발송한 기사를 거르고, 여러 출처의 같은 스토리는 처음 도착한 기사 하나만 내보내는 단계
+
+    나중에 도착한 같은 스토리 기사는 대표 기사의 alternate_sources와 matched_keywords에 합친다.
+    대표 기사가 이미 렌더링된 뒤에 도착한 기사는 내보내지 않고 ID만 그 아이템의 발송 기록에 더한다.
+    """
+    index = StoryIndex(threshold)
+    for article in articles:
+        article_id = get_article_id(article)
+        if article_id in sent_set:
+            metrics.incr("articles.already_sent")
+            continue
+        sent_set.add(article_id)
+
+        alternates = StoryAlternates(article.get("alternate_sources", ()))
+        article["alternate_sources"] = alternates
+        keywords = article.setdefault("matched_keywords", [])
+        story = index.add(article, (alternates, keywords))
+        if story is None:
+            metrics.incr("articles.new")
+            yield article
+            continue
+
+        # 대표 기사 객체 대신 목록만 공유하므로 이미 내보낸 기사도 붙잡아 두지 않음
+        story_alternates, story_keywords = story
+        if story_alternates.item_ids is not None:
+            # 대표 기사가 이미 렌더링되었으면 새 스토리로 요약/발송하지 않고 그 아이템과 함께 발송 기록에 남김
+            metrics.incr("articles.late_duplicates")
+            story_alternates.item_ids.append(article_id)
+            continue
+
+        metrics.incr("articles.near_duplicates")
+        story_alternates.append({"source": article["source"], "title": article["title"], "url": article["url"]})
+        for keyword in keywords:
+            if keyword not in story_keywords:
+                story_keywords.append(keyword)
+
+
+def _rank_score(article):
+    return len(article.get("matched_keywords", ())) + len(article.get("alternate_sources", ()))
+
+
+def rank_articles(articles, window=50):
+    """최근 window개 기사 중 점수(매칭 키워드 수 + 같은 스토리 출처 수)가 높은 기사부터 내보내는 단계
+
+    점수가 같으면 먼저 도착한 기사가 먼저 나가며, 창이 찰 때까지는 기사를 붙잡아 두므로
+    같은 스토리의 다른 출처가 대표 기사에 합쳐질 시간도 번다.
+    """
+    heap = []
+    order = itertools.count()
+    for article in articles:
+        heapq.heappush(heap, (-_rank_score(article), next(order), article))
+        if len(heap) > window:
+            yield heapq.heappop(heap)[2]
+    # 창에 머무는 동안 합쳐진 출처를 반영해 남은 기사를 다시 정렬
+    heap = [(-_rank_score(article), seq, article) for _, seq, article in heap]
+    heapq.heapify(heap)
+    while heap:
+        yield heapq.heappop(heap)[2]
+
+
+class _SummaryBatch:
+    """함께 요약을 요청하는 기사 묶음과 그 요청의 future"""
+
+    __slots__ = ('articles', 'tokens', 'future')
+
+    def __init__(self):
+        self.articles = []
+        self.tokens = 0
+        self.future = None
+
+
+def summarize_stream(articles, summarizer, max_workers=4, window=32):
+    """영문 기사 요약 요청을 들어오는 대로 보내고, 요약이 끝난 기사를 도착 순서대로 내보내는 단계
+
+    짧은 기사는 배치 크기와 토큰 예산 안에서 묶어 한 번에 요청하며,
+    요약 중인 기사가 window개를 넘으면 가장 오래된 기사의 요약을 기다린다.
+    """
+    in_flight = deque()
+    pending = _SummaryBatch()
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        def submit(batch):
+            batch.future = executor.submit(summarize_group, batch.articles, summarizer)
+
+        def finish(article, batch, position):
+            if batch is not None:
+                article["summary"] = batch.future.result()[position]
+                metrics.incr("articles.summarized")
+            return article
+
+        for article in articles:
+            skip = article["language"] != "en" or "summary" in article
+            tokens = None if skip else batch_tokens(article, summarizer)
+            if skip:
+                in_flight.append((article, None, 0))
+            elif tokens is None:
+                single = _SummaryBatch()
+                single.articles.append(article)
+                submit(single)
+                in_flight.append((article, single, 0))
+            else:
+                if not batch_has_room(summarizer, len(pending.articles), pending.tokens, tokens):
+                    submit(pending)
+                    pending = _SummaryBatch()
+                in_flight.append((article, pending, len(pending.articles)))
+                pending.articles.append(article)
+                pending.tokens += tokens
+
+            while len(in_flight) > window:
+                head = in_flight.popleft()
+                if head[1] is pending:
+                    # 채우는 중인 배치를 기다려야 하면 더 모으지 않고 바로 요청
+                    submit(pending)
+                    pending = _SummaryBatch()
+                yield finish(*head)
+
+        if pending.articles:
+            submit(pending)
+        while in_flight:
+            yield finish(*in_flight.popleft())
+
+
+class RenderedItem(namedtuple("RenderedItem", ["source", "keywords", "html", "ids"])):
+    """한 번 렌더링해 둔 뉴스 아이템 HTML 조각 (구독자별 이메일에서 재사용)
+
+    ids는 이 아이템에 실린 기사 ID 목록 (대표 기사와 합쳐진 같은 스토리 기사, 렌더링 뒤에 도착한
+    같은 스토리 기사도 dedup_articles()가 더함)으로, 발송에 성공하면 발송 기록에 남긴다.
+    """
+
+    __slots__ = ()
+
+
+def _render_item(article, renderer):
+    ids = _item_ids(article)
+    alternates = article.get("alternate_sources")
+    if isinstance(alternates, StoryAlternates):
+        # 이후에 도착하는 같은 스토리 기사는 이 아이템의 ID 목록에만 더함
+        alternates.item_ids = ids
+    return RenderedItem(article["source"], tuple(article.get("matched_keywords", ())),
+                        renderer.generate_news_item(article), ids)
+
+
+def _item_ids(article):
+    ids = [get_article_id(article)]
+    ids += [article_id_for_url(alternate["url"]) for alternate in article.get("alternate_sources", ())]
+    return ids
+
+
+def render_items(articles, renderer=None):
+    """기사를 도착하는 대로 뉴스 아이템 HTML 조각으로 렌더링하는 단계 (기사 객체는 붙잡아 두지 않음)"""
+    if renderer is None:
+        renderer = EmailTemplateRenderer()
+    return [_render_item(article, renderer) for article in articles]
+
@@ -0,0 +1,87 @@
+import sqlite3
+import threading
+from datetime import timedelta
+
+from core import dates
+
+# 사용량 기록을 남겨 두는 기간(일)
+QUOTA_RETENTION_DAYS = 7
+
+
+class QuotaStore:
+    """소스별 하루 요청 수를 세어 작업이 바뀌어도 이어서 계산하는 클래스
+
+    날짜는 기준 시간대(dates.today())로 나누며, 사용량은 메모리에서 세다가
+    flush_every번마다와 close() 때 저장한다 (같은 파일을 쓰는 다른 프로세스의 사용량에 더함).
+    """
+
+    def __init__(self, path, flush_every=50):
+        self.path = path
+        self.flush_every = flush_every
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS source_quota (
+                source TEXT NOT NULL,
+                day TEXT NOT NULL,
+                used INTEGER NOT NULL,
+                PRIMARY KEY (source, day)
+            )"""
+        )
+        oldest = (dates.today() - timedelta(days=QUOTA_RETENTION_DAYS)).isoformat()
+        self._conn.execute("DELETE FROM source_quota WHERE day < ?", (oldest,))
+        self._conn.commit()
+        self._used = {
+            (row[0], row[1]): row[2]
+            for row in self._conn.execute("SELECT source, day, used FROM source_quota WHERE day >= ?",
+                                          (dates.today().isoformat(),))
+        }
+        self._pending = {}
+        self._unflushed = 0
+
+    def consume(self, source, limit=0):
+        """오늘 한도(limit, 0이면 제한 없음) 안이면 요청 1건을 기록하고 True, 한도를 다 썼으면 False를 반환"""
+        key = (source, dates.today().isoformat())
+        with self._lock:
+            used = self._used.get(key, 0)
+            if limit and used >= limit:
+                return False
+            self._used[key] = used + 1
+            self._pending[key] = self._pending.get(key, 0) + 1
+            self._unflushed += 1
+            if self._unflushed >= self.flush_every:
+                self._flush_locked()
+        return True
+
+    def used(self, source):
+        """오늘 source에 보낸 요청 수"""
+        with self._lock:
+            return self._used.get((source, dates.today().isoformat()), 0)
+
+    def usage(self):
+        """오늘 소스별 요청 수 dict"""
+        today = dates.today().isoformat()
+        with self._lock:
+            return {source: used for (source, day), used in self._used.items() if day == today}
+
+    def _flush_locked(self):
+        if self._pending:
+            self._conn.executemany(
+                """INSERT INTO source_quota (source, day, used) VALUES (?, ?, ?)
+                   ON CONFLICT (source, day) DO UPDATE SET used = used + excluded.used""",
+                [(source, day, count) for (source, day), count in self._pending.items()]
+            )
+            self._conn.commit()
+            self._pending.clear()
+        self._unflushed = 0
+
+    def flush(self):
+        """메모리에 모아 둔 사용량을 저장"""
+        with self._lock:
+            self._flush_locked()
+
+    def close(self):
+        """남은 사용량을 저장하고 데이터베이스 연결을 닫음"""
+        with self._lock:
+            self._flush_locked()
+            self._conn.close()
@@ -0,0 +1,144 @@
+import threading
+import time
+from typing import Optional
+
+
+class TokenBucket:
+    """일정 속도로 채워지는 토큰 버킷 클래스"""
+
+    def __init__(self, capacity: float, refill_per_second: float):
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated_at
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.refill_per_second)
+        self._updated_at = now
+
+    def try_acquire(self, amount: float = 1) -> float:
+        """토큰을 가져오면 0, 부족하면 채워질 때까지 기다려야 할 시간(초)을 반환"""
+        # 버킷 용량보다 큰 요청은 용량만큼만 요구 (영원히 대기하지 않도록)
+        amount = min(amount, self.capacity)
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            if self._tokens >= amount:
+                self._tokens -= amount
+                return 0.0
+            return (amount - self._tokens) / self.refill_per_second
+
+    def acquire(self, amount: float = 1, timeout: Optional[float] = None) -> bool:
+        """토큰을 가져올 때까지 대기 (timeout 초과 시 False)"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            wait_time = self.try_acquire(amount)
+            if wait_time == 0:
+                return True
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                wait_time = min(wait_time, remaining)
+            time.sleep(wait_time)
+
+
+class RateLimiter:
+    """분당 요청 수(RPM)와 분당 토큰 수(TPM)를 함께 제한하는 클래스
+
+    서버가 429 응답의 Retry-After로 대기를 요구하면 defer()로 모든 호출을 그 시간까지 멈춘다.
+    request_burst를 지정하면 한 번에 몰아 보낼 수 있는 요청 수를 1분 치 대신 그 수로 제한한다.
+    """
+
+    def __init__(self, requests_per_minute: Optional[float] = None, tokens_per_minute: Optional[float] = None,
+                 request_burst: Optional[float] = None):
+        self._request_bucket = None
+        self._token_bucket = None
+        if requests_per_minute:
+            self._request_bucket = TokenBucket(request_burst or requests_per_minute, requests_per_minute / 60)
+        if tokens_per_minute:
+            self._token_bucket = TokenBucket(tokens_per_minute, tokens_per_minute / 60)
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def defer(self, seconds: float) -> None:
+        """지정한 시간(초) 동안 새 요청을 보내지 않도록 함"""
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+    def acquire(self, tokens: int = 0) -> None:
+        """요청 1건과 예상 토큰 수만큼 한도를 확보할 때까지 대기"""
+        while True:
+            with self._lock:
+                wait_time = self._blocked_until - time.monotonic()
+            if wait_time <= 0:
+                break
+            time.sleep(wait_time)
+
+        if self._request_bucket is not None:
+            self._request_bucket.acquire(1)
+        if self._token_bucket is not None and tokens:
+            self._token_bucket.acquire(tokens)
+
+
+class CircuitBreaker:
+    """연속으로 실패하는 대상을 잠시 건너뛰게 하는 회로 차단기 클래스
+
+    failure_threshold번 연속 실패하면 cool_down초 동안 allow()가 False를 반환한다.
+    대기 시간이 지나면 시험 요청 하나만 허용하고(반열림), 그 요청이 성공하면 차단을 풀고
+    실패하면 다시 cool_down초 동안 차단한다. 허용받고도 요청을 보내지 않았으면 release()로 돌려준다.
+    """
+
+    def __init__(self, failure_threshold: int = 3, cool_down: float = 300):
+        self.failure_threshold = failure_threshold
+        self.cool_down = cool_down
+        self._failures = 0
+        self._open_until = 0.0  # 0이면 닫힌 상태
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """지금 요청을 보내도 되는지 확인 (반열림 상태에서는 시험 요청 하나만 허용)"""
+        with self._lock:
+            if not self._open_until:
+                return True
+            if time.monotonic() < self._open_until or self._probing:
+                return False
+            self._probing = True
+            return True
+
+    def release(self) -> None:
+        """allow()로 허용받은 요청을 보내지 않았을 때 시험 요청 자리를 돌려줌"""
+        with self._lock:
+            self._probing = False
+
+    def record_success(self) -> None:
+        """요청 성공을 기록 (연속 실패 횟수와 차단 상태 초기화)"""
+        with self._lock:
+            self._failures = 0
+            self._open_until = 0.0
+            self._probing = False
+
+    def record_failure(self) -> bool:
+        """요청 실패를 기록하고, 이번 실패로 차단이 시작되었으면 True를 반환"""
+        with self._lock:
+            self._failures += 1
+            now = time.monotonic()
+            if self._probing:
+                # 시험 요청이 실패하면 다시 차단
+                self._probing = False
+                self._open_until = now + self.cool_down
+                return True
+            if self.failure_threshold and self._failures >= self.failure_threshold and not self._open_until:
+                self._open_until = now + self.cool_down
+                return True
+            return False
+
+    def reset(self) -> None:
+        """차단 상태와 실패 횟수를 초기화"""
+        with self._lock:
+            self._failures = 0
+            self._open_until = 0.0
+            self._probing = False
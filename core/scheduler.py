@@ -1,23 +1,179 @@
-import schedule
+import os
 import time
-from datetime import datetime
+import multiprocessing
+from datetime import datetime, timedelta, time as dtime
+
+try:
+    import fcntl
+except ImportError:  # fcntl이 없는 환경(Windows)에서는 파일 잠금 없이 실행
+    fcntl = None
+
+from core import dates, metrics
+
+# 절전 복귀 등으로 벽시계가 건너뛴 것을 알아채도록 한 번에 최대 이만큼(초)만 잠
+MAX_SLEEP_SECONDS = 60
+
+
+def parse_batch_times(batch_times):
+    """"HH:MM" 문자열 목록을 정렬된 (시, 분) 목록으로 변환하는 함수"""
+    slots = set()
+    for batch_time in batch_times:
+        hour, minute = batch_time.strip().split(":")
+        slots.add((int(hour), int(minute)))
+    return sorted(slots)
+
+
+def next_slot(slots, after):
+    """after 이후(같은 시각 제외) 가장 가까운 실행 예정 시각을 반환 (after와 같은 시간대)"""
+    for offset in range(2):
+        day = after.date() + timedelta(days=offset)
+        for hour, minute in slots:
+            candidate = datetime.combine(day, dtime(hour, minute), tzinfo=after.tzinfo)
+            if candidate > after:
+                return candidate
+
+
+def latest_slot(slots, until):
+    """until 이전(같은 시각 포함) 가장 최근의 실행 예정 시각을 반환 (until과 같은 시간대)"""
+    for offset in range(2):
+        day = until.date() - timedelta(days=offset)
+        for hour, minute in reversed(slots):
+            candidate = datetime.combine(day, dtime(hour, minute), tzinfo=until.tzinfo)
+            if candidate <= until:
+                return candidate
+
+
+class RunLock:
+    """같은 호스트에서 도는 여러 에이전트 프로세스가 같은 배치를 두 번 실행하지 않도록 하는 파일 잠금
+
+    잠금 파일에 마지막으로 실행한 배치 시각을 기록해, 잠금이 풀린 뒤 늦게 깨어난 프로세스도
+    이미 실행된 배치는 건너뛴다. fcntl이 없는 환경에서는 항상 실행을 허용한다.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = None
+
+    def acquire(self, slot_key):
+        """잠금을 얻었고 slot_key 배치를 아직 아무도 실행하지 않았으면 True를 반환"""
+        if fcntl is None:
+            return True
+        lock_file = open(self.path, "a+")
+        try:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            return False
+
+        lock_file.seek(0)
+        if lock_file.read().strip() == slot_key:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+            lock_file.close()
+            return False
+        lock_file.seek(0)
+        lock_file.truncate()
+        lock_file.write(slot_key)
+        lock_file.flush()
+        self._file = lock_file
+        return True
+
+    def release(self):
+        """잠금을 해제"""
+        if self._file is not None:
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+            self._file.close()
+            self._file = None
+
+
+def _stop_worker(process):
+    process.terminate()
+    process.join(5)
+    if process.is_alive():
+        process.kill()
+        process.join()
+
+
+def register_schedules(job_func, batch_times, job_timeout=None, lock_file=None, catch_up_minutes=0,
+                       metrics_port=0, report_dir=None):
+    """batch_times("HH:MM" 목록, 기준 시간대 dates.get_report_timezone() 기준)마다 job_func를 실행하는 스케줄러 루프
+
+    다음 실행 시각까지 정확히 잠들었다가 작업을 별도 프로세스에서 실행하므로,
+    job_timeout(초)을 넘긴 작업은 강제로 종료할 수 있고 실행 중에도 다음 일정을 계속 확인한다.
+    이전 작업이 아직 실행 중이면 이번 배치는 건너뛴다 (겹쳐 실행하지 않음).
+    절전 등으로 배치 시각을 놓쳤으면 catch_up_minutes분 이내의 가장 최근 배치를 한 번만 실행한다.
+    lock_file을 지정하면 같은 호스트의 다른 에이전트 프로세스와 배치가 겹치지 않도록 파일 잠금을 쓴다.
+    metrics_port를 지정하면 스케줄러 통계와 report_dir의 마지막 실행 보고서를 Prometheus 형식으로 제공한다.
+    """
+    slots = parse_batch_times(batch_times)
+    run_lock = RunLock(lock_file) if lock_file else None
+    catch_up = timedelta(minutes=max(catch_up_minutes, 1))
+    stats = {"runs_started": 0, "runs_failed": 0, "runs_timed_out": 0, "slots_skipped": 0}
+    if metrics_port:
+        latest_path = os.path.join(report_dir, "latest.json") if report_dir else None
+        metrics.serve_prometheus(metrics_port, lambda: metrics.render_prometheus(
+            metrics.load_report(latest_path) if latest_path else None, stats))
+        print(f"Prometheus 지표 제공: http://localhost:{metrics_port}/metrics")
 
-def register_schedules(job_func, batch_times):
-    for t in batch_times:
-        schedule.every().day.at(t).do(job_func)
-    
     print("뉴스 모니터링 서비스 시작...")
     print(f"예정된 실행 시간: {', '.join(batch_times)}")
-    
-    while True:
-        # 현재 시간과 다음 실행 예정 시간 정보 출력 (1시간마다)
-        now = datetime.now()
-        if now.minute == 0:  # 매시 정각에만 상태 출력
-            next_run = schedule.next_run()
-            if next_run:
-                print(f"[{now.strftime('%Y-%m-%d %H:%M')}] 다음 뉴스 수집 예정: {next_run.strftime('%Y-%m-%d %H:%M')}")
+
+    worker = None
+    worker_deadline = None
+    now = datetime.now(dates.get_report_timezone())
+    due = next_slot(slots, now)
+    print(f"[{now.strftime('%Y-%m-%d %H:%M')}] 다음 뉴스 수집 예정: {due.strftime('%Y-%m-%d %H:%M')}")
+
+    try:
+        while True:
+            now = datetime.now(dates.get_report_timezone())
+
+            if worker is not None:
+                if not worker.is_alive():
+                    if worker.exitcode:
+                        print(f"{now} - 작업 비정상 종료 (종료 코드 {worker.exitcode})")
+                        stats["runs_failed"] += 1
+                    worker = None
+                elif worker_deadline is not None and time.monotonic() >= worker_deadline:
+                    print(f"{now} - 작업 시간 초과({job_timeout}초), 작업 프로세스 종료")
+                    _stop_worker(worker)
+                    stats["runs_timed_out"] += 1
+                    worker = None
+                if worker is None and run_lock is not None:
+                    run_lock.release()
+
+            if now >= due:
+                # 여러 배치를 놓쳤더라도 가장 최근 배치만 한 번 실행
+                slot = latest_slot(slots, now)
+                if now - slot > catch_up:
+                    print(f"{now} - {slot.strftime('%Y-%m-%d %H:%M')} 배치를 놓침 (따라잡기 기간 초과), 건너뜀")
+                    stats["slots_skipped"] += 1
+                elif worker is not None:
+                    print(f"{now} - 이전 작업이 아직 실행 중이라 {slot.strftime('%H:%M')} 배치를 건너뜀")
+                    stats["slots_skipped"] += 1
+                elif run_lock is not None and not run_lock.acquire(slot.isoformat()):
+                    print(f"{now} - 다른 프로세스가 {slot.strftime('%H:%M')} 배치를 실행 중이거나 이미 실행함, 건너뜀")
+                    stats["slots_skipped"] += 1
+                else:
+                    if now - slot > timedelta(minutes=1):
+                        print(f"{now} - 놓친 {slot.strftime('%Y-%m-%d %H:%M')} 배치를 지금 실행")
+                    worker = multiprocessing.Process(target=job_func, name="news-job")
+                    worker.start()
+                    stats["runs_started"] += 1
+                    worker_deadline = time.monotonic() + job_timeout if job_timeout else None
+                due = next_slot(slots, now)
+                print(f"[{now.strftime('%Y-%m-%d %H:%M')}] 다음 뉴스 수집 예정: {due.strftime('%Y-%m-%d %H:%M')}")
+                continue
+
+            timeout = min((due - now).total_seconds(), MAX_SLEEP_SECONDS)
+            if worker is not None:
+                if worker_deadline is not None:
+                    timeout = min(timeout, worker_deadline - time.monotonic())
+                # 작업이 끝나면 바로 깨어나 잠금을 해제
+                worker.join(max(0, timeout))
             else:
-                print(f"[{now.strftime('%Y-%m-%d %H:%M')}] 스케줄 확인 중...")
-        
-        schedule.run_pending()
-        time.sleep(60)  # 1분(60초) 대기
\ No newline at end of file
+                time.sleep(max(0, timeout))
+    finally:
+        if worker is not None and worker.is_alive():
+            _stop_worker(worker)
+        if run_lock is not None:
+            run_lock.release()
@@ -1,11 +1,16 @@
 import json
-import hashlib
-from datetime import datetime, date
+import sqlite3
+import threading
+from datetime import datetime, timedelta
 import os
+from core import dates
+from core.article import Article
+from core.urls import article_id_for_url
+from core.dedup_index import BloomFilter, DedupIndex
 
 def get_daily_db_file(base_filename):
     """오늘 날짜를 기반으로 데이터베이스 파일명을 생성하는 함수"""
-    today = date.today().strftime('%Y-%m-%d')
+    today = dates.today().strftime('%Y-%m-%d')
     name, ext = os.path.splitext(base_filename)
     return f"{name}_{today}{ext}"
 
@@ -24,7 +29,7 @@ def cleanup_old_db_files(base_filename, keep_days=1):
                     file_date = datetime.strptime(date_part, '%Y-%m-%d').date()
                     
                     # keep_days 이상 오래된 파일 삭제
-                    days_diff = (date.today() - file_date).days
+                    days_diff = (dates.today() - file_date).days
                     if days_diff >= keep_days:
                         old_file_path = os.path.join(base_dir, filename)
                         os.remove(old_file_path)
@@ -52,7 +57,7 @@ def load_sent_articles(base_db_file):
             elif isinstance(data, dict):
                 # 새로운 형식: {'date': 'YYYY-MM-DD', 'articles': [...]}
                 stored_date = data.get('date', '')
-                today_str = date.today().strftime('%Y-%m-%d')
+                today_str = dates.today().strftime('%Y-%m-%d')
                 if stored_date == today_str:
                     return set(data.get('articles', []))
                 else:
@@ -67,18 +72,20 @@ def save_sent_articles(sent_set, base_db_file):
     daily_db_file = get_daily_db_file(base_db_file)
     
     data = {
-        'date': date.today().strftime('%Y-%m-%d'),
+        'date': dates.today().strftime('%Y-%m-%d'),
         'articles': list(sent_set),
         'count': len(sent_set),
-        'last_updated': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        'last_updated': datetime.now(dates.get_report_timezone()).strftime('%Y-%m-%d %H:%M:%S')
     }
     
     with open(daily_db_file, "w", encoding='utf-8') as f:
         json.dump(data, f, ensure_ascii=False, indent=2)
 
 def get_article_id(article):
-    """기사 URL을 기반으로 고유 ID를 생성하는 함수"""
-    return hashlib.md5(article["url"].encode()).hexdigest()
+    """정규화된 기사 URL을 기반으로 64비트 정수 ID를 생성하는 함수 (Article은 캐시된 ID 사용)"""
+    if isinstance(article, Article):
+        return article.id
+    return article_id_for_url(article["url"])
 
 def filter_new_articles(articles, sent_set):
     """오늘 내에서 새로운 기사만 필터링하는 함수"""
@@ -107,7 +114,132 @@ def get_today_stats(base_db_file):
         pass
     
     return {
-        'date': date.today().strftime('%Y-%m-%d'),
+        'date': dates.today().strftime('%Y-%m-%d'),
         'count': 0,
         'last_updated': ''
-    }
\ No newline at end of file
+    }
+
+class SentArticleStore:
+    """발송한 기사 ID를 SQLite(WAL 모드)에 한 건씩 추가 기록하는 저장소 클래스
+
+    매 작업마다 하루치 JSON 파일 전체를 다시 쓰는 대신 새로 발송한 기사만 INSERT 하므로
+    쓰기 비용이 새 기사 수에 비례하고, 발송 직후 바로 기록되어 중간에 종료되어도 상태가 남는다.
+    """
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS sent_articles (
+                article_id PRIMARY KEY,
+                sent_date TEXT NOT NULL,
+                sent_at TEXT NOT NULL
+            )"""
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_sent_articles_date ON sent_articles (sent_date)")
+        # 정확한 ID 보관 기간이 지난 날짜의 기록을 압축해 둔 블룸 필터
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS daily_blooms (
+                sent_date TEXT PRIMARY KEY,
+                num_bits INTEGER NOT NULL,
+                num_hashes INTEGER NOT NULL,
+                bits BLOB NOT NULL
+            )"""
+        )
+        self._conn.commit()
+
+    def load_today(self):
+        """오늘 발송된 기사 ID 집합을 반환"""
+        today_str = dates.today().strftime('%Y-%m-%d')
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT article_id FROM sent_articles WHERE sent_date = ?", (today_str,)
+            ).fetchall()
+        return {row[0] for row in rows}
+
+    def mark_sent(self, article_ids):
+        """발송한 기사 ID들을 추가 기록 (이미 있는 ID는 무시)"""
+        today_str = dates.today().strftime('%Y-%m-%d')
+        sent_at = datetime.now(dates.get_report_timezone()).strftime('%Y-%m-%d %H:%M:%S')
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO sent_articles (article_id, sent_date, sent_at) VALUES (?, ?, ?)",
+                [(article_id, today_str, sent_at) for article_id in article_ids]
+            )
+            self._conn.commit()
+
+    def compact(self, window_days=3, exact_days=2, error_rate=0.001):
+        """오래된 날짜의 ID 기록을 날짜별 블룸 필터로 압축하고 중복 확인 기간이 지난 기록을 삭제
+
+        오늘부터 exact_days일은 정확한 ID를 유지하고, window_days일까지는 블룸 필터만 남긴다.
+        """
+        today = dates.today()
+        exact_cutoff = (today - timedelta(days=exact_days - 1)).strftime('%Y-%m-%d')
+        window_cutoff = (today - timedelta(days=window_days - 1)).strftime('%Y-%m-%d')
+
+        with self._lock:
+            sent_dates = [row[0] for row in self._conn.execute(
+                "SELECT DISTINCT sent_date FROM sent_articles WHERE sent_date < ? AND sent_date >= ?",
+                (exact_cutoff, window_cutoff)
+            )]
+            for sent_date in sent_dates:
+                ids = [row[0] for row in self._conn.execute(
+                    "SELECT article_id FROM sent_articles WHERE sent_date = ?", (sent_date,)
+                )]
+                # 같은 날짜의 필터가 이미 있으면 기존 필터에 추가
+                bloom = self._load_bloom(sent_date) or BloomFilter(len(ids), error_rate)
+                for article_id in ids:
+                    bloom.add(article_id)
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO daily_blooms (sent_date, num_bits, num_hashes, bits) VALUES (?, ?, ?, ?)",
+                    (sent_date, bloom.num_bits, bloom.num_hashes, bytes(bloom.bits))
+                )
+                self._conn.execute("DELETE FROM sent_articles WHERE sent_date = ?", (sent_date,))
+
+            self._conn.execute("DELETE FROM sent_articles WHERE sent_date < ?", (window_cutoff,))
+            self._conn.execute("DELETE FROM daily_blooms WHERE sent_date < ?", (window_cutoff,))
+            self._conn.commit()
+
+    def _load_bloom(self, sent_date):
+        row = self._conn.execute(
+            "SELECT num_bits, num_hashes, bits FROM daily_blooms WHERE sent_date = ?", (sent_date,)
+        ).fetchone()
+        if row is None:
+            return None
+        return BloomFilter(1, num_bits=row[0], num_hashes=row[1], bits=row[2])
+
+    def load_window(self, window_days=3, exact_days=2):
+        """최근 window_days일 동안 발송한 기사로 중복 확인 인덱스를 만드는 메서드"""
+        window_cutoff = (dates.today() - timedelta(days=window_days - 1)).strftime('%Y-%m-%d')
+        with self._lock:
+            exact_ids = {row[0] for row in self._conn.execute(
+                "SELECT article_id FROM sent_articles WHERE sent_date >= ?", (window_cutoff,)
+            )}
+            blooms = [
+                BloomFilter(1, num_bits=row[0], num_hashes=row[1], bits=row[2])
+                for row in self._conn.execute(
+                    "SELECT num_bits, num_hashes, bits FROM daily_blooms WHERE sent_date >= ?", (window_cutoff,)
+                )
+            ]
+        return DedupIndex(exact_ids, blooms)
+
+    def get_today_stats(self):
+        """오늘 발송된 기사 통계를 반환"""
+        today_str = dates.today().strftime('%Y-%m-%d')
+        with self._lock:
+            count, last_updated = self._conn.execute(
+                "SELECT COUNT(*), MAX(sent_at) FROM sent_articles WHERE sent_date = ?", (today_str,)
+            ).fetchone()
+        return {
+            'date': today_str,
+            'count': count,
+            'last_updated': last_updated or ''
+        }
+
+    def close(self):
+        """데이터베이스 연결을 닫음"""
+        with self._lock:
+            self._conn.close()
@@ -1,31 +1,94 @@
-from openai import OpenAI
-from openai import OpenAIError
 import time
+import json
 import logging
+import threading
 from datetime import datetime
+from typing import TYPE_CHECKING, Dict, List, Optional
+from core import metrics
+from core.summary_cache import SummaryCache
+from core.rate_limiter import RateLimiter
+from core.token_counter import count_tokens, truncate_to_tokens
+
+if TYPE_CHECKING:
+    from openai import OpenAI, RateLimitError
 
 # 로깅 설정
 logger = logging.getLogger(__name__)
 
+# 프롬프트 내용을 바꾸면 버전을 올려 기존 캐시된 요약이 재사용되지 않도록 함
+# 단건/배치 요약은 같은 캐시 키를 쓰므로 두 프롬프트의 요약 지침을 같게 유지해야 함
+PROMPT_VERSION = "2"
+
+SYSTEM_PROMPT = "당신은 뉴스 요약 전문가입니다. 정확하고 간결한 한국어 요약을 제공합니다."
+
+
+class SummaryError(Exception):
+    """요약 요청이 최종 실패했을 때 발생하는 예외 (메시지는 이메일에 표시할 대체 문구)"""
+
+
 class NewsSummarizer:
     """뉴스 요약을 담당하는 클래스"""
     
-    def __init__(self, client: OpenAI, model: str = "gpt-3.5-turbo", max_retries: int = 3):
+    def __init__(self, client: "OpenAI", model: str = "gpt-3.5-turbo", max_retries: int = 3,
+                 cache: Optional[SummaryCache] = None, rate_limiter: Optional[RateLimiter] = None,
+                 batch_size: int = 0, batch_max_chars: int = 500, batch_token_budget: int = 3000,
+                 max_input_tokens: int = 500, max_output_tokens: int = 500):
         self.client = client
         self.model = model
         self.max_retries = max_retries
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+        # 배치 요약 설정 (batch_size가 2 미만이면 배치 모드 사용 안 함)
+        self.batch_size = batch_size
+        self.batch_max_chars = batch_max_chars
+        self.batch_token_budget = batch_token_budget
+        # 기사 입력/요약 출력 토큰 예산
+        self.max_input_tokens = max_input_tokens
+        self.max_output_tokens = max_output_tokens
+        # 비용 보고용 토큰 사용량 (여러 스레드에서 갱신)
+        self._usage_lock = threading.Lock()
+        self.usage = {"requests": 0, "prompt_tokens": 0, "completion_tokens": 0}
     
-    def _get_optimal_max_tokens(self, text_length: int) -> int:
-        """텍스트 길이에 따라 최적의 토큰 수를 반환"""
-        if text_length < 200:
-            return 150
-        elif text_length < 500:
-            return 250
-        elif text_length < 1000:
-            return 350
-        else:
-            return 500
+    def _get_optimal_max_tokens(self, input_tokens: int) -> int:
+        """입력 토큰 수에 비례해 요약 출력 토큰 예산을 반환 (한국어 3-4문장 기준)"""
+        return min(self.max_output_tokens, 150 + int(input_tokens * 0.7))
     
+    def count_tokens(self, text: str) -> int:
+        """모델 토크나이저 기준 텍스트의 토큰 수를 반환"""
+        return count_tokens(text, self.model)
+
+    def _record_usage(self, response) -> None:
+        """응답의 프롬프트/완성 토큰 수를 누적"""
+        usage = getattr(response, "usage", None)
+        with self._usage_lock:
+            self.usage["requests"] += 1
+            if usage is not None:
+                self.usage["prompt_tokens"] += getattr(usage, "prompt_tokens", 0) or 0
+                self.usage["completion_tokens"] += getattr(usage, "completion_tokens", 0) or 0
+
+    def usage_stats(self) -> dict:
+        """지금까지의 요청 수와 토큰 사용량을 반환"""
+        with self._usage_lock:
+            return dict(self.usage)
+
+    def _estimate_tokens(self, prompt: str, max_tokens: int) -> int:
+        """요청 한 건이 사용할 토큰 수를 대략 추정 (분당 토큰 한도 계산용)"""
+        return self.count_tokens(prompt) + max_tokens
+
+    def _get_retry_after(self, error: "RateLimitError") -> Optional[float]:
+        """429 응답의 Retry-After 헤더에서 대기 시간(초)을 읽음"""
+        headers = getattr(getattr(error, "response", None), "headers", None) or {}
+        retry_after_ms = headers.get("retry-after-ms")
+        retry_after = headers.get("retry-after")
+        try:
+            if retry_after_ms is not None:
+                return float(retry_after_ms) / 1000
+            if retry_after is not None:
+                return float(retry_after)
+        except ValueError:
+            pass
+        return None
+
     def _create_enhanced_prompt(self, text: str) -> str:
         """향상된 프롬프트 생성"""
         return f"""
@@ -42,22 +105,30 @@ class NewsSummarizer:
 {text}
 
 한국어 요약:"""
+
+    def _create_batch_prompt(self, items: Dict[str, str]) -> str:
+        """여러 기사를 한 번에 요약하도록 요청하는 배치 프롬프트 생성"""
+        articles = json.dumps([{"id": article_id, "text": text} for article_id, text in items.items()],
+                              ensure_ascii=False)
+        return f"""
+당신은 전문 뉴스 에디터입니다. 다음 영어 뉴스 기사들을 각각 한국어로 정확하고 간결하게 요약해주세요.
+
+요약 가이드라인:
+1. 핵심 내용을 놓치지 말고 정확하게 전달
+2. 원문의 톤과 의미를 유지
+3. 불필요한 세부사항은 제외
+4. 읽기 쉬운 한국어로 작성
+5. 기사마다 3-4문장으로 간결하게 요약
+
+응답 형식:
+기사 id를 키로, 한국어 요약을 값으로 하는 JSON 객체만 출력하세요. 예: {{"1": "요약", "2": "요약"}}
+
+영어 기사 목록 (JSON):
+{articles}"""
     
-    def _truncate_text(self, text: str, max_chars: int = 2000) -> str:
-        """텍스트를 적절한 길이로 자르기"""
-        if len(text) <= max_chars:
-            return text
-        
-        # 문장 단위로 자르기 시도
-        sentences = text.split('. ')
-        truncated = ""
-        for sentence in sentences:
-            if len(truncated + sentence + '. ') <= max_chars:
-                truncated += sentence + '. '
-            else:
-                break
-        
-        return truncated.strip() or text[:max_chars] + "..."
+    def _truncate_text(self, text: str) -> str:
+        """텍스트를 문장 단위로 입력 토큰 예산에 맞게 자르기"""
+        return truncate_to_tokens(text, self.max_input_tokens, self.model)
     
     def summarize_to_korean(self, text: str) -> str:
         """영어 텍스트를 한국어로 요약하는 메인 함수"""
@@ -67,54 +138,173 @@ class NewsSummarizer:
         # 텍스트 전처리
         clean_text = text.strip()
         truncated_text = self._truncate_text(clean_text)
+
+        # 캐시에 있으면 API 호출 없이 바로 반환
+        cache_key = None
+        if self.cache is not None:
+            cache_key = SummaryCache.make_key(truncated_text, PROMPT_VERSION, self.model)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
         
+        return self._summarize_truncated(truncated_text, cache_key)
+
+    def _summarize_truncated(self, truncated_text: str, cache_key: Optional[str]) -> str:
+        """전처리된 텍스트 하나를 API로 요약하고 성공하면 캐시에 저장"""
         # 프롬프트 및 파라미터 설정
         prompt = self._create_enhanced_prompt(truncated_text)
-        max_tokens = self._get_optimal_max_tokens(len(truncated_text))
-        
-        # 재시도 로직
+        max_tokens = self._get_optimal_max_tokens(self.count_tokens(truncated_text))
+
+        try:
+            summary = self._complete(prompt, max_tokens)
+        except SummaryError as e:
+            return str(e)
+
+        if cache_key is not None:
+            self.cache.set(cache_key, summary)
+        return summary
+
+    def summarize_many(self, texts: List[str]) -> List[str]:
+        """짧은 기사 여러 개를 한 번의 요청으로 요약하는 배치 함수
+
+        모델이 응답에서 빠뜨린 기사는 단건 요청으로 다시 요약한다.
+        """
+        results = [""] * len(texts)
+        pending = {}  # 기사 id → (원래 인덱스, 전처리된 텍스트, 캐시 키)
+        for index, text in enumerate(texts):
+            if not text or not text.strip():
+                continue
+            truncated_text = self._truncate_text(text.strip())
+            cache_key = None
+            if self.cache is not None:
+                cache_key = SummaryCache.make_key(truncated_text, PROMPT_VERSION, self.model)
+                cached = self.cache.get(cache_key)
+                if cached is not None:
+                    results[index] = cached
+                    continue
+            pending[str(len(pending) + 1)] = (index, truncated_text, cache_key)
+
+        summaries = {}
+        if len(pending) > 1:
+            summaries = self._request_batch({article_id: item[1] for article_id, item in pending.items()})
+
+        for article_id, (index, truncated_text, cache_key) in pending.items():
+            summary = summaries.get(article_id)
+            if summary:
+                if cache_key is not None:
+                    self.cache.set(cache_key, summary)
+                results[index] = summary
+            else:
+                results[index] = self._summarize_truncated(truncated_text, cache_key)
+        return results
+
+    def _request_batch(self, items: Dict[str, str]) -> Dict[str, str]:
+        """배치 요약 요청을 보내고 기사 id별 요약을 반환 (실패 시 빈 dict)"""
+        prompt = self._create_batch_prompt(items)
+        max_tokens = min(4000, sum(self._get_optimal_max_tokens(self.count_tokens(text))
+                                   for text in items.values()))
+
+        try:
+            content = self._complete(prompt, max_tokens, response_format={"type": "json_object"})
+            data = json.loads(content)
+        except SummaryError as e:
+            logger.warning(f"배치 요약 실패, 단건 요청으로 대체: {e}")
+            return {}
+        except ValueError as e:
+            logger.warning(f"배치 요약 응답 파싱 실패, 단건 요청으로 대체: {e}")
+            return {}
+
+        if not isinstance(data, dict):
+            return {}
+        return {str(article_id): summary.strip() for article_id, summary in data.items()
+                if str(article_id) in items and isinstance(summary, str) and summary.strip()}
+
+    def _complete(self, prompt: str, max_tokens: int, **options) -> str:
+        """재시도와 요청 한도를 처리하며 채팅 완성 요청을 보내고 응답 텍스트를 반환"""
+        # openai 모듈은 첫 요청 때 import (시작 시간 단축)
+        from openai import OpenAIError, RateLimitError
+
         for attempt in range(1, self.max_retries + 1):
             try:
-                response = self.client.chat.completions.create(
-                    model=self.model,
-                    messages=[
-                        {
-                            "role": "system", 
-                            "content": "당신은 뉴스 요약 전문가입니다. 정확하고 간결한 한국어 요약을 제공합니다."
-                        },
-                        {"role": "user", "content": prompt}
-                    ],
-                    max_tokens=max_tokens,
-                    temperature=0.3,  # 일관된 결과를 위해 낮은 temperature
-                    presence_penalty=0.1
-                )
+                if self.rate_limiter is not None:
+                    with metrics.span("openai.rate_limit_wait"):
+                        self.rate_limiter.acquire(self._estimate_tokens(prompt, max_tokens))
+                with metrics.span("openai.request"):
+                    response = self.client.chat.completions.create(
+                        model=self.model,
+                        messages=[
+                            {
+                                "role": "system", 
+                                "content": SYSTEM_PROMPT
+                            },
+                            {"role": "user", "content": prompt}
+                        ],
+                        max_tokens=max_tokens,
+                        temperature=0.3,  # 일관된 결과를 위해 낮은 temperature
+                        presence_penalty=0.1,
+                        **options
+                    )
+                self._record_usage(response)
                 
-                summary = response.choices[0].message.content
-                if summary and summary.strip():
-                    return summary.strip()
+                content = response.choices[0].message.content
+                if content and content.strip():
+                    return content.strip()
                 else:
                     logger.warning(f"빈 응답 받음 (시도 {attempt}/{self.max_retries})")
-                    
+
+            except RateLimitError as e:
+                metrics.incr("openai.rate_limited")
+                logger.warning(f"OpenAI 요청 한도 초과 (시도 {attempt}/{self.max_retries}): {e}")
+                if attempt < self.max_retries:
+                    # 서버가 알려준 Retry-After를 우선 따르고, 없으면 지수 백오프
+                    wait_time = self._get_retry_after(e) or 2 ** attempt
+                    logger.info(f"{wait_time}초 대기 후 재시도...")
+                    if self.rate_limiter is not None:
+                        self.rate_limiter.defer(wait_time)
+                    else:
+                        time.sleep(wait_time)
+                else:
+                    raise SummaryError(f"[요약 실패 - API 오류: {type(e).__name__}]")
+
             except OpenAIError as e:
+                metrics.incr("openai.errors")
                 logger.error(f"OpenAI API 오류 (시도 {attempt}/{self.max_retries}): {e}")
                 if attempt < self.max_retries:
                     wait_time = 2 ** attempt  # 지수 백오프
                     logger.info(f"{wait_time}초 대기 후 재시도...")
                     time.sleep(wait_time)
                 else:
-                    return f"[요약 실패 - API 오류: {type(e).__name__}]"
+                    raise SummaryError(f"[요약 실패 - API 오류: {type(e).__name__}]")
                     
             except Exception as e:
                 logger.error(f"예상치 못한 오류 (시도 {attempt}/{self.max_retries}): {e}")
                 if attempt < self.max_retries:
                     time.sleep(1)
                 else:
-                    return f"[요약 실패 - 시스템 오류]"
+                    raise SummaryError("[요약 실패 - 시스템 오류]")
         
-        return "[요약 실패 - 최대 재시도 횟수 초과]"
+        raise SummaryError("[요약 실패 - 최대 재시도 횟수 초과]")
 
 # 기존 함수 호환성을 위한 래퍼 함수
-def summarize_to_korean(client: OpenAI, text: str) -> str:
+def summarize_to_korean(client: "OpenAI", text: str, cache: Optional[SummaryCache] = None) -> str:
     """기존 코드와의 호환성을 위한 래퍼 함수"""
-    summarizer = NewsSummarizer(client)
-    return summarizer.summarize_to_korean(text)
\ No newline at end of file
+    summarizer = NewsSummarizer(client, cache=cache)
+    return summarizer.summarize_to_korean(text)
+
+def batch_tokens(article, summarizer: NewsSummarizer) -> Optional[int]:
+    """배치로 묶어 요약할 짧은 기사면 입력 토큰 수를, 단건으로 요약할 기사면 None을 반환하는 함수"""
+    if summarizer.batch_size <= 1 or len(article["content"]) > summarizer.batch_max_chars:
+        return None
+    return summarizer.count_tokens(article["content"])
+
+def batch_has_room(summarizer: NewsSummarizer, size: int, tokens: int, article_tokens: int) -> bool:
+    """기사 size개(입력 토큰 tokens개)가 든 배치에 article_tokens개짜리 기사를 더 넣을 수 있는지 확인하는 함수"""
+    if not size:
+        return True
+    return size < summarizer.batch_size and tokens + article_tokens <= summarizer.batch_token_budget
+
+def summarize_group(group, summarizer: NewsSummarizer) -> List[str]:
+    """기사 묶음을 요약해 기사 순서대로 요약 목록을 반환하는 함수 (한 건이면 단건 요청)"""
+    if len(group) == 1:
+        return [summarizer.summarize_to_korean(group[0]["content"])]
+    return summarizer.summarize_many([article["content"] for article in group])
@@ -0,0 +1,95 @@
+import sqlite3
+import hashlib
+import threading
+import time
+import logging
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+
+class SummaryCache:
+    """요약 결과를 디스크에 보관하는 내용 주소 기반(content-addressed) 캐시 클래스"""
+
+    def __init__(self, path: str, max_entries: int = 5000, max_age_days: float = 7):
+        self.path = path
+        self.max_entries = max_entries
+        self.max_age_seconds = max_age_days * 24 * 60 * 60
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS summaries (
+                key TEXT PRIMARY KEY,
+                summary TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )"""
+        )
+        self._conn.commit()
+        self.evict()
+
+    @staticmethod
+    def make_key(text: str, prompt_version: str, model: str) -> str:
+        """요약 대상 텍스트, 프롬프트 버전, 모델로 캐시 키를 생성"""
+        payload = f"{model}\0{prompt_version}\0{text}".encode("utf-8")
+        return hashlib.sha256(payload).hexdigest()
+
+    def get(self, key: str):
+        """캐시된 요약을 반환 (없거나 만료되었으면 None)"""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT summary, created_at FROM summaries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or now - row[1] > self.max_age_seconds:
+                self.misses += 1
+                return None
+            self._conn.execute("UPDATE summaries SET accessed_at = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self.hits += 1
+            return row[0]
+
+    def set(self, key: str, summary: str) -> None:
+        """요약 결과를 캐시에 저장"""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO summaries (key, summary, created_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, summary, now, now)
+            )
+            self._conn.commit()
+
+    def evict(self) -> int:
+        """오래된 항목과 최대 개수를 넘는 항목(최근 사용이 오래된 순)을 삭제"""
+        cutoff = time.time() - self.max_age_seconds
+        with self._lock:
+            removed = self._conn.execute("DELETE FROM summaries WHERE created_at < ?", (cutoff,)).rowcount
+            removed += self._conn.execute(
+                """DELETE FROM summaries WHERE key IN (
+                    SELECT key FROM summaries ORDER BY accessed_at DESC LIMIT -1 OFFSET ?
+                )""",
+                (self.max_entries,)
+            ).rowcount
+            self._conn.commit()
+        if removed:
+            logger.info(f"요약 캐시 정리: {removed}개 항목 삭제")
+        return removed
+
+    def stats(self) -> dict:
+        """캐시 적중/실패 통계를 반환"""
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM summaries").fetchone()[0]
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": entries
+        }
+
+    def close(self) -> None:
+        """데이터베이스 연결을 닫음"""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,86 @@
+import re
+import logging
+from functools import lru_cache
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# 문장 끝(. ! ? 。) 뒤의 공백에서 문장을 나눔
+SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?。])\s+')
+
+
+@lru_cache(maxsize=1)
+def _import_tiktoken():
+    """tiktoken 모듈을 반환 (설치되어 있지 않으면 한 번만 경고하고 None)"""
+    try:
+        import tiktoken  # 처음 토큰을 셀 때 import (시작 시간 단축)
+    except ImportError:  # tiktoken이 없으면 글자 수 기반 추정으로 대체
+        logger.warning("tiktoken이 설치되어 있지 않아 글자 수 기반 토큰 추정치 사용 (pip install tiktoken)")
+        return None
+    return tiktoken
+
+
+@lru_cache(maxsize=8)
+def _get_encoding(model: str):
+    """모델에 맞는 tiktoken 인코딩을 반환 (사용할 수 없으면 None)"""
+    tiktoken = _import_tiktoken()
+    if tiktoken is None:
+        return None
+    try:
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:  # 모르는 모델이면 기본 인코딩 (이것도 내려받지 못하면 아래에서 추정치로 대체)
+            return tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        logger.warning(f"토크나이저 로드 실패, 추정치 사용: {e}")
+        return None
+
+
+def count_tokens(text: str, model: str) -> int:
+    """텍스트의 토큰 수를 반환 (토크나이저가 없으면 언어별 추정치)"""
+    if not text:
+        return 0
+    encoding = _get_encoding(model)
+    if encoding is not None:
+        return len(encoding.encode(text))
+
+    # 영문은 약 4글자당 1토큰, 한글 등 비ASCII 문자는 글자당 약 1토큰
+    ascii_chars = sum(1 for char in text if char < '\x80')
+    return ascii_chars // 4 + (len(text) - ascii_chars) + 1
+
+
+def _truncate_estimated(text: str, max_tokens: int) -> str:
+    """count_tokens()의 글자 수 추정치로 max_tokens 안에 드는 가장 긴 앞부분을 반환"""
+    # 영문 글자는 1/4토큰, 비ASCII 글자는 1토큰이므로 1/4토큰 단위로 세고, 추정치의 +1 보정을 예산에서 뺌
+    budget = (max_tokens - 1) * 4 + 3
+    quarters = 0
+    for index, char in enumerate(text):
+        quarters += 1 if char < '\x80' else 4
+        if quarters > budget:
+            return text[:index]
+    return text
+
+
+def truncate_to_tokens(text: str, max_tokens: int, model: str) -> str:
+    """문장 경계를 유지하면서 토큰 예산 안으로 텍스트를 자르는 함수 (한 번의 선형 순회)"""
+    if count_tokens(text, model) <= max_tokens:
+        return text
+
+    kept = []
+    used = 0
+    for sentence in SENTENCE_BOUNDARY.split(text):
+        # 문장 사이 공백 한 칸의 토큰도 함께 계산
+        tokens = count_tokens(sentence, model) + (1 if kept else 0)
+        if used + tokens > max_tokens:
+            break
+        kept.append(sentence)
+        used += tokens
+
+    if kept:
+        return " ".join(kept)
+
+    # 첫 문장부터 예산을 넘으면 토큰 단위로 자름
+    encoding = _get_encoding(model)
+    if encoding is not None:
+        return encoding.decode(encoding.encode(text)[:max_tokens]) + "..."
+    return _truncate_estimated(text, max_tokens) + "..."
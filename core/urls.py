@@ -0,0 +1,131 @@
+import re
+import base64
+import binascii
+import hashlib
+from functools import lru_cache
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+# 같은 기사를 가리키지만 유입 경로만 다른 추적용 쿼리 파라미터
+_TRACKING_PARAMS = frozenset((
+    "fbclid", "gclid", "dclid", "msclkid", "yclid", "igshid", "mc_cid", "mc_eid",
+    "ocid", "cmpid", "ref", "ref_src", "referrer", "spm"
+))
+_TRACKING_PREFIXES = ("utm_", "at_", "_ga", "_hs")
+
+# 구글 뉴스 RSS 링크 (https://news.google.com/rss/articles/<인코딩된 ID>?oc=5)
+_GOOGLE_NEWS_PATH = re.compile(r'^/(?:rss/)?articles/([A-Za-z0-9_-]+)$')
+# 구글 뉴스 링크에만 붙는 유입 경로 파라미터
+_GOOGLE_NEWS_PARAMS = frozenset(("oc", "hl", "gl", "ceid"))
+# 구글 뉴스 ID 안의 protobuf 메시지에서 원문 URL 필드 앞에 오는 바이트
+_GOOGLE_NEWS_PREFIX = b'\x08\x13\x22'
+
+# 네이버 뉴스 기사 경로 (/mnews/article/<언론사 ID>/<기사 ID>, /article/<언론사 ID>/<기사 ID>)
+_NAVER_ARTICLE_PATH = re.compile(r'^/(?:mnews/)?article/(\d+)/(\d+)$')
+_NAVER_HOSTS = frozenset(("news.naver.com", "n.news.naver.com", "m.news.naver.com"))
+
+_DEFAULT_PORTS = {"http": "80", "https": "443"}
+
+
+def _decode_google_news(article_id):
+    """구글 뉴스 기사 ID에 원문 URL이 들어 있으면 꺼내는 함수 (네트워크 요청 없음)
+
+    예전 형식의 ID는 protobuf 메시지를 base64로 인코딩한 것이라 원문 URL을 바로 꺼낼 수 있다.
+    원문 URL이 들어 있지 않은 새 형식(AU_yqL...)이면 None을 반환한다.
+    """
+    try:
+        data = base64.urlsafe_b64decode(article_id + '=' * (-len(article_id) % 4))
+    except (ValueError, binascii.Error):
+        return None
+    if not data.startswith(_GOOGLE_NEWS_PREFIX):
+        return None
+
+    # 길이는 varint로 인코딩됨
+    index = len(_GOOGLE_NEWS_PREFIX)
+    length = shift = 0
+    while index < len(data):
+        byte = data[index]
+        index += 1
+        length |= (byte & 0x7F) << shift
+        shift += 7
+        if not byte & 0x80:
+            break
+    url = data[index:index + length].decode('utf-8', 'ignore')
+    if url.startswith(("http://", "https://")):
+        return url
+    return None
+
+
+def _unwrap(host, path, query):
+    """알려진 리다이렉트 래퍼 URL이면 감싼 원문 URL을 반환하는 함수"""
+    if host == "news.google.com":
+        match = _GOOGLE_NEWS_PATH.match(path)
+        if match:
+            return _decode_google_news(match.group(1))
+    elif host in ("google.com", "www.google.com") and path == "/url":
+        params = dict(parse_qsl(query))
+        target = params.get("url") or params.get("q")
+        if target and target.startswith(("http://", "https://")):
+            return target
+    return None
+
+
+def _is_tracking_param(host, name):
+    name = name.lower()
+    if host == "news.google.com" and name in _GOOGLE_NEWS_PARAMS:
+        return True
+    return name in _TRACKING_PARAMS or name.startswith(_TRACKING_PREFIXES)
+
+
+@lru_cache(maxsize=65536)
+def canonicalize_url(url):
+    """같은 기사를 가리키는 URL들이 같은 문자열이 되도록 정규화하는 함수 (같은 URL은 캐시된 결과 사용)
+
+    추적용 파라미터와 프래그먼트를 제거하고, 스킴은 https로, 호스트는 소문자로 맞추며,
+    구글 뉴스/구글 리다이렉트 링크는 URL 안에 들어 있는 원문 URL로 바꾼다.
+    네이버 뉴스 기사 링크는 언론사 ID와 기사 ID만 남긴 한 가지 형식으로 바꾼다.
+    """
+    url = url.strip()
+    for _ in range(3):  # 래퍼가 겹쳐 있어도 몇 단계까지만 풀어냄
+        parts = urlsplit(url)
+        host = (parts.hostname or "").lower()
+        target = _unwrap(host, parts.path, parts.query)
+        if target is None:
+            break
+        url = target
+
+    scheme = parts.scheme.lower()
+    if scheme not in _DEFAULT_PORTS:
+        return url
+    if host.startswith("www."):
+        host = host[4:]
+    try:
+        port = parts.port
+    except ValueError:
+        port = None
+    netloc = host if port is None or str(port) == _DEFAULT_PORTS[scheme] else f"{host}:{port}"
+
+    params = parse_qsl(parts.query, keep_blank_values=True)
+    if host in _NAVER_HOSTS:
+        match = _NAVER_ARTICLE_PATH.match(parts.path)
+        values = dict(params)
+        if match:
+            oid, aid = match.groups()
+        else:
+            oid, aid = values.get("oid"), values.get("aid")
+        if oid and aid:
+            return f"https://n.news.naver.com/mnews/article/{oid}/{aid}"
+
+    path = parts.path or "/"
+    if len(path) > 1 and path.endswith("/"):
+        path = path.rstrip("/") or "/"
+    query = urlencode(sorted((name, value) for name, value in params if not _is_tracking_param(host, name)))
+    return urlunsplit(("https", netloc, path, query, ""))
+
+
+def article_id_for_url(url):
+    """정규화된 URL로 발송 기록에 쓰는 기사 ID를 만드는 함수
+
+    64비트 부호 있는 정수라 16진수 문자열보다 작고, SQLite INTEGER에 그대로 저장된다.
+    """
+    digest = hashlib.blake2b(canonicalize_url(url).encode(), digest_size=8).digest()
+    return int.from_bytes(digest, 'little', signed=True)
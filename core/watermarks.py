@@ -0,0 +1,116 @@
+import sqlite3
+import threading
+import time
+
+# 날짜순이 아닌 피드에서 이미 처리한 엔트리 ID를 기억하는 기간(일)
+SEEN_RETENTION_DAYS = 3
+
+
+class WatermarkStore:
+    """(소스, 검색어)별로 이전 작업에서 처리한 기사를 기억하는 클래스
+
+    최신순으로 정렬된 소스(네이버)는 가장 최신 기사의 발행 시각과 ID(워터마크)만 보관하고,
+    관련도순 등 날짜순이 아닌 피드(구글 뉴스, BBC)는 실제로 내보낸 엔트리 ID를 모아 둔다.
+    수집 중에는 advance()/mark_seen()으로 메모리에만 모아 두고,
+    이메일 발송이 끝난 뒤 commit()으로 저장해 발송에 실패한 기사를 건너뛰지 않도록 한다.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._pending = {}
+        self._pending_seen = []
+        self._frozen = False
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS feed_watermarks (
+                source TEXT NOT NULL,
+                query TEXT NOT NULL,
+                newest_ts REAL NOT NULL,
+                newest_id TEXT NOT NULL,
+                PRIMARY KEY (source, query)
+            )"""
+        )
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS feed_seen_entries (
+                source TEXT NOT NULL,
+                query TEXT NOT NULL,
+                entry_id TEXT NOT NULL,
+                seen_at REAL NOT NULL,
+                PRIMARY KEY (source, query, entry_id)
+            )"""
+        )
+        self._conn.execute("DELETE FROM feed_seen_entries WHERE seen_at < ?",
+                           (time.time() - SEEN_RETENTION_DAYS * 86400,))
+        self._conn.commit()
+        self._marks = {
+            (row[0], row[1]): (row[2], row[3])
+            for row in self._conn.execute("SELECT source, query, newest_ts, newest_id FROM feed_watermarks")
+        }
+        self._seen = {}
+        for source, query, entry_id in self._conn.execute("SELECT source, query, entry_id FROM feed_seen_entries"):
+            self._seen.setdefault((source, query), set()).add(entry_id)
+
+    def get(self, source, query):
+        """저장된 워터마크 (발행 시각 타임스탬프, 기사 ID)를 반환 (없으면 None)"""
+        return self._marks.get((source, query))
+
+    def is_seen(self, source, query, timestamp, entry_id):
+        """이전 작업에서 이미 처리한 기사인지 확인"""
+        mark = self._marks.get((source, query))
+        if mark is None:
+            return False
+        if entry_id and entry_id == mark[1]:
+            return True
+        return timestamp is not None and timestamp < mark[0]
+
+    def advance(self, source, query, timestamp, entry_id):
+        """이번 작업에서 본 가장 최신 기사로 워터마크를 올림 (commit 전까지는 메모리에만 보관)"""
+        with self._lock:
+            if self._frozen:
+                return
+            key = (source, query)
+            current = self._pending.get(key) or self._marks.get(key)
+            if current is None or timestamp > current[0]:
+                self._pending[key] = (timestamp, entry_id)
+
+    def has_seen(self, source, query, entry_id):
+        """날짜순이 아닌 피드에서 이전 작업이 이미 내보낸 엔트리인지 확인"""
+        return entry_id in self._seen.get((source, query), ())
+
+    def mark_seen(self, source, query, entry_ids):
+        """이번 작업에서 내보낸 엔트리 ID를 기록 (commit 전까지는 메모리에만 보관)"""
+        with self._lock:
+            if self._frozen:
+                return
+            self._pending_seen.extend((source, query, entry_id) for entry_id in entry_ids if entry_id)
+
+    def freeze(self):
+        """수집 마감 이후 늦게 끝난 요청이 워터마크를 올리지 못하도록 막음"""
+        with self._lock:
+            self._frozen = True
+
+    def commit(self):
+        """모아 둔 워터마크를 저장"""
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO feed_watermarks (source, query, newest_ts, newest_id) VALUES (?, ?, ?, ?)",
+                [(source, query, timestamp, entry_id)
+                 for (source, query), (timestamp, entry_id) in self._pending.items()]
+            )
+            now = time.time()
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO feed_seen_entries (source, query, entry_id, seen_at) VALUES (?, ?, ?, ?)",
+                [(source, query, entry_id, now) for source, query, entry_id in self._pending_seen]
+            )
+            self._conn.commit()
+            self._marks.update(self._pending)
+            self._pending.clear()
+            for source, query, entry_id in self._pending_seen:
+                self._seen.setdefault((source, query), set()).add(entry_id)
+            self._pending_seen.clear()
+
+    def close(self):
+        """데이터베이스 연결을 닫음"""
+        with self._lock:
+            self._conn.close()
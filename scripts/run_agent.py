@@ -1,18 +1,104 @@
 from config.settings import *
-from core.collector import fetch_all_news
-from core.storage import load_sent_articles, save_sent_articles, filter_new_articles
-from core.mailer import send_news_email
+from datetime import datetime
+from core.collector import iter_all_news, configure_sources, configure_source_limits, configure_naver_paging
+from core import metrics
+from core.dates import set_report_timezone
+from core.http_cache import FeedHttpCache, configure_feed_parsing, shutdown_feed_parsing
+from core.quota import QuotaStore
+from core.watermarks import WatermarkStore
+from core.storage import SentArticleStore
+from core.pipeline import normalize_articles, dedup_articles, rank_articles, summarize_stream, render_items
+from core.mailer import SmtpMailer, load_subscribers, send_digests, delivered_article_ids
 from core.scheduler import register_schedules
-from openai import OpenAI
+from core.summary_cache import SummaryCache
+from core.summarizer import NewsSummarizer
+from core.rate_limiter import RateLimiter
 
-client = OpenAI(api_key=OPENAI_API_KEY)
+set_report_timezone(REPORT_TIMEZONE)
+configure_sources(NAVER_API_URL, GOOGLE_NEWS_RSS_URL, BBC_RSS_URLS)
+configure_source_limits({
+    "naver": {"requests_per_second": NAVER_REQUESTS_PER_SECOND, "burst": NAVER_REQUESTS_PER_SECOND,
+              "daily_quota": NAVER_DAILY_QUOTA},
+    "google": {"requests_per_second": GOOGLE_REQUESTS_PER_SECOND, "burst": GOOGLE_REQUESTS_PER_SECOND}
+}, SOURCE_FAILURE_THRESHOLD, SOURCE_COOL_DOWN)
+configure_naver_paging(NAVER_PAGE_SIZE, NAVER_MAX_PAGES, NAVER_PAGE_CONCURRENCY, NAVER_MAX_ARTICLES)
+rate_limiter = RateLimiter(OPENAI_REQUESTS_PER_MINUTE, OPENAI_TOKENS_PER_MINUTE)
 
 def job():
-    sent_set = load_sent_articles(DB_FILE)
-    articles = fetch_all_news(KEYWORDS, NAVER_CLIENT_ID, NAVER_CLIENT_SECRET)
-    new_articles = filter_new_articles(articles, sent_set)
-    send_news_email(new_articles, client, GMAIL_ADDRESS, GMAIL_APP_PASSWORD, RECIPIENT_EMAIL)
-    save_sent_articles(sent_set, DB_FILE)
+    metrics.start_run("news_job")
+    # 이전 작업 끝에 닫은 피드 파싱 풀을 이번 작업용으로 다시 열고, 작업이 끝나면 닫음
+    configure_feed_parsing(FEED_PARSE_WORKERS)
+    store = SentArticleStore(SENT_DB_FILE)
+    store.compact(DEDUP_WINDOW_DAYS, DEDUP_EXACT_DAYS, DEDUP_BLOOM_ERROR_RATE)
+    sent_set = store.load_window(DEDUP_WINDOW_DAYS, DEDUP_EXACT_DAYS)
+    feed_cache = FeedHttpCache(FEED_CACHE_FILE)
+    watermarks = WatermarkStore(WATERMARK_FILE)
+    quota_store = QuotaStore(QUOTA_FILE)
+    summary_cache = SummaryCache(SUMMARY_CACHE_FILE, SUMMARY_CACHE_MAX_ENTRIES, SUMMARY_CACHE_MAX_AGE_DAYS)
+    summarizer = NewsSummarizer(
+        get_openai_client(), cache=summary_cache, rate_limiter=rate_limiter,
+        batch_size=SUMMARY_BATCH_SIZE,
+        batch_max_chars=SUMMARY_BATCH_MAX_CHARS,
+        batch_token_budget=SUMMARY_BATCH_TOKEN_BUDGET
+    )
+    subscribers = load_subscribers(SUBSCRIBERS_FILE, RECIPIENT_EMAIL, KEYWORDS)
+    # 구독자 키워드가 기본 키워드에 없으면 함께 수집
+    keywords = list(dict.fromkeys(
+        KEYWORDS + [keyword for subscriber in subscribers for keyword in subscriber["keywords"] or ()]
+    ))
+    try:
+        # 수집 → 정규화 → 중복 제거 → 순위 → 요약 → 렌더링을 기사 단위로 흘려보냄
+        articles = iter_all_news(
+            keywords, NAVER_CLIENT_ID, NAVER_CLIENT_SECRET,
+            timeout=COLLECT_TIMEOUT,
+            deadline=COLLECT_DEADLINE,
+            source_concurrency={"naver": COLLECT_CONCURRENCY, "google": COLLECT_CONCURRENCY, "bbc": COLLECT_CONCURRENCY},
+            feed_cache=feed_cache,
+            watermarks=watermarks,
+            quota_store=quota_store
+        )
+        articles = normalize_articles(articles)
+        # 여러 출처의 같은 스토리는 대표 기사 하나만 요약/발송
+        articles = dedup_articles(articles, sent_set, CLUSTER_SIMILARITY_THRESHOLD)
+        articles = rank_articles(articles, PIPELINE_RANK_WINDOW)
+        articles = summarize_stream(articles, summarizer, SUMMARY_CONCURRENCY, PIPELINE_SUMMARY_WINDOW)
+        items = render_items(articles)
+        print(f"피드 캐시 통계: {feed_cache.stats()}")
+        metrics.set_value("feed_cache", feed_cache.stats())
+        metrics.set_value("source_quota", quota_store.usage())
+
+        all_delivered = True
+        if items:
+            # 공통 기사 HTML은 한 번만 렌더링하고, 구독자별 이메일은 하나의 SMTP 연결 풀로 발송
+            with SmtpMailer(SMTP_HOST, SMTP_PORT, GMAIL_ADDRESS, GMAIL_APP_PASSWORD,
+                            security=SMTP_SECURITY, pool_size=SMTP_POOL_SIZE) as mailer:
+                results = send_digests(mailer, subscribers, items)
+            failed = [email for email, ok in results.items() if not ok]
+            if failed:
+                print(f"{datetime.now()} - 발송 실패 구독자: {', '.join(failed)}")
+            # 받을 구독자 중 한 명에게라도 보낸 기사만 기록 (대표 기사에 묶인 다른 출처 기사 포함)
+            # 받을 구독자 모두에게 실패한 기사는 기록하지 않고 다음 배치에서 다시 보냄
+            store.mark_sent(delivered_article_ids(subscribers, items, results))
+            all_delivered = not failed
+        else:
+            print(f"{datetime.now()} - 발송할 새 뉴스 없음")
+        # 발송할 기사가 없었거나 모든 구독자에게 보냈을 때만 워터마크를 올림 (보내지 못한 기사를 다시 수집)
+        if all_delivered:
+            watermarks.commit()
+        print(f"요약 캐시 통계: {summary_cache.stats()}")
+        print(f"OpenAI 토큰 사용량: {summarizer.usage_stats()}")
+        metrics.set_value("summary_cache", summary_cache.stats())
+        metrics.set_value("openai_usage", summarizer.usage_stats())
+    finally:
+        shutdown_feed_parsing()
+        feed_cache.close()
+        summary_cache.close()
+        watermarks.close()
+        quota_store.close()
+        store.close()
+        print(f"실행 보고서: {metrics.write_report(METRICS_REPORT_DIR)}")
 
 if __name__ == "__main__":
-    register_schedules(job, BATCH_TIMES)
\ No newline at end of file
+    validate_settings()
+    register_schedules(job, BATCH_TIMES, JOB_TIMEOUT, SCHEDULER_LOCK_FILE, SCHEDULE_CATCH_UP_MINUTES,
+                       METRICS_PORT, METRICS_REPORT_DIR)
\ No newline at end of file
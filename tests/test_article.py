@@ -0,0 +1,42 @@
+import pytest
+
+from core.article import Article
+
+
+def _article():
+    return Article(title="Title", url="https://example.com/a?utm_source=x", content="Body",
+                   source="BBC", language="en")
+
+
+def test_dict_style_access_reads_fields_and_skips_unset_ones():
+    article = _article()
+    assert article["title"] == article.title == "Title"
+    assert "summary" not in article and article.get("summary", "없음") == "없음"
+    with pytest.raises(KeyError):
+        article["unknown"]
+    assert article.to_dict() == {"title": "Title", "url": "https://example.com/a?utm_source=x", "content": "Body",
+                                 "source": "BBC", "language": "en", "matched_keywords": []}
+    # 출처 문자열은 모든 기사가 같은 객체를 공유
+    assert _article().source is article.source
+
+
+def test_immutable_fields_cannot_be_assigned_after_init():
+    article = _article()
+    article_id = article.id
+    for name in ("title", "url", "content", "source", "language", "_id", "_normalized_url"):
+        with pytest.raises(AttributeError):
+            setattr(article, name, "changed")
+    with pytest.raises(KeyError):
+        article["url"] = "https://example.com/b"
+    assert article.url == "https://example.com/a?utm_source=x"
+    assert article.id == article_id
+
+
+def test_pipeline_fields_stay_mutable():
+    article = _article()
+    article.summary = "요약"
+    article["alternate_sources"] = []
+    article.matched_keywords.append("AI")
+    assert article.get("summary") == "요약"
+    assert article.setdefault("alternate_sources", None) == []
+    assert article["matched_keywords"] == ["AI"]
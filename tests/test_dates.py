@@ -0,0 +1,77 @@
+import time
+from datetime import datetime, timezone, timedelta
+
+import pytest
+
+from core import dates
+
+KST = timezone(timedelta(hours=9))
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """dates 모듈의 현재 시각을 고정하는 함수를 반환 (기준 시간대는 테스트 후 되돌림)"""
+    def freeze(now):
+        class FrozenDatetime(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return now.astimezone(tz)
+
+        monkeypatch.setattr(dates, "datetime", FrozenDatetime)
+
+    yield freeze
+    dates.set_report_timezone("Asia/Seoul")
+
+
+def test_day_boundary_follows_the_report_timezone(clock):
+    # 서울 0시 10분은 UTC로 아직 전날
+    clock(datetime(2025, 8, 24, 0, 10, tzinfo=KST))
+    assert dates.today().isoformat() == "2025-08-24"
+    assert dates.start_of_today() == datetime(2025, 8, 23, 15, 0, tzinfo=timezone.utc)
+
+    assert dates.is_today(datetime(2025, 8, 23, 15, 0, tzinfo=timezone.utc))
+    assert not dates.is_today(datetime(2025, 8, 23, 14, 59, 59, tzinfo=timezone.utc))
+    assert dates.is_today(dates.parse_date_string("Sun, 24 Aug 2025 00:00:00 +0900"))
+    assert not dates.is_today(dates.parse_date_string("Sat, 23 Aug 2025 23:59:59 +0900"))
+    assert dates.is_today(dates.parse_date_string("Sat, 23 Aug 2025 16:00:00 GMT"))
+
+
+def test_changing_the_report_timezone_moves_the_boundary(clock):
+    clock(datetime(2025, 8, 24, 0, 10, tzinfo=KST))
+    dates.set_report_timezone("UTC")
+    assert dates.today().isoformat() == "2025-08-23"
+    assert dates.start_of_today() == datetime(2025, 8, 23, tzinfo=timezone.utc)
+    # 서울 기준으로는 같은 24일이라도 UTC 0시 이후면 내일 기사
+    assert dates.is_today(datetime(2025, 8, 24, 8, 59, tzinfo=KST))
+    assert not dates.is_today(datetime(2025, 8, 24, 9, 0, tzinfo=KST))
+
+
+def test_naive_timestamps_are_read_in_the_report_timezone():
+    naive = dates.parse_date_string("2025-08-24T00:30:00")
+    assert naive == datetime(2025, 8, 24, 0, 30, tzinfo=KST)
+    assert dates.parse_date_string("24 Aug 2025 00:30") == naive
+    assert dates.parse_date_string("2025-08-24T00:30:00+00:00") == datetime(2025, 8, 24, 0, 30, tzinfo=timezone.utc)
+    assert dates.parse_date_string("24 Aug 2025 00:30 GMT") == datetime(2025, 8, 24, 0, 30, tzinfo=timezone.utc)
+
+
+def test_naive_timestamps_follow_a_changed_report_timezone(clock):
+    assert dates.parse_date_string("2025-08-24 00:30").utcoffset() == timedelta(hours=9)
+    # 캐시된 결과가 이전 기준 시간대로 남아 있지 않아야 함
+    dates.set_report_timezone("America/New_York")
+    assert dates.parse_date_string("2025-08-24 00:30").utcoffset() == timedelta(hours=-4)
+
+
+def test_rfc822_zones_and_two_digit_years():
+    assert dates.parse_date_string("Sun, 24 Aug 2025 09:30:00 +0900") == datetime(2025, 8, 24, 0, 30, tzinfo=timezone.utc)
+    assert dates.parse_date_string("24 Aug 25 01:30 EDT") == datetime(2025, 8, 24, 5, 30, tzinfo=timezone.utc)
+    assert dates.parse_date_string("not a date") is None
+
+
+def test_feedparser_struct_time_is_read_as_utc():
+    parsed = time.strptime("2025-08-23 15:30:00", "%Y-%m-%d %H:%M:%S")
+    # 문자열보다 feedparser가 UTC로 변환해 둔 값을 우선 사용
+    published = dates.normalize_pub_date("Sun, 24 Aug 2025 09:00:00 +0900", parsed)
+    assert published == datetime(2025, 8, 23, 15, 30, tzinfo=timezone.utc)
+    assert dates.normalize_pub_date("Sun, 24 Aug 2025 09:00:00 +0900", None) == datetime(2025, 8, 24, 0, 0, tzinfo=timezone.utc)
+    assert dates.normalize_pub_date("", None) is None
+    assert dates.normalize_pub_date(None, (2025, 13, 40, 0, 0, 0)) is None
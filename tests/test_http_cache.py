@@ -0,0 +1,36 @@
+from core import http_cache
+from core.http_cache import configure_feed_parsing, shutdown_feed_parsing, parse_feed
+
+FEED = ("<?xml version='1.0'?><rss version='2.0'><channel><title>t</title>"
+        + "".join(f"<item><title>Story {n}</title><link>https://example.com/{n}</link>"
+                  f"<description>{'x' * 200}</description></item>" for n in range(100))
+        + "</channel></rss>").encode()
+
+
+def test_pool_is_not_recreated_after_shutdown_until_reconfigured():
+    assert len(FEED) >= http_cache.MIN_POOL_PARSE_BYTES
+    configure_feed_parsing(1)
+    try:
+        assert http_cache._get_parse_pool() is not None
+        shutdown_feed_parsing()
+        # 작업이 끝난 뒤 늦게 도착한 피드는 풀을 다시 띄우지 않고 현재 프로세스에서 파싱
+        entries = parse_feed(FEED)
+        assert len(entries) == 100
+        assert http_cache._parse_pool is None
+
+        configure_feed_parsing(1)
+        assert http_cache._get_parse_pool() is not None
+    finally:
+        configure_feed_parsing(0)
+
+
+def test_pool_and_in_process_parsing_return_the_same_entries():
+    configure_feed_parsing(0)
+    expected = parse_feed(FEED)
+    assert len(expected) == 100
+    configure_feed_parsing(1)
+    try:
+        assert parse_feed(FEED) == expected
+        assert http_cache._parse_pool is not None
+    finally:
+        configure_feed_parsing(0)
@@ -0,0 +1,100 @@
+import threading
+
+import pytest
+
+from benchmarks.stubs import SmtpSink
+from core.mailer import SmtpMailer, send_digests, delivered_article_ids
+from core.pipeline import RenderedItem
+
+
+@pytest.fixture
+def sink():
+    sink = SmtpSink(refused=["nobody@example.com"]).start()
+    yield sink
+    sink.stop()
+
+
+def _mailer(sink, **kwargs):
+    return SmtpMailer("127.0.0.1", sink.port, "agent@example.com", "secret", security="none",
+                      base_delay=0.01, max_delay=0.01, timeout=5, **kwargs)
+
+
+class RecordingMailer:
+    pool_size = 2
+
+    def __init__(self, failing=()):
+        self.failing = set(failing)
+        self.sent = {}
+        self._lock = threading.Lock()
+
+    def send(self, recipient, subject, html_content):
+        with self._lock:
+            self.sent[recipient] = html_content
+        return recipient not in self.failing
+
+
+class JoinRenderer:
+    def generate_email_html_from_items(self, items_by_source):
+        return "|".join(sorted(fragment for fragments in items_by_source.values() for fragment in fragments))
+
+
+ITEMS = [
+    RenderedItem("BBC", ("AI",), "ai-story", (1,)),
+    RenderedItem("Naver", ("삼성", "IT"), "samsung-story", (2, 3)),
+    RenderedItem("Google", ("Trump",), "trump-story", (4,)),
+]
+
+SUBSCRIBERS = [
+    {"email": "all@example.com", "keywords": None},
+    {"email": "ai@example.com", "keywords": ["AI", "IT"]},
+    {"email": "museum@example.com", "keywords": ["박물관"]},
+]
+
+
+def test_connection_is_reused_across_messages(sink):
+    with _mailer(sink) as mailer:
+        assert all(mailer.send(f"user{n}@example.com", "subject", "<p>body</p>") for n in range(3))
+        assert mailer.connects == 1
+    stats = sink.stats()
+    assert stats["connections"] == 1
+    assert stats["messages"] == 3
+
+
+def test_dropped_connection_is_reconnected(sink):
+    with _mailer(sink) as mailer:
+        assert mailer.send("user@example.com", "subject", "<p>first</p>")
+        sink.drop_connections()
+        assert mailer.send("user@example.com", "subject", "<p>second</p>")
+        assert mailer.connects == 2
+    assert sink.stats()["messages"] == 2
+
+
+def test_refused_recipient_is_not_retried(sink):
+    with _mailer(sink) as mailer:
+        assert not mailer.send("nobody@example.com", "subject", "<p>body</p>")
+        # 연결은 정상이므로 다음 메시지는 같은 연결로 보냄
+        assert mailer.send("user@example.com", "subject", "<p>body</p>")
+        assert mailer.connects == 1
+    stats = sink.stats()
+    assert stats["rcpt_commands"] == 2
+    assert stats["messages"] == 1
+
+
+def test_send_digests_routes_items_by_subscribed_keywords():
+    mailer = RecordingMailer()
+    results = send_digests(mailer, SUBSCRIBERS, ITEMS, renderer=JoinRenderer())
+
+    assert results == {"all@example.com": True, "ai@example.com": True}
+    assert mailer.sent["all@example.com"] == "ai-story|samsung-story|trump-story"
+    assert mailer.sent["ai@example.com"] == "ai-story|samsung-story"
+    assert "museum@example.com" not in mailer.sent
+
+
+def test_items_sent_only_to_failed_subscribers_are_held_back():
+    subscribers = [{"email": "ai@example.com", "keywords": ["AI"]},
+                   {"email": "samsung@example.com", "keywords": ["삼성"]}]
+    mailer = RecordingMailer(failing=["samsung@example.com"])
+    results = send_digests(mailer, subscribers, ITEMS, renderer=JoinRenderer())
+
+    # 삼성 기사는 받을 구독자 모두에게 실패해 다시 보내고, 받을 구독자가 없는 기사는 기록함
+    assert delivered_article_ids(subscribers, ITEMS, results) == [1, 4]
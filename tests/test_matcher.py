@@ -0,0 +1,80 @@
+import random
+
+import pytest
+
+from core.matcher import KeywordMatcher, compile_keywords
+
+KEYWORDS = ["AI", "OpenAI", "US", "Musk", "삼성", "삼성전자", "반도체", "Trump", "ai"]
+ALIASES = {"삼성": "Samsung", "반도체": "chip", "삼성전자": "Samsung Electronics"}
+
+
+def _alias(keyword):
+    return ALIASES.get(keyword, keyword)
+
+
+def _loop_match(keywords, texts, aliases=None):
+    """변경 전 수집기처럼 키워드마다 각 필드에서 부분 문자열을 찾는 기준 구현"""
+    matched = []
+    for keyword in dict.fromkeys(keywords):
+        terms = [keyword] if aliases is None else [keyword, aliases(keyword)]
+        if any(term.strip() and term.strip().lower() in text.lower()
+               for term in terms for text in texts if text):
+            matched.append(keyword)
+    return matched
+
+
+@pytest.mark.parametrize("texts", [
+    ("Elon Musk comments on AI",),
+    ("MUSK", "openai ships a model"),
+    ("Focus on the economy",),
+    ("삼성전자, 반도체 투자 확대",),
+    ("삼성 갤럭시 출시", ""),
+    ("Samsung Electronics chip plant", None),
+    ("trumpet players",),
+    ("", "nothing relevant here"),
+])
+def test_matches_the_per_keyword_loop(texts):
+    for aliases in (None, _alias):
+        matcher = KeywordMatcher(KEYWORDS, aliases)
+        assert matcher.match(*texts) == _loop_match(KEYWORDS, texts, aliases)
+
+
+def test_substrings_inside_words_still_match():
+    # "US"는 "Musk", "focus" 안에서도 매칭됨 (변경 전 동작 유지)
+    matcher = KeywordMatcher(["US", "Musk"])
+    assert matcher.match("Elon Musk") == ["US", "Musk"]
+    assert matcher.match("focus groups") == ["US"]
+
+
+def test_case_folding_and_duplicate_keywords():
+    matcher = KeywordMatcher(["AI", "ai", "OpenAI", "AI"])
+    assert matcher.keywords == ["AI", "ai", "OpenAI"]
+    assert matcher.match("OPENAI") == ["AI", "ai", "OpenAI"]
+    assert matcher.match("Rain") == ["AI", "ai"]
+
+
+def test_korean_keywords_and_aliases():
+    matcher = KeywordMatcher(["삼성", "삼성전자", "반도체"], _alias)
+    assert matcher.match("삼성전자 실적 발표") == ["삼성", "삼성전자"]
+    assert matcher.match("Samsung expands chip output") == ["삼성", "반도체"]
+    assert matcher.match("SAMSUNG ELECTRONICS") == ["삼성", "삼성전자"]
+
+
+def test_matches_do_not_cross_field_boundaries():
+    matcher = KeywordMatcher(["AI"])
+    assert matcher.match("A", "I") == []
+    assert _loop_match(["AI"], ("A", "I")) == []
+
+
+def test_random_texts_match_the_per_keyword_loop():
+    rng = random.Random(0)
+    alphabet = "aiusmkopenrt 삼성전자반도체"
+    matcher = compile_keywords(tuple(KEYWORDS), _alias)
+    for _ in range(2000):
+        texts = tuple("".join(rng.choice(alphabet) for _ in range(rng.randint(0, 12)))
+                      for _ in range(rng.randint(1, 3)))
+        assert matcher.match(*texts) == _loop_match(KEYWORDS, texts, _alias), texts
+
+
+def test_empty_keyword_list_matches_nothing():
+    assert KeywordMatcher([]).match("AI news") == []
@@ -0,0 +1,63 @@
+from core.metrics import Metrics, render_prometheus, write_report, load_report
+
+
+def _families(text):
+    types, samples = {}, {}
+    for line in text.splitlines():
+        if line.startswith("# TYPE "):
+            _, _, name, kind = line.split(" ")
+            assert name not in types, f"{name} TYPE 중복"
+            types[name] = kind
+        elif line and not line.startswith("#"):
+            series, value = line.rsplit(" ", 1)
+            name = series.split("{", 1)[0]
+            assert name in types, f"{name} TYPE 없음"
+            samples.setdefault(name, []).append((series, float(value)))
+    return types, samples
+
+
+def test_totals_and_labeled_series_do_not_share_a_name():
+    metrics = Metrics()
+    metrics.incr("collect.errors", label="naver:AI")
+    metrics.incr("collect.errors", 2, label="google:AI")
+    metrics.record_span("collect.naver", 0.5, label="AI")
+    metrics.record_span("collect.naver", 0.25)
+    metrics.set_value("summary_cache", {"hits": 3, "hit_rate": 0.5, "enabled": True})
+    types, samples = _families(render_prometheus(metrics.snapshot(), {"runs_started": 1}))
+
+    # 한 이름 안에서 sum()하면 합계와 같아야 함
+    assert samples["newsagent_collect_errors"] == [("newsagent_collect_errors", 3)]
+    assert sum(value for _, value in samples["newsagent_collect_errors_by_label"]) == 3
+    assert samples["newsagent_collect_naver_calls"] == [("newsagent_collect_naver_calls", 2)]
+    assert sum(value for _, value in samples["newsagent_collect_naver_by_label_calls"]) == 1
+    for name, series in samples.items():
+        labeled = ["{" in key for key, _ in series]
+        assert all(labeled) or not any(labeled), name
+
+    assert types["newsagent_scheduler_runs_started"] == "counter"
+    # 보고서 값은 실행마다 초기화되므로 counter로 내보내면 재시작으로 오인됨
+    assert types["newsagent_collect_errors"] == "gauge"
+    assert types["newsagent_collect_naver_seconds"] == "gauge"
+    assert types["newsagent_collect_naver_by_label_calls"] == "gauge"
+    assert types["newsagent_summary_cache_hit_rate"] == "gauge"
+    assert "newsagent_summary_cache_enabled" not in types
+
+
+def test_snapshot_keeps_totals_and_labels_and_round_trips_through_the_report(tmp_path):
+    metrics = Metrics()
+    metrics.record_span("collect.naver", 0.5, label="AI")
+    metrics.record_span("collect.naver", 0.25)
+    metrics.incr("collect.errors", label="naver:AI")
+    metrics.incr("collect.errors", 2)
+    metrics.set_value("summary_cache", {"hits": 3})
+    report = metrics.snapshot()
+
+    naver = report["spans"]["collect.naver"]
+    assert (naver["count"], naver["total_seconds"], naver["max_seconds"]) == (2, 0.75, 0.5)
+    assert naver["by_label"] == {"AI": {"count": 1, "total_seconds": 0.5, "max_seconds": 0.5}}
+    assert report["counters"]["collect.errors"] == {"total": 3, "by_label": {"naver:AI": 1}}
+
+    path = write_report(str(tmp_path), metrics)
+    assert load_report(path)["counters"] == report["counters"]
+    assert load_report(str(tmp_path / "latest.json"))["values"] == {"summary_cache": {"hits": 3}}
+    assert load_report(str(tmp_path / "missing.json")) is None
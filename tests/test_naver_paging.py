@@ -0,0 +1,149 @@
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import requests
+
+from core import collector
+from core.watermarks import WatermarkStore
+
+NOW = datetime.now(timezone.utc).replace(microsecond=0)
+
+
+def _item(index):
+    # 최신순: index가 클수록 1분씩 오래된 기사
+    published = NOW - timedelta(minutes=index)
+    return {
+        "title": f"<b>AI</b> 뉴스 {index}",
+        "description": "AI 관련 소식",
+        "originallink": f"https://news.example.com/{index}",
+        "link": f"https://n.news.naver.com/{index}",
+        "pubDate": published.strftime("%a, %d %b %Y %H:%M:%S +0000"),
+    }
+
+
+class NaverPages:
+    """start/display에 맞춰 최신순 검색 결과 페이지를 돌려주는 가짜 네이버 API"""
+
+    def __init__(self, count, total=None, delay=0.0):
+        self.count = count
+        self.total = count if total is None else total
+        self.delay = delay
+        self.fail_starts = set()
+        self.starts = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, url, headers, keyword, start, page_size, timeout):
+        with self._lock:
+            self.starts.append(start)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self.delay)
+            if start in self.fail_starts:
+                raise requests.exceptions.ConnectionError(f"page {start} failed")
+            end = min(start - 1 + page_size, self.count)
+            return {"total": self.total, "items": [_item(index) for index in range(start - 1, end)]}
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+@pytest.fixture
+def naver(monkeypatch):
+    def install(pages):
+        monkeypatch.setattr(collector, "_fetch_naver_page", pages)
+        return pages
+
+    # 자정 직후에 실행해도 모든 기사를 오늘 기사로 보고, 오늘 0시는 충분히 과거로 둠
+    monkeypatch.setattr(collector.dates, "is_today", lambda published: True)
+    monkeypatch.setattr(collector.dates, "start_of_today", lambda: NOW - timedelta(days=2))
+    return install
+
+
+def _fetch(store=None, **kwargs):
+    options = {"max_pages": 10, "page_size": 100, "page_concurrency": 1, "max_articles": 0}
+    options.update(kwargs)
+    return collector.fetch_naver_news("AI", "id", "secret", watermarks=store, **options)
+
+
+def _indexes(articles):
+    return [int(article["url"].rsplit("/", 1)[1]) for article in articles]
+
+
+def test_stops_at_the_watermark(tmp_path, naver):
+    pages = naver(NaverPages(500))
+    store = WatermarkStore(str(tmp_path / "marks.sqlite3"))
+    marked = _item(150)
+    store.advance("naver", "AI", collector.parse_pub_date(marked["pubDate"]).timestamp(), marked["originallink"])
+    store.commit()
+
+    articles = _fetch(store)
+    assert _indexes(articles) == list(range(150))
+    assert pages.starts == [1, 101]
+    store.commit()
+    assert store.get("naver", "AI")[1] == _item(0)["originallink"]
+    store.close()
+
+
+def test_total_and_start_limits_cap_the_pages(naver):
+    pages = naver(NaverPages(250))
+    assert len(_fetch()) == 250
+    assert pages.starts == [1, 101, 201]
+
+    # total이 아무리 커도 start는 1000을 넘지 않음
+    pages = naver(NaverPages(5000))
+    assert len(_fetch(max_pages=20)) == 1000
+    assert pages.starts == list(range(1, 1001, 100))
+
+
+def test_later_pages_are_fetched_concurrently_in_order(naver):
+    pages = naver(NaverPages(600, delay=0.05))
+    articles = _fetch(page_concurrency=3)
+    assert _indexes(articles) == list(range(600))
+    assert pages.max_in_flight > 1
+    assert sorted(pages.starts) == list(range(1, 601, 100))
+
+
+def test_failed_page_keeps_earlier_articles_without_advancing(tmp_path, naver):
+    pages = naver(NaverPages(400))
+    pages.fail_starts.add(201)
+    store = WatermarkStore(str(tmp_path / "marks.sqlite3"))
+
+    first = _fetch(store)
+    assert _indexes(first) == list(range(200))
+    store.commit()
+    assert store.get("naver", "AI") is None
+
+    # 다음 작업은 이미 내보낸 기사를 건너뛰고 남은 기사를 가져온 뒤 워터마크를 올림
+    pages.fail_starts.clear()
+    second = _fetch(store)
+    assert _indexes(second) == list(range(200, 400))
+    store.commit()
+    assert store.get("naver", "AI")[1] == _item(0)["originallink"]
+    assert _fetch(store) == []
+    store.close()
+
+
+def test_article_cap_does_not_skip_unread_articles(tmp_path, naver):
+    naver(NaverPages(300))
+    store = WatermarkStore(str(tmp_path / "marks.sqlite3"))
+
+    runs = []
+    for _ in range(3):
+        runs.append(_indexes(_fetch(store, max_articles=120)))
+        store.commit()
+    assert runs == [list(range(120)), list(range(120, 240)), list(range(240, 300))]
+    assert store.get("naver", "AI")[1] == _item(0)["originallink"]
+    store.close()
+
+
+def test_page_estimate_follows_the_publish_rate():
+    # 100건이 1000초에 걸쳐 발행됐으면 경계까지 남은 3000초에 약 300건, 3페이지
+    assert collector._estimate_naver_pages(10000, 9000, 101, 6000, 100) == 3
+    assert collector._estimate_naver_pages(10000, 9000, 1, 6000, 100) == 1
+    assert collector._estimate_naver_pages(None, None, 0, 6000, 100) == 1
+    assert collector._estimate_naver_pages(10000, 9000, 101, 9500, 100) == 1
@@ -0,0 +1,47 @@
+from core.article import Article
+from core.pipeline import dedup_articles, rank_articles, render_items
+
+STORY = "Samsung unveils new foldable phone with longer battery life at Seoul launch event today"
+
+
+class TitleRenderer:
+    def generate_news_item(self, article):
+        return article["title"]
+
+
+def _article(url, title, keywords):
+    return Article(title=title, url=url, content=title, source="BBC", language="en", matched_keywords=list(keywords))
+
+
+def _fillers(count):
+    return [_article(f"https://example.com/filler/{n}", f"Unrelated story number {n} about weather and sports {n * 17}",
+                     ["AI"]) for n in range(count)]
+
+
+def _run(articles, window):
+    return render_items(rank_articles(dedup_articles(iter(articles), set()), window), TitleRenderer())
+
+
+def test_near_duplicate_before_render_is_merged_into_representative():
+    first = _article("https://a.example.com/story", STORY, ["Samsung"])
+    copy = _article("https://b.example.com/story", STORY + " report", ["IT"])
+    items = _run([first, copy] + _fillers(2), window=50)
+
+    merged = [item for item in items if item.html == STORY]
+    assert len(merged) == 1
+    assert set(merged[0].keywords) == {"Samsung", "IT"}
+    assert merged[0].ids == [first.id, copy.id]
+    assert len(items) == 3
+
+
+def test_near_duplicate_after_render_is_recorded_with_the_rendered_item():
+    first = _article("https://a.example.com/story", STORY, ["Samsung"])
+    copy = _article("https://b.example.com/story", STORY + " report", ["IT"])
+    fillers = _fillers(3)
+    items = _run([first] + fillers + [copy], window=1)
+
+    # 늦게 온 기사는 새 아이템으로 요약/발송하지 않고, 대표 아이템과 함께 발송 기록에 남김
+    assert not [item for item in items if item.html == copy.title]
+    assert [item.ids for item in items if item.html == STORY] == [[first.id, copy.id]]
+    all_ids = [article_id for item in items for article_id in item.ids]
+    assert sorted(all_ids) == sorted([first.id, copy.id] + [article.id for article in fillers])
@@ -0,0 +1,25 @@
+from datetime import date
+
+from core import dates
+from core.quota import QuotaStore
+
+
+def test_daily_quota_persists_across_runs_and_resets_the_next_day(tmp_path, monkeypatch):
+    day = {"today": date(2030, 1, 1)}
+    monkeypatch.setattr(dates, "today", lambda: day["today"])
+    path = str(tmp_path / "quota.sqlite3")
+
+    store = QuotaStore(path, flush_every=2)
+    assert all(store.consume("naver", limit=3) for _ in range(3))
+    assert not store.consume("naver", limit=3)
+    assert store.consume("bbc")  # 한도가 0이면 제한 없음
+    store.close()
+
+    reopened = QuotaStore(path)
+    assert reopened.usage() == {"naver": 3, "bbc": 1}
+    assert not reopened.consume("naver", limit=3)
+    # 기준 시간대의 다음 날에는 다시 0부터 셈
+    day["today"] = date(2030, 1, 2)
+    assert reopened.used("naver") == 0
+    assert reopened.consume("naver", limit=3)
+    reopened.close()
@@ -0,0 +1,40 @@
+import time
+
+from core.rate_limiter import CircuitBreaker
+
+COOL_DOWN = 0.05
+
+
+def _open_breaker():
+    breaker = CircuitBreaker(failure_threshold=2, cool_down=COOL_DOWN)
+    assert not breaker.record_failure()
+    assert breaker.record_failure()
+    assert not breaker.allow()
+    time.sleep(COOL_DOWN * 1.5)
+    return breaker
+
+
+def test_half_open_allows_a_single_probe_and_reopens_on_failure():
+    breaker = _open_breaker()
+    assert breaker.allow()
+    assert not breaker.allow()  # 시험 요청이 끝나기 전에는 다른 요청을 막음
+
+    assert breaker.record_failure()
+    assert not breaker.allow()
+    time.sleep(COOL_DOWN * 1.5)
+    assert breaker.allow()
+
+
+def test_successful_probe_closes_the_breaker():
+    breaker = _open_breaker()
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.allow() and breaker.allow()
+    assert not breaker.record_failure()
+
+
+def test_released_probe_can_be_taken_again():
+    breaker = _open_breaker()
+    assert breaker.allow()
+    breaker.release()
+    assert breaker.allow()
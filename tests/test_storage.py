@@ -0,0 +1,36 @@
+from datetime import date, datetime, timedelta
+from zoneinfo import ZoneInfo
+
+from core import dates
+from core.scheduler import next_slot, latest_slot
+from core.storage import SentArticleStore
+
+
+def test_sent_store_days_follow_report_timezone(tmp_path, monkeypatch):
+    day = {"today": date(2030, 1, 1)}
+    monkeypatch.setattr(dates, "today", lambda: day["today"])
+    store = SentArticleStore(str(tmp_path / "sent.sqlite3"))
+    try:
+        store.mark_sent([1, 2])
+        assert store.load_today() == {1, 2}
+        assert store.get_today_stats()["date"] == "2030-01-01"
+
+        # 기준 시간대의 다음 날에는 정확한 ID 대신 블룸 필터로 확인
+        day["today"] = date(2030, 1, 2)
+        assert store.load_today() == set()
+        store.compact(window_days=3, exact_days=1)
+        assert 1 in store.load_window(window_days=3, exact_days=1)
+
+        day["today"] = date(2030, 1, 5)
+        assert 1 not in store.load_window(window_days=3, exact_days=1)
+    finally:
+        store.close()
+
+
+def test_batch_slots_keep_the_report_timezone():
+    tz = ZoneInfo("Asia/Seoul")
+    slots = [(9, 0), (21, 0)]
+    now = datetime(2030, 1, 1, 22, 30, tzinfo=tz)
+    assert next_slot(slots, now) == datetime(2030, 1, 2, 9, 0, tzinfo=tz)
+    assert latest_slot(slots, now) == datetime(2030, 1, 1, 21, 0, tzinfo=tz)
+    assert now - latest_slot(slots, now) == timedelta(minutes=90)
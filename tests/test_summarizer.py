@@ -0,0 +1,83 @@
+import json
+
+import pytest
+from openai import OpenAI
+
+from benchmarks.stubs import NewsStubServer, _fake_summary
+from core.summarizer import PROMPT_VERSION, NewsSummarizer
+from core.summary_cache import SummaryCache
+
+TEXTS = [
+    "Apple unveils a new chip for laptops.",
+    "Samsung reports record memory sales this quarter.",
+    "Nvidia shares rise after strong AI demand.",
+]
+
+
+@pytest.fixture
+def stub():
+    stub = NewsStubServer(latency=0, openai_latency=0).start()
+    yield stub
+    stub.stop()
+
+
+def _summarizer(stub, **kwargs):
+    client = OpenAI(api_key="test", base_url=f"{stub.base_url}/openai/v1", max_retries=0)
+    return NewsSummarizer(client, max_retries=1, batch_size=8, **kwargs)
+
+
+def _is_single_summary(summary):
+    # 단건 요청은 프롬프트 전체를 요약하므로 프롬프트 첫 문장으로 시작함
+    return summary.startswith("요약: 당신은 전문 뉴스 에디터입니다")
+
+
+def test_batch_summaries_are_mapped_back_by_id(stub):
+    # 응답 키 순서와 관계없이 기사 id로 원래 위치를 찾음
+    stub.batch_response = lambda summaries: json.dumps(dict(reversed(list(summaries.items()))), ensure_ascii=False)
+    summarizer = _summarizer(stub)
+
+    assert summarizer.summarize_many(TEXTS) == [_fake_summary(text) for text in TEXTS]
+    assert stub.requests["openai"] == 1
+
+
+def test_cached_articles_are_left_out_of_the_batch(stub, tmp_path):
+    cache = SummaryCache(str(tmp_path / "summaries.sqlite3"))
+    summarizer = _summarizer(stub, cache=cache)
+    cache.set(SummaryCache.make_key(TEXTS[1], PROMPT_VERSION, summarizer.model), "캐시된 요약")
+
+    assert summarizer.summarize_many(TEXTS) == [_fake_summary(TEXTS[0]), "캐시된 요약", _fake_summary(TEXTS[2])]
+    assert stub.requests["openai"] == 1
+    # 배치로 받은 요약은 단건 요약과 같은 키로 캐시됨
+    assert summarizer.summarize_to_korean(TEXTS[2]) == _fake_summary(TEXTS[2])
+    assert stub.requests["openai"] == 1
+    cache.close()
+
+
+def test_missing_and_invalid_entries_fall_back_to_single_requests(stub):
+    def drop_entries(summaries):
+        summaries.pop("2")
+        summaries["3"] = "   "
+        summaries["4"] = "없는 기사"
+        return json.dumps(summaries, ensure_ascii=False)
+
+    stub.batch_response = drop_entries
+    results = _summarizer(stub).summarize_many(TEXTS)
+
+    assert results[0] == _fake_summary(TEXTS[0])
+    assert _is_single_summary(results[1]) and _is_single_summary(results[2])
+    assert stub.requests["openai"] == 3
+
+
+def test_garbled_batch_response_falls_back_to_single_requests(stub):
+    stub.batch_response = lambda summaries: '{"1": "요약", "2":'
+    results = _summarizer(stub).summarize_many(TEXTS)
+
+    assert all(_is_single_summary(summary) for summary in results)
+    assert stub.requests["openai"] == 1 + len(TEXTS)
+
+
+def test_non_object_batch_response_falls_back_to_single_requests(stub):
+    stub.batch_response = lambda summaries: json.dumps(list(summaries.values()), ensure_ascii=False)
+    results = _summarizer(stub).summarize_many(TEXTS)
+
+    assert all(_is_single_summary(summary) for summary in results)
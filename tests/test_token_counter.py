@@ -0,0 +1,42 @@
+import pytest
+
+from core import token_counter
+from core.token_counter import count_tokens, truncate_to_tokens
+
+
+@pytest.fixture(autouse=True)
+def no_tokenizer(monkeypatch):
+    # tiktoken이 없을 때의 글자 수 기반 추정치로 계산
+    monkeypatch.setattr(token_counter, "_get_encoding", lambda model: None)
+
+
+def test_estimate_counts_ascii_and_korean_separately():
+    assert count_tokens("", "gpt-4o") == 0
+    assert count_tokens("a" * 40, "gpt-4o") == 11
+    assert count_tokens("가나다", "gpt-4o") == 4
+
+
+def test_text_within_the_budget_is_kept_whole():
+    text = "First sentence. Second sentence."
+    assert truncate_to_tokens(text, 100, "gpt-4o") == text
+
+
+def test_cut_keeps_whole_sentences_within_the_budget():
+    sentences = ["Sentence number %d is here." % index for index in range(10)]
+    text = " ".join(sentences)
+    truncated = truncate_to_tokens(text, 20, "gpt-4o")
+
+    assert count_tokens(truncated, "gpt-4o") <= 20
+    kept = truncated.split(". ")
+    assert truncated == " ".join(sentences[:len(kept)])
+    assert 0 < len(kept) < len(sentences)
+
+
+@pytest.mark.parametrize("text", ["a" * 400, "가" * 400, "ab가" * 100])
+def test_fallback_cut_fits_the_same_estimate_as_count_tokens(text):
+    for max_tokens in (1, 5, 37, 100):
+        truncated = truncate_to_tokens(text, max_tokens, "gpt-4o")
+        body = truncated[:-len("...")]
+        assert count_tokens(body, "gpt-4o") <= max_tokens
+        # 한 글자만 더 넣어도 예산을 넘는 가장 긴 앞부분
+        assert count_tokens(text[:len(body) + 1], "gpt-4o") > max_tokens
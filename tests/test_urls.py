@@ -0,0 +1,92 @@
+import base64
+
+import pytest
+
+from core.urls import canonicalize_url, article_id_for_url
+
+ARTICLE = "https://example.com/news/ai-chip"
+
+
+def _google_news_id(url):
+    # 예전 형식의 구글 뉴스 ID: 원문 URL 필드를 담은 protobuf 메시지를 패딩 없이 base64로 인코딩
+    encoded = url.encode()
+    message = b'\x08\x13\x22' + bytes([len(encoded)]) + encoded + b'\xd2\x01\x00'
+    return base64.urlsafe_b64encode(message).decode().rstrip("=")
+
+
+@pytest.mark.parametrize("url", [
+    ARTICLE,
+    "https://example.com/news/ai-chip?utm_source=rss&utm_medium=feed",
+    "https://example.com/news/ai-chip?fbclid=abc&at_campaign=x",
+    "http://www.Example.com/news/ai-chip",
+    "https://example.com:443/news/ai-chip",
+    "https://example.com/news/ai-chip/",
+    "https://example.com/news/ai-chip#comments",
+    "  https://example.com/news/ai-chip?UTM_Content=top  ",
+])
+def test_variants_of_the_same_article_share_one_url(url):
+    assert canonicalize_url(url) == ARTICLE
+
+
+def test_non_tracking_query_is_kept_in_sorted_order():
+    assert (canonicalize_url("https://example.com/view?id=7&utm_source=x&page=2")
+            == "https://example.com/view?id=7&page=2")
+    assert (canonicalize_url("https://example.com/view?page=2&id=7")
+            == canonicalize_url("https://example.com/view?id=7&page=2"))
+
+
+def test_root_path_and_non_default_port():
+    assert canonicalize_url("https://example.com") == "https://example.com/"
+    assert canonicalize_url("https://example.com/") == "https://example.com/"
+    assert canonicalize_url("https://example.com:8443/a/") == "https://example.com:8443/a"
+
+
+@pytest.mark.parametrize("url", [
+    "https://n.news.naver.com/mnews/article/001/0014567890?sid=105",
+    "https://n.news.naver.com/article/001/0014567890",
+    "https://m.news.naver.com/article/001/0014567890#comment",
+    "https://news.naver.com/main/read.naver?mode=LSD&mid=sec&oid=001&aid=0014567890",
+    "http://news.naver.com/main/read.nhn?oid=001&aid=0014567890&sid1=105",
+])
+def test_naver_article_links_keep_only_oid_and_aid(url):
+    assert canonicalize_url(url) == "https://n.news.naver.com/mnews/article/001/0014567890"
+
+
+def test_naver_pages_without_an_article_id_are_left_alone():
+    assert (canonicalize_url("https://news.naver.com/section/105?utm_source=x")
+            == "https://news.naver.com/section/105")
+
+
+def test_google_news_link_is_unwrapped_to_the_original_article():
+    article_id = _google_news_id("https://www.example.com/news/ai-chip?utm_source=google")
+    assert canonicalize_url(f"https://news.google.com/rss/articles/{article_id}?oc=5") == ARTICLE
+    assert canonicalize_url(f"https://news.google.com/articles/{article_id}") == ARTICLE
+
+
+def test_new_style_google_news_link_only_loses_its_tracking_params():
+    url = "https://news.google.com/rss/articles/AU_yqLOpaqueIdWithoutUrl?oc=5&hl=en-US&gl=US&ceid=US:en"
+    assert canonicalize_url(url) == "https://news.google.com/rss/articles/AU_yqLOpaqueIdWithoutUrl"
+
+
+def test_google_redirect_is_unwrapped():
+    assert canonicalize_url("https://www.google.com/url?sa=t&url=https%3A%2F%2Fexample.com%2Fnews%2Fai-chip%2F") == ARTICLE
+    assert canonicalize_url("https://google.com/url?q=http://example.com/news/ai-chip&ved=1") == ARTICLE
+    # 원문 URL이 http(s)가 아니면 풀지 않음
+    assert canonicalize_url("https://google.com/url?q=javascript:alert(1)") == "https://google.com/url?q=javascript%3Aalert%281%29"
+
+
+def test_nested_wrappers_are_unwrapped():
+    article_id = _google_news_id(ARTICLE)
+    redirect = f"https://www.google.com/url?url=https://news.google.com/rss/articles/{article_id}"
+    assert canonicalize_url(redirect) == ARTICLE
+
+
+def test_non_http_urls_are_returned_as_is():
+    assert canonicalize_url("mailto:news@example.com") == "mailto:news@example.com"
+
+
+def test_article_id_is_stable_across_url_variants():
+    article_id = article_id_for_url(ARTICLE)
+    assert article_id_for_url("http://www.example.com/news/ai-chip/?utm_source=rss#top") == article_id
+    assert article_id_for_url("https://example.com/news/other") != article_id
+    assert -2 ** 63 <= article_id < 2 ** 63
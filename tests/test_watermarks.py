@@ -0,0 +1,64 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from core import collector
+from core.watermarks import WatermarkStore
+
+
+def _entry(index, minutes_ago):
+    published = datetime.now(timezone.utc) - timedelta(minutes=minutes_ago)
+    return {
+        "id": f"entry-{index}",
+        "title": f"AI 뉴스 {index}",
+        "link": f"https://news.example.com/{index}",
+        "summary": "AI 관련 소식",
+        "description": "",
+        "published": published.strftime("%a, %d %b %Y %H:%M:%S GMT"),
+        "published_parsed": list(published.timetuple()[:6]),
+    }
+
+
+@pytest.fixture
+def feed(monkeypatch):
+    entries = []
+    monkeypatch.setattr(collector, "fetch_feed_entries", lambda url, timeout, feed_cache: list(entries))
+    # 자정 직후에 실행해도 모든 엔트리를 오늘 기사로 봄
+    monkeypatch.setattr(collector.dates, "is_today", lambda published: True)
+    collector.get_source_guard("google").reset()
+    return entries
+
+
+def test_google_entries_beyond_cap_and_late_entries_are_delivered_next_run(tmp_path, feed):
+    # 관련도순이라 발행 시각이 뒤섞여 있음
+    feed.extend(_entry(index, minutes_ago=(index * 7) % 60) for index in range(15))
+    store = WatermarkStore(str(tmp_path / "marks.sqlite3"))
+
+    first = collector.fetch_google_rss("AI", watermarks=store)
+    store.commit()
+    assert len(first) == 10
+
+    # 앞서 발행됐지만 이제야 색인된 기사
+    feed.insert(0, _entry(99, minutes_ago=60))
+    second = collector.fetch_google_rss("AI", watermarks=store)
+    store.commit()
+
+    delivered = {article["url"] for article in first + second}
+    assert len(second) == 6
+    assert delivered == {entry["link"] for entry in feed}
+
+    assert collector.fetch_google_rss("AI", watermarks=store) == []
+    store.close()
+
+
+def test_seen_entries_are_not_recorded_until_commit(tmp_path, feed):
+    feed.extend(_entry(index, minutes_ago=index) for index in range(3))
+    store = WatermarkStore(str(tmp_path / "marks.sqlite3"))
+    assert len(collector.fetch_google_rss("AI", watermarks=store)) == 3
+    # 발송에 실패해 commit하지 않으면 다음 작업에서 다시 가져옴
+    assert len(collector.fetch_google_rss("AI", watermarks=store)) == 3
+    store.close()
+
+    reopened = WatermarkStore(str(tmp_path / "marks.sqlite3"))
+    assert len(collector.fetch_google_rss("AI", watermarks=reopened)) == 3
+    reopened.close()